@@ -0,0 +1,87 @@
+import argparse
+import pathlib
+import sys
+import typing
+
+
+def _distance_units(value: str) -> str:
+    from ..physics.characterize import _distance_scale
+
+    try:
+        _distance_scale(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
+
+
+class PyFrcCharacterize:
+    """
+    Computes TankModel kv/ka/vintercept from recorded drivetrain voltage
+    and velocity logs (CSV or .wpilog)
+    """
+
+    def __init__(self, parser: argparse.ArgumentParser):
+        from ..physics.characterize import DEFAULT_COLUMNS
+
+        parser.add_argument("log", type=pathlib.Path, help="CSV or .wpilog file")
+
+        for key, name in DEFAULT_COLUMNS.items():
+            parser.add_argument(
+                f"--{key.replace('_', '-')}",
+                dest=f"col_{key}",
+                default=name,
+                help=f"Column/entry name for {key.replace('_', ' ')} (default: %(default)s)",
+            )
+
+        parser.add_argument(
+            "--distance-units",
+            default="foot",
+            type=_distance_units,
+            help="Distance units of the recorded velocities (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--min-velocity",
+            default=0.1,
+            type=float,
+            help="Ignore samples slower than this, in ft/s (default: %(default)s)",
+        )
+
+    def run(self, options: argparse.Namespace, log: pathlib.Path):
+        from ..physics.characterize import DEFAULT_COLUMNS, characterize
+
+        if not log.exists():
+            print(f"ERROR: {log} does not exist", file=sys.stderr)
+            return 1
+
+        columns = {key: getattr(options, f"col_{key}") for key in DEFAULT_COLUMNS}
+
+        try:
+            left, right = characterize(
+                log,
+                columns,
+                distance_units=options.distance_units,
+                min_velocity=options.min_velocity,
+            )
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+
+        for name, result in (("Left", left), ("Right", right)):
+            print(
+                f"{name}: kv={result.kv:.4f} ka={result.ka:.4f} "
+                f"vintercept={result.vintercept:.4f} "
+                f"(r^2={result.r_squared:.4f}, {result.samples} samples)"
+            )
+
+        print()
+        print("tankmodel.TankModel(")
+        print("    motor_config,")
+        print("    robot_mass,")
+        print("    x_wheelbase,")
+        print("    robot_width,")
+        print("    robot_length,")
+        for prefix, result in (("l", left), ("r", right)):
+            print(f"    {result.kv:.4f} * units.tm_kv,  # {prefix}_kv")
+            print(f"    {result.ka:.4f} * units.tm_ka,  # {prefix}_ka")
+            print(f"    {result.vintercept:.4f} * units.volts,  # {prefix}_vi")
+        print(")")
@@ -0,0 +1,101 @@
+import argparse
+import pathlib
+import sys
+import traceback
+import typing
+
+import wpilib.simulation
+
+
+def _pwm_value(value: str) -> typing.Tuple[int, float]:
+    try:
+        channel, speed = value.split("=", 1)
+        return int(channel), float(speed)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected CHANNEL=SPEED, got {value!r}")
+
+
+class PyFrcPhysicsBench:
+    """
+    Benchmarks your physics.py by calling update_sim in a tight loop,
+    without running any robot code
+    """
+
+    def __init__(self, parser: argparse.ArgumentParser):
+        parser.add_argument(
+            "--steps",
+            default=10000,
+            type=int,
+            help="Number of measured update_sim calls",
+        )
+        parser.add_argument(
+            "--timestep",
+            default=0.020,
+            type=float,
+            help="tm_diff passed to update_sim",
+        )
+        parser.add_argument(
+            "--warmup",
+            default=100,
+            type=int,
+            help="Number of unmeasured update_sim calls to make first",
+        )
+        parser.add_argument(
+            "--pwm",
+            default=[],
+            action="append",
+            type=_pwm_value,
+            metavar="CHANNEL=SPEED",
+            help="Set a PWM output to a constant speed (may be specified multiple times)",
+        )
+
+    def run(
+        self,
+        project_path: pathlib.Path,
+        steps: int,
+        timestep: float,
+        warmup: int,
+        pwm: typing.List[typing.Tuple[int, float]],
+    ):
+        from ..physics.bench import PhysicsBench
+        from ..physics.core import PhysicsInterface, _load_physics_module
+
+        physics_module_path = project_path / "physics.py"
+        if not physics_module_path.exists():
+            print(f"ERROR: {physics_module_path} does not exist", file=sys.stderr)
+            return 1
+
+        physics_module = _load_physics_module(physics_module_path)
+        if not hasattr(physics_module, "PhysicsEngine"):
+            print(
+                "ERROR: physics module does not have a PhysicsEngine object",
+                file=sys.stderr,
+            )
+            return 1
+
+        for channel, speed in pwm:
+            sim = wpilib.simulation.PWMSim(channel)
+            sim.setInitialized(True)
+            sim.setSpeed(speed)
+
+        # no robot code is run, so an engine that takes a robot gets None
+        takes_robot = PhysicsInterface._engine_takes_robot(physics_module.PhysicsEngine)
+
+        try:
+            bench = PhysicsBench(physics_module.PhysicsEngine)
+            result = bench.run(steps, timestep=timestep, warmup=warmup)
+        except Exception:
+            if not takes_robot:
+                raise
+            traceback.print_exc()
+            print(
+                "ERROR: physics-bench does not run robot code, so the robot "
+                "passed to PhysicsEngine is None. To benchmark an engine that "
+                "uses its robot, use pyfrc.physics.bench.PhysicsBench with a "
+                "stand-in robot object.",
+                file=sys.stderr,
+            )
+            return 1
+
+        result.print_report()
+        return 0
@@ -33,6 +33,47 @@ class PyFrcSim:
             action="store_true",
             help="Don't use the WPIlib simulation gui",
         )
+        parser.add_argument(
+            "--physics-reload",
+            default=False,
+            action="store_true",
+            help="Reload physics.py when it changes without restarting the robot",
+        )
+        parser.add_argument(
+            "--monitor",
+            nargs="?",
+            default=None,
+            const=pathlib.Path("loop_monitor.json"),
+            type=pathlib.Path,
+            metavar="SUMMARY",
+            help="Measure robot loop and physics timing, and write a summary file at exit (default: %(const)s)",
+        )
+
+        speed_group = parser.add_mutually_exclusive_group()
+        speed_group.add_argument(
+            "--speed",
+            default=None,
+            type=float,
+            help="Run the simulation at N times real time (requires --nogui)",
+        )
+        speed_group.add_argument(
+            "--max-speed",
+            default=False,
+            action="store_true",
+            help="Run the simulation as fast as possible (requires --nogui)",
+        )
+        parser.add_argument(
+            "--duration",
+            default=None,
+            type=float,
+            help="Exit after this many simulated seconds (with --speed/--max-speed)",
+        )
+        parser.add_argument(
+            "--ds-schedule",
+            default=None,
+            type=pathlib.Path,
+            help="TOML file of driver station modes to step through (with --speed/--max-speed)",
+        )
 
         self.simexts = {}
 
@@ -60,9 +101,30 @@ class PyFrcSim:
         self,
         options: argparse.Namespace,
         nogui: bool,
+        physics_reload: bool,
+        speed: typing.Optional[float],
+        max_speed: bool,
+        duration: typing.Optional[float],
+        ds_schedule: typing.Optional[pathlib.Path],
+        monitor: typing.Optional[pathlib.Path],
         project_path: pathlib.Path,
         robot_class: typing.Type[wpilib.RobotBase],
     ):
+        accelerated = speed is not None or max_speed
+        if accelerated:
+            if not nogui:
+                print("--speed/--max-speed require --nogui", file=sys.stderr)
+                return False
+            if speed is not None and speed <= 0:
+                print("--speed must be greater than zero", file=sys.stderr)
+                return False
+        elif duration is not None or ds_schedule is not None:
+            print(
+                "--duration/--ds-schedule require --speed or --max-speed",
+                file=sys.stderr,
+            )
+            return False
+
         if not nogui:
             try:
                 import halsim_gui
@@ -89,12 +151,57 @@ class PyFrcSim:
         from ..physics.core import PhysicsInterface, PhysicsInitException
 
         try:
-            _, robot_class = PhysicsInterface._create_and_attach(
-                robot_class, project_path
+            physics, robot_class = PhysicsInterface._create_and_attach(
+                robot_class,
+                project_path,
+                reload_period=0.5 if physics_reload else None,
             )
 
-            # run the robot
-            return robot_class.main(robot_class)
+            if monitor is not None:
+                from ..sim.monitor import LoopMonitor
+
+                loop_monitor = LoopMonitor(physics)
+                robot_class = loop_monitor.attach(robot_class)
+
+                try:
+                    return self._run_robot(
+                        robot_class, accelerated, speed, duration, ds_schedule
+                    )
+                finally:
+                    loop_monitor.write_summary(monitor)
+
+            return self._run_robot(
+                robot_class, accelerated, speed, duration, ds_schedule
+            )
 
         except PhysicsInitException:
             return False
+
+    def _run_robot(
+        self,
+        robot_class: typing.Type[wpilib.RobotBase],
+        accelerated: bool,
+        speed: typing.Optional[float],
+        duration: typing.Optional[float],
+        ds_schedule: typing.Optional[pathlib.Path],
+    ):
+        if accelerated:
+            from ..sim.accelerated import AcceleratedSim, load_ds_schedule
+
+            try:
+                sim = AcceleratedSim(
+                    speed=speed,
+                    schedule=load_ds_schedule(ds_schedule) if ds_schedule else None,
+                    duration=duration,
+                )
+            except RuntimeError as e:
+                print(f"ERROR: {e}", file=sys.stderr)
+                return False
+
+            try:
+                return sim.run(robot_class)
+            finally:
+                sim.print_stats()
+
+        # run the robot
+        return robot_class.main(robot_class)
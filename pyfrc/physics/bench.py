@@ -0,0 +1,133 @@
+"""
+Runs a :class:`.PhysicsEngine` in a tight loop without any robot code, so
+that you can measure and optimize the performance of your physics model.
+This is what ``robotpy physics-bench`` uses, but you can also use it
+directly::
+
+    from pyfrc.physics.bench import PhysicsBench
+    import wpilib.simulation
+
+    from physics import PhysicsEngine
+
+    l_motor = wpilib.simulation.PWMSim(1)
+
+    def inputs(now):
+        l_motor.setSpeed(1.0 if now < 5 else 0.0)
+
+    bench = PhysicsBench(PhysicsEngine)
+    result = bench.run(10000, timestep=0.020, inputs=inputs)
+    result.print_report()
+
+The engine is constructed with a real :class:`.PhysicsInterface` that has
+a field but isn't attached to a robot. If your engine takes a robot
+argument, it will receive whatever is passed as ``robot`` (``None`` by
+default), so engines that look up motors via the robot object will need
+a stand-in object that provides them.
+"""
+
+import dataclasses
+import time
+import typing
+
+import wpilib
+
+from .core import PhysicsInterface
+
+
+@dataclasses.dataclass
+class PhysicsBenchResult:
+    """Results of :meth:`PhysicsBench.run`"""
+
+    #: Number of times ``update_sim`` was called
+    steps: int
+
+    #: Total wall clock seconds spent in the loop (including inputs)
+    elapsed: float
+
+    #: Sorted wall clock seconds spent in each call to ``update_sim``
+    latencies: typing.List[float]
+
+    @property
+    def steps_per_second(self) -> float:
+        return self.steps / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def percentile(self, pct: float) -> float:
+        """Returns the given percentile (0-100) of ``update_sim`` latency"""
+        latencies = self.latencies
+        idx = min(len(latencies) - 1, int(len(latencies) * pct / 100.0))
+        return latencies[idx]
+
+    def print_report(self):
+        latencies = self.latencies
+        mean = sum(latencies) / len(latencies)
+        print(
+            f"{self.steps} steps in {self.elapsed:.3f}s "
+            f"({self.steps_per_second:.0f} steps/s)"
+        )
+        print(
+            f"- update_sim latency: mean={mean * 1e6:.1f}us "
+            f"p50={self.percentile(50) * 1e6:.1f}us "
+            f"p90={self.percentile(90) * 1e6:.1f}us "
+            f"p99={self.percentile(99) * 1e6:.1f}us "
+            f"max={latencies[-1] * 1e6:.1f}us"
+        )
+
+
+class PhysicsBench:
+    """
+    Constructs a user ``PhysicsEngine`` against a physics interface that
+    is not attached to a robot
+    """
+
+    def __init__(self, engine_class: typing.Type, robot: typing.Any = None):
+        """
+        :param engine_class: Your ``PhysicsEngine`` class
+        :param robot:        Passed to the engine if it takes a robot argument
+        """
+        self.interface = PhysicsInterface(None)
+        self.interface.field = wpilib.Field2d()
+        self.engine = self.interface._create_engine(engine_class, robot)
+
+    def run(
+        self,
+        steps: int,
+        timestep: float = 0.020,
+        inputs: typing.Optional[typing.Callable[[float], None]] = None,
+        warmup: int = 100,
+    ) -> PhysicsBenchResult:
+        """
+        Calls ``update_sim`` ``steps`` times at a fixed timestep.
+
+        :param steps:    Number of measured calls to ``update_sim``
+        :param timestep: Value of ``tm_diff`` passed to ``update_sim``
+        :param inputs:   Called with the current simulated time before each
+                         step, use this to set motor outputs
+        :param warmup:   Number of unmeasured calls to make first
+        """
+        assert steps > 0
+        assert timestep > 0
+
+        update_sim = self.engine.update_sim
+        perf_counter = time.perf_counter
+
+        now = 0.0
+        for i in range(warmup):
+            now += timestep
+            if inputs is not None:
+                inputs(now)
+            update_sim(now, timestep)
+
+        latencies = [0.0] * steps
+
+        start = perf_counter()
+        for i in range(steps):
+            now += timestep
+            if inputs is not None:
+                inputs(now)
+            t = perf_counter()
+            update_sim(now, timestep)
+            latencies[i] = perf_counter() - t
+        elapsed = perf_counter() - start
+
+        latencies.sort()
+        return PhysicsBenchResult(steps, elapsed, latencies)
@@ -0,0 +1,233 @@
+"""
+.. versionadded:: 2026.1.0
+
+Copies values from physics models to simulated sensors. Instead of calling
+a setter for every sensor in ``update_sim``, describe once which model
+value feeds which sensor, and call :meth:`SensorBindings.sync` after the
+models have been updated::
+
+    import wpilib.simulation
+    from pyfrc.physics.bindings import SensorBindings
+    from pyfrc.physics.units import units
+
+    class PhysicsEngine:
+
+        def __init__(self, physics_controller, robot):
+            self.drivetrain = tankmodel.TankModel.theory(...)
+
+            self.bindings = SensorBindings()
+            self.bindings.bind_encoder(
+                wpilib.simulation.EncoderSim(robot.l_encoder),
+                self.drivetrain,
+                position="l_position",
+                rate="l_velocity",
+                source_units=units.foot,
+                sensor_units=units.meter,
+            )
+            self.bindings.bind_sim_value(
+                "Gyro:ADXRS450[0]",
+                "angle",
+                self.physics_controller,
+                lambda pc: pc.get_pose().rotation().degrees(),
+                scale=-1,
+            )
+
+        def update_sim(self, now, tm_diff):
+            ...
+            transform = self.drivetrain.calculate(l_motor, r_motor, tm_diff)
+            self.physics_controller.move_robot(transform)
+            self.bindings.sync()
+
+Unit conversion factors are computed when a value is bound, and the
+simulated devices are looked up once, so each :meth:`SensorBindings.sync`
+only reads each value, scales it, and calls the setter if the value
+changed since the last sync.
+"""
+
+import operator
+import typing
+
+import wpilib.simulation
+
+from .units import units
+
+#: The value to read: the name of an attribute of the source object, or a
+#: function that is called with the source object
+Field = typing.Union[str, typing.Callable[[typing.Any], float]]
+
+
+def _conversion(source_units, sensor_units) -> float:
+    if source_units is None and sensor_units is None:
+        return 1.0
+    if source_units is None or sensor_units is None:
+        raise ValueError("source_units and sensor_units must be specified together")
+    return (1 * source_units).m_as(sensor_units)
+
+
+class SensorBindings:
+    """
+    A list of (model value, sensor setter) pairs that are updated together
+    """
+
+    def __init__(self):
+        # each binding is [source, getter, setter, scale, offset, integer, last]
+        self._bindings: typing.List[list] = []
+
+        # sim values that didn't exist yet when they were bound
+        self._unresolved: typing.List[typing.Tuple[list, str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._bindings)
+
+    def bind(
+        self,
+        source: typing.Any,
+        field: Field,
+        setter: typing.Callable[[float], None],
+        scale: float = 1.0,
+        offset: float = 0.0,
+        integer: bool = False,
+        source_units: typing.Optional[units.Unit] = None,
+        sensor_units: typing.Optional[units.Unit] = None,
+    ):
+        """
+        Binds a value to a setter. The value written is
+        ``value * conversion * scale + offset``.
+
+        :param source:       Object that the value is read from
+        :param field:        Attribute name (or function) of ``source``
+        :param setter:       Called with the converted value
+        :param scale:        Multiplied with the value, such as encoder
+                             ticks per unit
+        :param offset:       Added to the scaled value
+        :param integer:      Truncate the value to an int (for counts)
+        :param source_units: Units of the value in ``source``
+        :param sensor_units: Units that the setter expects
+        """
+        self._add(
+            source,
+            field,
+            setter,
+            _conversion(source_units, sensor_units) * scale,
+            offset,
+            integer,
+        )
+
+    def _add(self, source, field, setter, scale, offset, integer) -> list:
+        getter = operator.attrgetter(field) if isinstance(field, str) else field
+        binding = [source, getter, setter, scale, offset, integer, None]
+        self._bindings.append(binding)
+        return binding
+
+    def bind_encoder(
+        self,
+        encoder: wpilib.simulation.EncoderSim,
+        source: typing.Any,
+        position: typing.Optional[Field] = None,
+        rate: typing.Optional[Field] = None,
+        source_units: typing.Optional[units.Unit] = None,
+        sensor_units: typing.Optional[units.Unit] = None,
+        ticks_per_unit: typing.Optional[float] = None,
+    ):
+        """
+        Binds position and/or velocity values to a simulated encoder.
+
+        :param encoder:        Simulated encoder
+        :param source:         Object that the values are read from
+        :param position:       Position value, written with ``setDistance``
+        :param rate:           Velocity value, written with ``setRate``
+                               (per second)
+        :param source_units:   Length units of the values in ``source``
+        :param sensor_units:   Units of the encoder distance (the units of
+                               its distance per pulse)
+        :param ticks_per_unit: If set, the position is written with
+                               ``setCount`` instead of ``setDistance``,
+                               using this many ticks per unit of the
+                               position. This can't be combined with
+                               ``rate`` or the units, which are in terms of
+                               the encoder distance.
+        """
+        if ticks_per_unit is not None:
+            if position is None or rate is not None:
+                raise ValueError("ticks_per_unit can only be used with position")
+            if source_units is not None or sensor_units is not None:
+                raise ValueError("ticks_per_unit can't be used with units")
+            self._add(source, position, encoder.setCount, ticks_per_unit, 0.0, True)
+            return
+
+        conversion = _conversion(source_units, sensor_units)
+        if position is not None:
+            self._add(source, position, encoder.setDistance, conversion, 0.0, False)
+        if rate is not None:
+            self._add(source, rate, encoder.setRate, conversion, 0.0, False)
+
+    def bind_sim_value(
+        self,
+        device: str,
+        value: str,
+        source: typing.Any,
+        field: Field,
+        scale: float = 1.0,
+        offset: float = 0.0,
+        source_units: typing.Optional[units.Unit] = None,
+        sensor_units: typing.Optional[units.Unit] = None,
+    ):
+        """
+        Binds a value to a double value of a ``SimDevice``, such as those
+        created by vendor libraries and gyros. The device is looked up
+        once; if it doesn't exist yet, it is looked up again at each
+        :meth:`sync` until it is created.
+
+        :param device: Name of the SimDevice
+        :param value:  Name of the value in the device
+        """
+        binding = self._add(
+            source,
+            field,
+            None,
+            _conversion(source_units, sensor_units) * scale,
+            offset,
+            False,
+        )
+        if not self._resolve(binding, device, value):
+            self._unresolved.append((binding, device, value))
+
+    def _resolve(self, binding: list, device: str, value: str) -> bool:
+        sim_value = wpilib.simulation.SimDeviceSim(device).getDouble(value)
+        if not sim_value:
+            binding[2] = None
+            return False
+        binding[2] = sim_value.set
+        return True
+
+    def sync(self) -> int:
+        """
+        Writes each bound value that has changed since the last call
+
+        :returns: the number of values written
+        """
+        if self._unresolved:
+            self._unresolved = [
+                item for item in self._unresolved if not self._resolve(*item)
+            ]
+
+        written = 0
+        for binding in self._bindings:
+            source, getter, setter, scale, offset, integer, last = binding
+            if setter is None:
+                continue
+
+            value = getter(source) * scale + offset
+            if integer:
+                value = int(value)
+            if value != last:
+                binding[6] = value
+                setter(value)
+                written += 1
+
+        return written
+
+    def invalidate(self):
+        """Makes the next :meth:`sync` write every value, even if unchanged"""
+        for binding in self._bindings:
+            binding[6] = None
@@ -0,0 +1,240 @@
+"""
+.. versionadded:: 2026.1.0
+
+A pinhole camera model that computes where the corners of AprilTags appear
+in the camera image, for robot code that processes tag corners instead of
+the target angles returned by :class:`.VisionSim`.
+
+The corners of all tags are stored in a single array when the tags are
+loaded, and each call to :meth:`CameraModel.project` projects all of them
+with one matrix multiply::
+
+    from pyfrc.physics.cameramodel import CameraModel
+    from wpimath.geometry import Rotation3d, Transform3d, Translation3d
+
+    class PhysicsEngine:
+
+        def __init__(self, physics_controller):
+            self.physics_controller = physics_controller
+            self.camera = CameraModel.from_fov(
+                960,
+                720,
+                70,
+                Transform3d(Translation3d(0.3, 0, 0.5), Rotation3d(0, -0.3, 0)),
+                noise_stddev=0.5,
+                seed=1234,
+            )
+            self.camera.load_apriltag_layout("layout.json")
+
+        def update_sim(self, now, tm_diff):
+            detections = self.camera.project(self.physics_controller.get_pose())
+            for tag_id, corners in zip(detections.ids, detections.corners):
+                ...
+
+Field positions are in meters. Pixel coordinates have their origin at the
+top left corner of the image, with x increasing to the right and y
+increasing downwards.
+"""
+
+import dataclasses
+import math
+import typing
+
+import numpy as np
+from wpimath.geometry import Pose2d, Pose3d, Transform3d
+
+from .visionsim import _layout_tags
+
+#: Size of the black square of an FRC AprilTag (6.5in) in meters
+DEFAULT_TAG_SIZE = 0.1651
+
+
+@dataclasses.dataclass
+class TagDetections:
+    """Tags seen by a :class:`CameraModel`"""
+
+    #: ID of each visible tag
+    ids: np.ndarray
+
+    #: Pixel coordinates of each tag's corners, with shape ``(N, 4, 2)``.
+    #: Corners are ordered bottom left, bottom right, top right, top left
+    #: as seen by the camera.
+    corners: np.ndarray
+
+    #: Distance from the camera to the center of each tag (meters)
+    distances: np.ndarray
+
+
+class CameraModel:
+    """
+    A pinhole camera (without lens distortion) mounted on the robot
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        fx: float,
+        fy: float,
+        cx: float,
+        cy: float,
+        robot_to_camera: Transform3d,
+        noise_stddev: float = 0.0,
+        seed: typing.Optional[int] = None,
+        min_distance: float = 0.1,
+    ):
+        """
+        :param width:           Image width (pixels)
+        :param height:          Image height (pixels)
+        :param fx:              Horizontal focal length (pixels)
+        :param fy:              Vertical focal length (pixels)
+        :param cx:              Horizontal principal point (pixels)
+        :param cy:              Vertical principal point (pixels)
+        :param robot_to_camera: Location of the camera relative to the
+                                center of the robot on the floor. The camera
+                                looks along its x axis.
+        :param noise_stddev:    Standard deviation of the gaussian noise
+                                added to each corner (pixels)
+        :param seed:            Seed for the noise, for reproducible results
+        :param min_distance:    Tags whose center is closer than this to the
+                                camera (meters) are not seen
+        """
+        self.width = width
+        self.height = height
+        self.robot_to_camera = robot_to_camera
+        self.noise_stddev = noise_stddev
+        self.min_distance = min_distance
+
+        #: Camera intrinsics matrix
+        self.K = np.array([[fx, 0.0, cx], [0.0, fy, cy], [0.0, 0.0, 1.0]])
+
+        # intrinsics combined with the conversion from WPILib camera axes
+        # (x forward, y left, z up) to image axes (x right, y down, z forward)
+        axes = np.array([[0.0, -1.0, 0.0], [0.0, 0.0, -1.0], [1.0, 0.0, 0.0]])
+        self._k_axes = self.K @ axes
+
+        self._rng = np.random.default_rng(seed)
+        self.set_tags([])
+
+    @classmethod
+    def from_fov(
+        cls,
+        width: int,
+        height: int,
+        diagonal_fov: float,
+        robot_to_camera: Transform3d,
+        **kwargs,
+    ) -> "CameraModel":
+        """
+        Creates a camera with square pixels and the principal point at the
+        center of the image.
+
+        :param diagonal_fov: Diagonal field of view (degrees)
+        :param kwargs:       Other arguments for the constructor
+        """
+        diagonal = math.hypot(width, height)
+        f = (diagonal / 2.0) / math.tan(math.radians(diagonal_fov) / 2.0)
+        return cls(
+            width,
+            height,
+            f,
+            f,
+            (width - 1) / 2.0,
+            (height - 1) / 2.0,
+            robot_to_camera,
+            **kwargs,
+        )
+
+    def set_tags(
+        self,
+        tags: typing.Sequence[typing.Tuple[int, Pose3d]],
+        tag_size: float = DEFAULT_TAG_SIZE,
+    ):
+        """
+        Sets the tags that the camera can see. Tags face along the x axis
+        of their pose.
+
+        :param tags:     (id, pose) of each tag
+        :param tag_size: Length of each side of the tags (meters)
+        """
+        s = tag_size / 2.0
+
+        # corners in the tag frame, as seen when looking at the tag
+        local = np.array([[0.0, -s, -s], [0.0, s, -s], [0.0, s, s], [0.0, -s, s]])
+
+        n = len(tags)
+        self.ids = np.array([tag_id for tag_id, _ in tags], dtype=int)
+        self._centers = np.zeros((n, 3))
+        self._normals = np.zeros((n, 3))
+        corners = np.zeros((n, 4, 3))
+
+        for i, (_, pose) in enumerate(tags):
+            rot = pose.rotation().toMatrix()
+            center = np.array((pose.X(), pose.Y(), pose.Z()))
+            self._centers[i] = center
+            self._normals[i] = rot[:, 0]
+            corners[i] = local @ rot.T + center
+
+        # homogeneous coordinates so that projection is a single matrix multiply
+        self._corners_h = np.concatenate(
+            (corners.reshape(-1, 3), np.ones((n * 4, 1))), axis=1
+        )
+
+    def load_apriltag_layout(self, layout, tag_size: float = DEFAULT_TAG_SIZE):
+        """
+        Sets the tags from an AprilTag field layout
+
+        :param layout: ``robotpy_apriltag.AprilTagFieldLayout``, or the
+                       filename of a field layout JSON file
+        """
+        self.set_tags(_layout_tags(layout), tag_size)
+
+    def camera_pose(self, robot_pose: typing.Union[Pose2d, Pose3d]) -> Pose3d:
+        """:returns: the pose of the camera on the field"""
+        if isinstance(robot_pose, Pose2d):
+            robot_pose = Pose3d(robot_pose)
+        return robot_pose.transformBy(self.robot_to_camera)
+
+    def project(self, robot_pose: typing.Union[Pose2d, Pose3d]) -> TagDetections:
+        """
+        Computes the pixel coordinates of the corners of every tag that is
+        completely inside the image and facing the camera.
+
+        :param robot_pose: Current pose of the robot
+        """
+        camera = self.camera_pose(robot_pose)
+        position = np.array((camera.X(), camera.Y(), camera.Z()))
+        rot = camera.rotation().toMatrix()
+
+        # field -> image projection matrix
+        extrinsics = np.concatenate((rot.T, (-rot.T @ position)[:, None]), axis=1)
+        projection = self._k_axes @ extrinsics
+
+        uvw = (self._corners_h @ projection.T).reshape(-1, 4, 3)
+        depth = uvw[:, :, 2]
+
+        to_camera = position - self._centers
+        distances = np.linalg.norm(to_camera, axis=1)
+
+        # corners behind the camera can't be projected
+        visible = (
+            (depth > 0).all(axis=1)
+            & (distances > self.min_distance)
+            & (np.einsum("ij,ij->i", to_camera, self._normals) > 0)
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pixels = uvw[:, :, :2] / depth[:, :, None]
+
+        visible &= (
+            (pixels[:, :, 0] >= 0)
+            & (pixels[:, :, 0] <= self.width - 1)
+            & (pixels[:, :, 1] >= 0)
+            & (pixels[:, :, 1] <= self.height - 1)
+        ).all(axis=1)
+
+        pixels = pixels[visible]
+        if self.noise_stddev > 0 and len(pixels):
+            pixels = pixels + self._rng.normal(0.0, self.noise_stddev, pixels.shape)
+
+        return TagDetections(self.ids[visible], pixels, distances[visible])
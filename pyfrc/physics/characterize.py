@@ -0,0 +1,261 @@
+"""
+.. versionadded:: 2026.1.0
+
+Computes ``kv``, ``ka`` and ``vintercept`` for each side of a drivetrain
+from recorded voltage and velocity data, so that they can be passed to
+the :class:`.TankModel` constructor. This is what ``robotpy characterize``
+uses.
+
+Each side is fit to the usual characterization model, which is also what
+:class:`.MotorModel` uses when the motor is driving in the direction it is
+moving:
+
+.. math::
+
+    V = k_v \\cdot v + k_a \\cdot a + V_{intercept} \\cdot sgn(v)
+
+The acceleration is computed from the recorded velocities using central
+differences. Logs are processed in fixed-size chunks and only the normal
+equations of the least squares problem are kept, so memory use does not
+depend on the size of the log.
+
+Two log formats are supported:
+
+* CSV files with a header row. By default the columns are named ``time``
+  (in seconds), ``l_voltage``, ``r_voltage``, ``l_velocity`` and
+  ``r_velocity``.
+* WPILib DataLog (``.wpilog``) files, with double entries of the same
+  names. Each side is sampled whenever its velocity entry is updated,
+  using the most recent voltage for that side.
+
+Velocities are assumed to be in feet per second unless another distance
+unit is specified.
+"""
+
+import csv
+import dataclasses
+import itertools
+import pathlib
+import tokenize
+import typing
+
+import numpy as np
+import pint
+
+from .units import units
+
+#: Default column/entry names for time, left/right voltage and left/right velocity
+DEFAULT_COLUMNS = {
+    "time": "time",
+    "l_voltage": "l_voltage",
+    "r_voltage": "r_voltage",
+    "l_velocity": "l_velocity",
+    "r_velocity": "r_velocity",
+}
+
+
+@dataclasses.dataclass
+class CharacterizationResult:
+    """Fit result for one side of the drivetrain"""
+
+    #: Volts per ft/s
+    kv: float
+    #: Volts per ft/s^2
+    ka: float
+    #: Volts required to overcome static friction
+    vintercept: float
+    #: Coefficient of determination of the fit
+    r_squared: float
+    #: Number of samples used for the fit
+    samples: int
+
+
+class SideFitter:
+    """
+    Streaming least squares fit for one side of the drivetrain. Call
+    :meth:`add` with consecutive chunks of samples, then :meth:`solve`.
+    """
+
+    def __init__(self, min_velocity: float = 0.1):
+        """
+        :param min_velocity: Samples slower than this (in ft/s) are ignored,
+                             since static friction isn't modeled
+        """
+        self.min_velocity = min_velocity
+
+        self._xtx = np.zeros((3, 3))
+        self._xty = np.zeros(3)
+        self._yty = 0.0
+        self._ysum = 0.0
+        self._n = 0
+
+        # last two samples of the previous chunk, needed to compute the
+        # derivative at the chunk boundary
+        self._carry = np.empty((3, 0))
+
+    def add(self, time: np.ndarray, voltage: np.ndarray, velocity: np.ndarray):
+        """Adds a chunk of samples, which must follow the previous chunk in time"""
+        data = np.concatenate(
+            (self._carry, np.vstack((time, voltage, velocity)).astype(float)), axis=1
+        )
+        self._carry = data[:, -2:]
+
+        if data.shape[1] < 3:
+            return
+
+        t, volts, vel = data
+
+        # central difference
+        dt = t[2:] - t[:-2]
+        v = vel[1:-1]
+        y = volts[1:-1]
+
+        valid = (dt > 0) & (np.abs(v) >= self.min_velocity)
+        if not np.any(valid):
+            return
+
+        a = (vel[2:] - vel[:-2])[valid] / dt[valid]
+        v = v[valid]
+        y = y[valid]
+
+        x = np.column_stack((v, a, np.sign(v)))
+        self._xtx += x.T @ x
+        self._xty += x.T @ y
+        self._yty += float(y @ y)
+        self._ysum += float(y.sum())
+        self._n += len(y)
+
+    def solve(self) -> CharacterizationResult:
+        if self._n < 3:
+            raise ValueError(f"not enough usable samples to fit ({self._n})")
+
+        coeffs, *_ = np.linalg.lstsq(self._xtx, self._xty, rcond=None)
+
+        sse = self._yty - 2 * coeffs @ self._xty + coeffs @ self._xtx @ coeffs
+        sst = self._yty - self._ysum**2 / self._n
+        r_squared = 1.0 - sse / sst if sst > 0 else 1.0
+
+        kv, ka, vintercept = (float(c) for c in coeffs)
+        return CharacterizationResult(kv, ka, vintercept, float(r_squared), self._n)
+
+
+def _distance_scale(distance_units: str) -> float:
+    # feet per distance_units
+    try:
+        return (1 * units(distance_units)).m_as(units.foot)
+    except (pint.PintError, tokenize.TokenError):
+        raise ValueError(f"{distance_units!r} is not a unit of distance") from None
+
+
+def _read_csv(
+    fname: pathlib.Path, columns: typing.Dict[str, str], chunk_size: int
+) -> typing.Iterator[typing.Tuple[str, np.ndarray, np.ndarray, np.ndarray]]:
+    with open(fname, newline="") as fp:
+        reader = csv.reader(fp)
+        header = next(reader)
+        try:
+            idx = [header.index(columns[k]) for k in DEFAULT_COLUMNS]
+        except ValueError as e:
+            raise ValueError(f"{fname}: missing column ({e})") from None
+
+        while True:
+            rows = list(itertools.islice(reader, chunk_size))
+            if not rows:
+                break
+
+            # skip blank lines, such as at the end of the file
+            rows = [row for row in rows if row]
+            if not rows:
+                continue
+
+            data = np.array([[row[i] for i in idx] for row in rows], dtype=float).T
+            t, lv, rv, lvel, rvel = data
+            yield "l", t, lv, lvel
+            yield "r", t, rv, rvel
+
+
+def _read_datalog(
+    fname: pathlib.Path, columns: typing.Dict[str, str], chunk_size: int
+) -> typing.Iterator[typing.Tuple[str, np.ndarray, np.ndarray, np.ndarray]]:
+    from wpiutil.log import DataLogReader
+
+    reader = DataLogReader(str(fname))
+    if not reader.isValid():
+        raise ValueError(f"{fname} is not a valid DataLog file")
+
+    # entry name -> (side, is_velocity)
+    wanted = {
+        columns["l_voltage"]: ("l", False),
+        columns["r_voltage"]: ("r", False),
+        columns["l_velocity"]: ("l", True),
+        columns["r_velocity"]: ("r", True),
+    }
+
+    entries: typing.Dict[int, typing.Tuple[str, bool]] = {}
+    voltage = {"l": None, "r": None}
+    chunks = {"l": [], "r": []}
+
+    for record in reader:
+        if record.isStart():
+            data = record.getStartData()
+            if data.name in wanted:
+                entries[data.entry] = wanted[data.name]
+            continue
+        elif record.isControl():
+            continue
+
+        info = entries.get(record.getEntry())
+        if info is None:
+            continue
+
+        side, is_velocity = info
+        value = record.getDouble()
+        if not is_velocity:
+            voltage[side] = value
+        elif voltage[side] is not None:
+            chunk = chunks[side]
+            chunk.append((record.getTimestamp() / 1000000.0, voltage[side], value))
+            if len(chunk) >= chunk_size:
+                yield (side, *np.array(chunk).T)
+                chunk.clear()
+
+    for side, chunk in chunks.items():
+        if chunk:
+            yield (side, *np.array(chunk).T)
+
+
+def characterize(
+    fname: typing.Union[str, pathlib.Path],
+    columns: typing.Optional[typing.Dict[str, str]] = None,
+    distance_units: str = "foot",
+    min_velocity: float = 0.1,
+    chunk_size: int = 65536,
+) -> typing.Tuple[CharacterizationResult, CharacterizationResult]:
+    """
+    Fits ``kv``, ``ka`` and ``vintercept`` for each side of the drivetrain.
+
+    :param fname:          CSV or ``.wpilog`` file
+    :param columns:        Overrides for :data:`DEFAULT_COLUMNS`
+    :param distance_units: Distance unit of the recorded velocities
+    :param min_velocity:   Samples slower than this (in ft/s) are ignored
+    :param chunk_size:     Number of samples to process at a time
+
+    :returns: left and right results
+    """
+    fname = pathlib.Path(fname)
+    cols = dict(DEFAULT_COLUMNS)
+    if columns:
+        cols.update(columns)
+
+    scale = _distance_scale(distance_units)
+
+    if fname.suffix == ".wpilog":
+        chunks = _read_datalog(fname, cols, chunk_size)
+    else:
+        chunks = _read_csv(fname, cols, chunk_size)
+
+    fitters = {"l": SideFitter(min_velocity), "r": SideFitter(min_velocity)}
+    for side, t, volts, vel in chunks:
+        fitters[side].add(t, volts, vel * scale)
+
+    return fitters["l"].solve(), fitters["r"].solve()
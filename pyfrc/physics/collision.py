@@ -0,0 +1,323 @@
+"""
+.. versionadded:: 2026.1.0
+
+Keeps the simulated robot from driving through the field perimeter and
+other field elements. Field geometry is described as line segments and
+polygons (in meters, using the same coordinate system as the field), and
+is stored in a uniform grid so that only the elements near the robot are
+checked when it moves. This means the cost of each update depends on how
+crowded the area around the robot is, not on how many elements the field
+has.
+
+To enable collisions, create a :class:`CollisionMap` in your physics engine
+and pass it to :meth:`.PhysicsInterface.set_collision_map`::
+
+    from pyfrc.physics.collision import CollisionMap
+    from pyfrc.physics.units import units
+
+    class PhysicsEngine:
+
+        def __init__(self, physics_controller):
+            collision_map = CollisionMap.load("field.json")
+            collision_map.add_boundary(16.54 * units.m, 8.07 * units.m)
+
+            physics_controller.set_collision_map(
+                collision_map, robot_width=0.8 * units.m, robot_length=0.9 * units.m
+            )
+
+After that, :meth:`.PhysicsInterface.drive` and
+:meth:`.PhysicsInterface.move_robot` stop the robot (treated as a rectangle
+of the given size) when it touches something, and let it slide along walls
+that it hits at an angle.
+"""
+
+import json
+import math
+import pathlib
+import typing
+
+from wpimath.geometry import Pose2d, Rotation2d, Translation2d
+
+from .units import units
+
+Segment = typing.Tuple[float, float, float, float]
+
+
+class CollisionMap:
+    """
+    Field geometry stored in a uniform grid of ``cell_size`` cells. Each
+    segment is stored in every cell that its bounding box overlaps.
+    """
+
+    #: Number of bisection steps used to find where the robot collided
+    bisect_steps = 10
+
+    def __init__(self, cell_size: units.Quantity = 1 * units.m):
+        """
+        :param cell_size: Size of each grid cell. This should be around the
+                          size of the robot.
+        """
+        self.cell_size = units.meters.m_from(cell_size, name="cell_size")
+        if self.cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+
+        self._inv_cell_size = 1.0 / self.cell_size
+
+        #: All segments as (x1, y1, x2, y2)
+        self.segments: typing.List[Segment] = []
+
+        self._cells: typing.Dict[typing.Tuple[int, int], typing.List[int]] = {}
+
+    @classmethod
+    def load(cls, fname: typing.Union[str, pathlib.Path], **kwargs) -> "CollisionMap":
+        """
+        Loads field geometry from a JSON file that looks like this (all
+        values are in meters)::
+
+            {
+                "segments": [[x1, y1, x2, y2], ...],
+                "polygons": [[[x, y], [x, y], [x, y], ...], ...]
+            }
+
+        :param kwargs: Passed to the constructor
+        """
+        with open(fname) as fp:
+            data = json.load(fp)
+
+        collision_map = cls(**kwargs)
+        for x1, y1, x2, y2 in data.get("segments", []):
+            collision_map.add_segment(Translation2d(x1, y1), Translation2d(x2, y2))
+        for polygon in data.get("polygons", []):
+            collision_map.add_polygon([Translation2d(x, y) for x, y in polygon])
+
+        return collision_map
+
+    def add_segment(self, p1: Translation2d, p2: Translation2d):
+        """Adds a wall between two points"""
+        x1, y1, x2, y2 = p1.x, p1.y, p2.x, p2.y
+
+        idx = len(self.segments)
+        self.segments.append((x1, y1, x2, y2))
+
+        for cell in self._cells_in(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)):
+            self._cells.setdefault(cell, []).append(idx)
+
+    def add_polygon(self, points: typing.Sequence[Translation2d]):
+        """Adds a solid obstacle with the given corners"""
+        if len(points) < 3:
+            raise ValueError("a polygon requires at least three points")
+
+        for i, p1 in enumerate(points):
+            self.add_segment(p1, points[i - 1])
+
+    def add_boundary(self, length: units.Quantity, width: units.Quantity):
+        """
+        Adds the field perimeter: a rectangle from the origin to
+        (``length``, ``width``)
+        """
+        length = units.meters.m_from(length, name="length")
+        width = units.meters.m_from(width, name="width")
+
+        corners = [
+            Translation2d(0, 0),
+            Translation2d(length, 0),
+            Translation2d(length, width),
+            Translation2d(0, width),
+        ]
+        self.add_polygon(corners)
+
+    def _cells_in(
+        self, x0: float, y0: float, x1: float, y1: float
+    ) -> typing.Iterator[typing.Tuple[int, int]]:
+        inv = self._inv_cell_size
+        for ix in range(math.floor(x0 * inv), math.floor(x1 * inv) + 1):
+            for iy in range(math.floor(y0 * inv), math.floor(y1 * inv) + 1):
+                yield ix, iy
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> typing.Set[int]:
+        """
+        :returns: indices of segments that may overlap the given bounding box
+        """
+        cells = self._cells
+        found: typing.Set[int] = set()
+        for cell in self._cells_in(x0, y0, x1, y1):
+            indices = cells.get(cell)
+            if indices:
+                found.update(indices)
+        return found
+
+    def collides(self, pose: Pose2d, half_length: float, half_width: float) -> bool:
+        """
+        :param pose:        Center of the robot
+        :param half_length: Half of the robot length (meters)
+        :param half_width:  Half of the robot width (meters)
+
+        :returns: True if the robot footprint touches any segment
+        """
+        x, y = pose.X(), pose.Y()
+        c = pose.rotation().cos()
+        s = pose.rotation().sin()
+        ex = half_length * abs(c) + half_width * abs(s)
+        ey = half_length * abs(s) + half_width * abs(c)
+        candidates = self.query(x - ex, y - ey, x + ex, y + ey)
+        return self._collides(candidates, x, y, c, s, half_length, half_width)
+
+    def _collides(
+        self,
+        candidates: typing.Iterable[int],
+        x: float,
+        y: float,
+        c: float,
+        s: float,
+        half_length: float,
+        half_width: float,
+    ) -> bool:
+        # separating axis test between the robot rectangle and each segment
+        segments = self.segments
+        for idx in candidates:
+            x1, y1, x2, y2 = segments[idx]
+            x1 -= x
+            y1 -= y
+            x2 -= x
+            y2 -= y
+
+            # robot forward axis
+            d1 = x1 * c + y1 * s
+            d2 = x2 * c + y2 * s
+            if (d1 > half_length and d2 > half_length) or (
+                d1 < -half_length and d2 < -half_length
+            ):
+                continue
+
+            # robot left axis
+            d1 = y1 * c - x1 * s
+            d2 = y2 * c - x2 * s
+            if (d1 > half_width and d2 > half_width) or (
+                d1 < -half_width and d2 < -half_width
+            ):
+                continue
+
+            # segment normal
+            nx = y1 - y2
+            ny = x2 - x1
+            norm = math.hypot(nx, ny)
+            if norm == 0:
+                return True
+            nx /= norm
+            ny /= norm
+            r = half_length * abs(c * nx + s * ny) + half_width * abs(c * ny - s * nx)
+            if abs(x1 * nx + y1 * ny) > r:
+                continue
+
+            return True
+
+        return False
+
+    def resolve(
+        self, start: Pose2d, end: Pose2d, half_length: float, half_width: float
+    ) -> Pose2d:
+        """
+        Moves the robot from ``start`` towards ``end``, stopping before it
+        collides with anything. The part of the motion that was blocked is
+        then tried separately along the x and y axes, so that the robot
+        slides along walls instead of sticking to them.
+
+        If the robot already overlaps something at ``start``, ``end`` is
+        returned so that it can move out.
+
+        :returns: the new pose of the robot
+        """
+        x0, y0 = start.X(), start.Y()
+        a0 = start.rotation().radians()
+        dx = end.X() - x0
+        dy = end.Y() - y0
+        da = (end.rotation() - start.rotation()).radians()
+
+        # only the segments near the swept area of the robot need to be checked
+        radius = math.hypot(half_length, half_width)
+        candidates = self.query(
+            min(x0, x0 + dx) - radius,
+            min(y0, y0 + dy) - radius,
+            max(x0, x0 + dx) + radius,
+            max(y0, y0 + dy) + radius,
+        )
+        if not candidates:
+            return end
+
+        if self._collides(
+            candidates,
+            x0,
+            y0,
+            math.cos(a0),
+            math.sin(a0),
+            half_length,
+            half_width,
+        ):
+            return end
+
+        args = (candidates, half_length, half_width)
+        fraction = self._sweep(x0, y0, a0, dx, dy, da, *args)
+        if fraction == 1.0:
+            return end
+
+        x = x0 + dx * fraction
+        y = y0 + dy * fraction
+        angle = a0 + da * fraction
+
+        # slide along whatever was hit
+        rest = 1.0 - fraction
+        x += dx * rest * self._sweep(x, y, angle, dx * rest, 0.0, 0.0, *args)
+        y += dy * rest * self._sweep(x, y, angle, 0.0, dy * rest, 0.0, *args)
+
+        return Pose2d(x, y, Rotation2d(angle))
+
+    def _sweep(
+        self,
+        x0: float,
+        y0: float,
+        a0: float,
+        dx: float,
+        dy: float,
+        da: float,
+        candidates: typing.Set[int],
+        half_length: float,
+        half_width: float,
+    ) -> float:
+        # returns the largest fraction of the motion that doesn't collide
+
+        def collides_at(f):
+            angle = a0 + da * f
+            return self._collides(
+                candidates,
+                x0 + dx * f,
+                y0 + dy * f,
+                math.cos(angle),
+                math.sin(angle),
+                half_length,
+                half_width,
+            )
+
+        # Check the motion in steps that are smaller than the robot, so that
+        # a large motion can't jump over a wall
+        distance = math.hypot(dx, dy) + abs(da) * math.hypot(half_length, half_width)
+        if distance == 0:
+            return 1.0
+        steps = max(1, math.ceil(distance / min(half_length, half_width)))
+
+        lo = 0.0
+        for i in range(1, steps + 1):
+            hi = i / steps
+            if collides_at(hi):
+                break
+            lo = hi
+        else:
+            return 1.0
+
+        for _ in range(self.bisect_steps):
+            mid = (lo + hi) * 0.5
+            if collides_at(mid):
+                hi = mid
+            else:
+                lo = mid
+
+        return lo
@@ -25,12 +25,31 @@ You must create a python module called ``physics.py`` next to your
 ``robot.py``. A physics module must have a class called
 :class:`PhysicsEngine` which must have a function called ``update_sim``.
 When initialized, it will be passed an instance of this object.
+
+Reloading physics while the simulator is running
+------------------------------------------------
+
+If you run the simulator with ``robotpy sim --physics-reload``, pyfrc will
+check ``physics.py`` for changes about twice a second. When it changes,
+the module is reloaded and a new :class:`PhysicsEngine` is created without
+restarting your robot code. The robot pose on the field is kept; any other
+state can be carried over using :meth:`PhysicsEngine.get_reload_state`
+and :meth:`PhysicsEngine.set_reload_state`. If the new code fails to load,
+the error is logged and the previous engine keeps running.
+
+The previous engine is garbage collected before the new one is created,
+so that simulated devices it created (such as those of
+:class:`.LinearMotion`) can be created again with the same names. Collision
+maps and opponents must be registered again by the new engine. If the new
+engine fails to initialize, the previous version is created again.
 """
 
 from importlib.machinery import SourceFileLoader
+import gc
 import inspect
 import logging
 import pathlib
+import time
 import types
 import typing
 
@@ -40,6 +59,12 @@ import wpilib.simulation
 from wpimath.kinematics import ChassisSpeeds
 from wpimath.geometry import Pose2d, Rotation2d, Transform2d, Translation2d, Twist2d
 
+from .units import units
+
+if typing.TYPE_CHECKING:
+    from .collision import CollisionMap
+    from .opponents import OpponentRobots
+
 logger = logging.getLogger("pyfrc.physics")
 
 
@@ -47,6 +72,23 @@ class PhysicsInitException(Exception):
     pass
 
 
+def _load_physics_module(physics_module_path: pathlib.Path) -> types.ModuleType:
+    """
+    Executes the user's physics module into a new module object, and logs
+    how long that took
+    """
+    start = time.perf_counter()
+
+    loader = SourceFileLoader("physics", str(physics_module_path))
+    physics_module = types.ModuleType(loader.name)
+    loader.exec_module(physics_module)
+
+    logger.info(
+        "Physics module loaded in %.1fms", (time.perf_counter() - start) * 1000.0
+    )
+    return physics_module
+
+
 class PhysicsEngine:
     """
     Your physics module must contain a class called ``PhysicsEngine``,
@@ -81,6 +123,30 @@ class PhysicsEngine:
         """
         pass
 
+    def get_reload_state(self) -> typing.Any:
+        """
+        Optional. When physics hot-reload is enabled (``robotpy sim
+        --physics-reload``) and ``physics.py`` changes, this is called on
+        the old engine before it is replaced. Whatever it returns is passed
+        to :meth:`set_reload_state` of the new engine.
+
+        The robot pose is always kept, so you only need to implement this
+        if there is other state (mechanism positions, etc) that you want
+        to carry over.
+
+        .. versionadded:: 2026.1.0
+        """
+        return None
+
+    def set_reload_state(self, state: typing.Any):
+        """
+        Optional. Receives the value returned by :meth:`get_reload_state`
+        of the engine that this engine is replacing.
+
+        .. versionadded:: 2026.1.0
+        """
+        pass
+
 
 class PhysicsInterface:
     """
@@ -95,6 +161,7 @@ class PhysicsInterface:
         cls: typing.Type["PhysicsInterface"],
         robot_class: typing.Type[wpilib.RobotBase],
         robot_path: pathlib.Path,
+        reload_period: typing.Optional[float] = None,
     ) -> typing.Tuple[
         typing.Optional["PhysicsInterface"], typing.Type[wpilib.RobotBase]
     ]:
@@ -103,9 +170,7 @@ class PhysicsInterface:
         if physics_module_path.exists():
             # Load the user's physics module if it exists
             try:
-                loader = SourceFileLoader("physics", str(physics_module_path))
-                physics_module = types.ModuleType(loader.name)
-                loader.exec_module(physics_module)
+                physics_module = _load_physics_module(physics_module_path)
             except:
                 logger.exception("Error loading user physics module")
                 raise PhysicsInitException()
@@ -115,7 +180,9 @@ class PhysicsInterface:
                 raise PhysicsInitException()
 
             logger.info("Physics support successfully enabled")
-            interface = PhysicsInterface(physics_module)
+            interface = PhysicsInterface(
+                physics_module, physics_module_path, reload_period
+            )
 
             # We create a robot class so we can pass the robot object to
             # interface._simulationInit
@@ -139,7 +206,12 @@ class PhysicsInterface:
 
         return interface, robot_class
 
-    def __init__(self, physics_module):
+    def __init__(
+        self,
+        physics_module,
+        physics_module_path: typing.Optional[pathlib.Path] = None,
+        reload_period: typing.Optional[float] = None,
+    ):
         self.last_tm = None
         self.module = physics_module
         self.engine = None
@@ -147,6 +219,23 @@ class PhysicsInterface:
 
         self.log_init_errors = True
 
+        # (collision map, half length, half width) of the robot footprint
+        self._collision = None
+
+        # (opponents, field object name)
+        self._opponents: typing.List[typing.Tuple["OpponentRobots", str]] = []
+
+        # hot reload support: physics.py is checked for changes at most
+        # once per reload_period (in wall clock seconds)
+        self._module_path = physics_module_path
+        self._reload_period = reload_period
+        self._reload_next = 0.0
+        self._reload_mtime = None
+        self._robot = None
+
+        if reload_period is not None and physics_module_path is not None:
+            self._reload_mtime = physics_module_path.stat().st_mtime_ns
+
     def _simulationInit(self, robot):
         # reset state first so that the PhysicsEngine constructor can use it
         self.field = wpilib.Field2d()
@@ -163,21 +252,102 @@ class PhysicsInterface:
             )
 
         try:
-            # if it has two arguments, the second argument is their robot...
-            # - TODO: always pass robot in 2023
-            sig = inspect.signature(PhysicsEngine)
-            if len(sig.parameters) == 2:
-                self.engine = PhysicsEngine(self, robot)
-            else:
-                self.engine = PhysicsEngine(self)
-
+            self.engine = self._create_engine(PhysicsEngine, robot)
         except Exception:
             if not self.log_init_errors:
                 raise
             logger.exception("Error creating user's PhysicsEngine object")
             raise PhysicsInitException()
 
+        # only keep the robot around if we need to recreate the engine
+        if self._reload_period is not None:
+            self._robot = robot
+
+    @staticmethod
+    def _engine_takes_robot(PhysicsEngine) -> bool:
+        # if it has two arguments, the second argument is their robot...
+        # - TODO: always pass robot in 2023
+        return len(inspect.signature(PhysicsEngine).parameters) == 2
+
+    def _create_engine(self, PhysicsEngine, robot):
+        if self._engine_takes_robot(PhysicsEngine):
+            return PhysicsEngine(self, robot)
+        else:
+            return PhysicsEngine(self)
+
+    def _check_reload(self):
+        tm = time.monotonic()
+        if tm < self._reload_next:
+            return
+
+        self._reload_next = tm + self._reload_period
+
+        try:
+            mtime = self._module_path.stat().st_mtime_ns
+        except OSError:
+            return
+
+        if mtime == self._reload_mtime:
+            return
+
+        self._reload_mtime = mtime
+
+        # If anything goes wrong, keep running the old engine so the user
+        # can fix their code without restarting the simulation
+        try:
+            module = _load_physics_module(self._module_path)
+            PhysicsEngine = module.PhysicsEngine
+        except Exception:
+            logger.exception("Error reloading physics module")
+            return
+
+        try:
+            state = None
+            get_reload_state = getattr(self.engine, "get_reload_state", None)
+            if get_reload_state is not None:
+                state = get_reload_state()
+        except Exception:
+            logger.exception("Error saving PhysicsEngine state, not reloading")
+            return
+
+        pose = self.get_pose()
+        old_module = self.module
+
+        try:
+            self.engine = self._replace_engine(PhysicsEngine, state, pose)
+        except Exception:
+            logger.exception("Error creating new PhysicsEngine, using previous version")
+        else:
+            self.module = module
+            logger.info("Physics module reloaded")
+            return
+
+        # the old engine is already gone, so create it again
+        self.engine = self._replace_engine(old_module.PhysicsEngine, state, pose)
+
+    def _replace_engine(self, PhysicsEngine, state: typing.Any, pose: Pose2d):
+        # The previous engine must be freed first: SimDevices that it created
+        # are only released when it is garbage collected, and a new device
+        # with the same name would get an invalid handle until then
+        self.engine = None
+        self._collision = None
+        self._opponents = []
+        gc.collect()
+
+        engine = self._create_engine(PhysicsEngine, self._robot)
+
+        set_reload_state = getattr(engine, "set_reload_state", None)
+        if set_reload_state is not None and state is not None:
+            set_reload_state(state)
+
+        # the constructor may have moved the robot to a starting pose
+        self.field.setRobotPose(pose)
+        return engine
+
     def _simulationPeriodic(self):
+        if self._reload_period is not None:
+            self._check_reload()
+
         now = wpilib.Timer.getFPGATimestamp()
         last_tm = self.last_tm
 
@@ -190,6 +360,8 @@ class PhysicsInterface:
 
             # Don't run physics calculations more than 100hz
             if tm_diff > 0.010:
+                if self._opponents:
+                    self._update_opponents(now)
                 try:
                     self.engine.update_sim(now, tm_diff)
                 except Exception as e:
@@ -230,8 +402,10 @@ class PhysicsInterface:
             dtheta=speeds.omega * tm_diff,
         )
 
-        pose = self.field.getRobotPose()
-        pose = pose.exp(twist)
+        start = self.field.getRobotPose()
+        pose = start.exp(twist)
+        if self._collision is not None:
+            pose = self._resolve_collision(start, pose)
         self.field.setRobotPose(pose)
         return pose
 
@@ -249,11 +423,62 @@ class PhysicsInterface:
         .. versionadded:: 2020.1.0
         """
 
-        pose = self.field.getRobotPose()
-        pose = pose + transform
+        start = self.field.getRobotPose()
+        pose = start + transform
+        if self._collision is not None:
+            pose = self._resolve_collision(start, pose)
         self.field.setRobotPose(pose)
         return pose
 
+    def set_collision_map(
+        self,
+        collision_map: typing.Optional["CollisionMap"],
+        robot_width: units.Quantity = 2 * units.feet,
+        robot_length: units.Quantity = 3 * units.feet,
+    ):
+        """
+        Prevents :meth:`drive` and :meth:`move_robot` from moving the robot
+        through the walls and obstacles in ``collision_map``. See
+        :mod:`pyfrc.physics.collision` for details.
+
+        :param collision_map: Field geometry, or None to disable collisions
+        :param robot_width:   Width of the robot footprint (side to side)
+        :param robot_length:  Length of the robot footprint (front to back)
+
+        .. versionadded:: 2026.1.0
+        """
+        if collision_map is None:
+            self._collision = None
+            return
+
+        self._collision = (
+            collision_map,
+            units.meters.m_from(robot_length, name="robot_length") / 2.0,
+            units.meters.m_from(robot_width, name="robot_width") / 2.0,
+        )
+
+    def _resolve_collision(self, start: Pose2d, end: Pose2d) -> Pose2d:
+        collision_map, half_length, half_width = self._collision
+        return collision_map.resolve(start, end, half_length, half_width)
+
+    def add_opponents(self, opponents: "OpponentRobots", name: str = "Opponents"):
+        """
+        Registers scripted robots, which are updated before each call to
+        :meth:`PhysicsEngine.update_sim` and shown on the field as a single
+        object. See :mod:`pyfrc.physics.opponents` for details.
+
+        :param opponents: The robots
+        :param name:      Name of the field object
+
+        .. versionadded:: 2026.1.0
+        """
+        self._opponents.append((opponents, name))
+
+    def _update_opponents(self, now: float):
+        for opponents, name in self._opponents:
+            opponents.update(now)
+            self.field.getObject(name).setPoses(opponents.poses())
+
     def get_pose(self):
         """
         :returns: current robot pose
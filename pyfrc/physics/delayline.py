@@ -0,0 +1,194 @@
+"""
+.. versionadded:: 2026.1.0
+
+Real sensors report values that are late, noisy and quantized. A
+:class:`DelayLine` records the true value of a sensor each time the physics
+engine runs, and returns what the sensor would report::
+
+    import wpilib.simulation
+    from pyfrc.physics.delayline import DelayLine
+
+    class PhysicsEngine:
+
+        def __init__(self, physics_controller, robot):
+            self.physics_controller = physics_controller
+            self.gyro_sim = wpilib.simulation.AnalogGyroSim(robot.gyro)
+
+            # gyro that is 20ms late, with 0.1 degrees of noise and
+            # 0.01 degree resolution
+            self.gyro = DelayLine(
+                0.020, noise_stddev=0.1, quantization=0.01, seed=1234
+            )
+
+        def update_sim(self, now, tm_diff):
+            angle = self.physics_controller.get_pose().rotation().degrees()
+            self.gyro_sim.setAngle(self.gyro.update(now, angle))
+
+Samples are stored in preallocated NumPy arrays that are used as ring
+buffers, so recording and looking up values doesn't allocate any arrays.
+When the buffer is full the oldest samples are overwritten, so
+``capacity`` must be large enough to hold ``delay`` seconds of samples.
+"""
+
+import math
+import typing
+
+import numpy as np
+
+
+class DelayLine:
+    """
+    A fixed size history of timestamped sensor values
+    """
+
+    def __init__(
+        self,
+        delay: float,
+        capacity: int = 64,
+        width: typing.Optional[int] = None,
+        noise_stddev: float = 0.0,
+        quantization: float = 0.0,
+        interpolate: bool = True,
+        seed: typing.Optional[int] = None,
+    ):
+        """
+        :param delay:        How late the sensor reports values (seconds)
+        :param capacity:     Number of samples that are kept
+        :param width:        If None, each sample is a single number. Otherwise
+                             each sample is an array of this many numbers, and
+                             lookups return arrays.
+        :param noise_stddev: Standard deviation of the gaussian noise added to
+                             each sample when it is recorded
+        :param quantization: If not zero, the values that are looked up are
+                             rounded to a multiple of this value
+        :param interpolate:  If True, values between samples are linearly
+                             interpolated. Otherwise the most recent sample
+                             is held until the next one.
+        :param seed:         Seed for the noise, for reproducible results
+        """
+        if delay < 0:
+            raise ValueError("delay must not be negative")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.delay = delay
+        self.noise_stddev = noise_stddev
+        self.quantization = quantization
+        self.interpolate = interpolate
+
+        self._scalar = width is None
+        self._capacity = capacity
+        self._times = np.zeros(capacity)
+        self._values = np.zeros((capacity, 1 if width is None else width))
+        self._out = np.zeros(self._values.shape[1])
+        self._noise = np.zeros(self._values.shape[1])
+        self._rng = np.random.default_rng(seed)
+
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self):
+        """Forgets all recorded samples"""
+        self._head = 0
+        self._count = 0
+
+    def push(self, now: float, value: typing.Union[float, np.ndarray]):
+        """
+        Records the true value of the sensor
+
+        :param now:   Time of the sample (seconds). This must not be earlier
+                      than the previous sample.
+        :param value: True value of the sensor
+        """
+        if self._count and now < self._times[(self._head - 1) % self._capacity]:
+            raise ValueError("samples must be pushed in time order")
+
+        head = self._head
+        row = self._values[head]
+        row[:] = value
+
+        if self.noise_stddev > 0:
+            noise = self._noise
+            self._rng.standard_normal(out=noise)
+            noise *= self.noise_stddev
+            row += noise
+
+        self._times[head] = now
+        self._head = (head + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+
+    def sample(self, t: float) -> typing.Union[float, np.ndarray]:
+        """
+        Looks up the recorded value at time ``t``. Times before the oldest
+        sample return the oldest sample, and times after the newest sample
+        return the newest sample.
+
+        :returns: the value, or NaN if nothing has been recorded. If
+                  ``width`` was set, this is an array that is reused by
+                  the next lookup.
+        """
+        out = self._out
+        count = self._count
+        if count == 0:
+            out.fill(math.nan)
+            return self._result()
+
+        capacity = self._capacity
+        start = (self._head - count) % capacity
+        times = self._times
+        values = self._values
+
+        # binary search for the last sample at or before t
+        lo = 0
+        hi = count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if times[(start + mid) % capacity] <= t:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo == 0:
+            out[:] = values[start]
+        elif lo == count or not self.interpolate:
+            out[:] = values[(start + lo - 1) % capacity]
+        else:
+            i0 = (start + lo - 1) % capacity
+            i1 = (start + lo) % capacity
+            t0 = times[i0]
+            frac = (t - t0) / (times[i1] - t0)
+            np.subtract(values[i1], values[i0], out=out)
+            out *= frac
+            out += values[i0]
+
+        # round after interpolating, so that the output is always quantized
+        q = self.quantization
+        if q:
+            out /= q
+            np.rint(out, out=out)
+            out *= q
+
+        return self._result()
+
+    def get(self, now: float) -> typing.Union[float, np.ndarray]:
+        """:returns: the value that the sensor reports at ``now``"""
+        return self.sample(now - self.delay)
+
+    def update(
+        self, now: float, value: typing.Union[float, np.ndarray]
+    ) -> typing.Union[float, np.ndarray]:
+        """
+        Records the true value of the sensor and returns the value that the
+        sensor reports at ``now``
+        """
+        self.push(now, value)
+        return self.sample(now - self.delay)
+
+    def _result(self) -> typing.Union[float, np.ndarray]:
+        if self._scalar:
+            return float(self._out[0])
+        return self._out
@@ -49,12 +49,16 @@ Here's an example usage of the drivetrains::
    speeds all require units.
 """
 
+import bisect
+import dataclasses
 import math
 import typing
 
+import numpy as np
+
 from .units import units, Helpers
 
-from wpimath.geometry import Translation2d
+from wpimath.geometry import Rotation2d, Translation2d
 
 from wpimath.kinematics import (
     ChassisSpeeds,
@@ -62,6 +66,7 @@ from wpimath.kinematics import (
     DifferentialDriveWheelSpeeds,
     MecanumDriveKinematics,
     MecanumDriveWheelSpeeds,
+    SwerveModuleState,
 )
 
 DeadzoneCallable = typing.Callable[[float], float]
@@ -85,22 +90,293 @@ def linear_deadzone(deadzone: float) -> DeadzoneCallable:
     returned function to one of the drivetrain simulation functions as the
     ``deadzone`` parameter.
 
+    The returned function also accepts NumPy arrays of motor inputs. To
+    combine a deadzone with other shaping, see :class:`ResponseCurve`.
+
     :param motor_input: The motor input (between -1 and 1)
     :param deadzone: Minimum input required for the motor to move (between 0 and 1)
+
+    .. versionchanged:: 2026.1.0
+
+       The returned function accepts NumPy arrays
     """
     assert 0.0 < deadzone < 1.0
-    scale_param = 1.0 - deadzone
+    return _LinearDeadzone(deadzone)
+
+
+class _LinearDeadzone:
+    def __init__(self, deadzone: float):
+        self.deadzone = deadzone
+        self._scale = 1.0 - deadzone
+
+    def __call__(self, motor_input):
+        deadzone = self.deadzone
+        if isinstance(motor_input, np.ndarray):
+            abs_motor_input = np.abs(motor_input)
+            return np.where(
+                abs_motor_input < deadzone,
+                0.0,
+                np.copysign((abs_motor_input - deadzone) / self._scale, motor_input),
+            )
 
-    def _linear_deadzone(motor_input):
         abs_motor_input = abs(motor_input)
         if abs_motor_input < deadzone:
             return 0.0
         else:
             return math.copysign(
-                (abs_motor_input - deadzone) / scale_param, motor_input
+                (abs_motor_input - deadzone) / self._scale, motor_input
             )
 
-    return _linear_deadzone
+
+class ResponseCurve:
+    """
+    A chain of input shaping stages (deadzone, expo, scaling, or any other
+    function of a single motor value) that is compiled into a lookup table.
+    Each stage returns a new curve, so curves can be built up and shared::
+
+        curve = drivetrains.ResponseCurve().deadzone(0.1).expo(0.4).scale(0.8)
+
+        drivetrain = drivetrains.TwoMotorDrivetrain(deadzone=curve)
+
+    Evaluating the curve costs about the same no matter how many stages it
+    has: the input is clamped to -1..1 and the output is linearly
+    interpolated from a table of ``resolution`` intervals. The curve can be
+    called with a single value or with a NumPy array, so it can be passed as
+    the ``deadzone`` of any drivetrain (including to ``calculate_batch``).
+
+    The edges of each deadzone are added to the table, so inputs inside a
+    deadzone give exactly the same output as the stages would. Elsewhere the
+    output may differ slightly from the exact result of the stages near
+    sharp corners; increase ``resolution`` if that matters. A NaN input
+    gives a NaN output, like :func:`linear_deadzone`.
+
+    .. versionadded:: 2026.1.0
+    """
+
+    def __init__(self, resolution: int = 1024):
+        """
+        :param resolution: Number of table intervals between -1 and 1
+        """
+        if resolution < 2:
+            raise ValueError("resolution must be at least 2")
+
+        self.resolution = resolution
+        self._stages: typing.List[typing.Callable[[np.ndarray], np.ndarray]] = []
+        self._set_table(np.linspace(-1.0, 1.0, resolution + 1))
+
+    def _set_table(self, inputs: np.ndarray):
+        self._inputs = inputs
+        self._table = self._evaluate(inputs)
+
+        # python floats are faster to index than a numpy array for scalars
+        self._input_values = inputs.tolist()
+        self._values = self._table.tolist()
+
+    def _evaluate(self, inputs: np.ndarray) -> np.ndarray:
+        outputs = inputs
+        for stage in self._stages:
+            outputs = np.asarray(stage(outputs), dtype=float)
+        return outputs
+
+    def _then(
+        self,
+        fn: typing.Callable[[np.ndarray], np.ndarray],
+        deadzone: typing.Optional[float] = None,
+    ) -> "ResponseCurve":
+        inputs = self._inputs
+        if deadzone is not None:
+            inputs = np.union1d(inputs, self._deadzone_edges(deadzone))
+
+        curve = ResponseCurve.__new__(ResponseCurve)
+        curve.resolution = self.resolution
+        curve._stages = self._stages + [fn]
+        curve._set_table(inputs)
+        return curve
+
+    def _deadzone_edges(self, deadzone: float) -> typing.List[float]:
+        # Finds the inputs where the output of the previous stages enters or
+        # leaves the deadzone, as the adjacent pair of floats on either side
+        # of the edge. Every table entry inside the deadzone is exactly zero
+        def inside(x: float) -> bool:
+            return abs(float(self._evaluate(np.array([x]))[0])) < deadzone
+
+        is_inside = np.abs(self._table) < deadzone
+        edges = []
+        for i in np.flatnonzero(is_inside[:-1] != is_inside[1:]):
+            lo, hi = self._input_values[i], self._input_values[i + 1]
+            if not is_inside[i]:
+                lo, hi = hi, lo
+            # lo is inside, hi is outside
+            for _ in range(64):
+                mid = (lo + hi) / 2.0
+                if mid == lo or mid == hi:
+                    break
+                if inside(mid):
+                    lo = mid
+                else:
+                    hi = mid
+            edges += [lo, hi]
+        return edges
+
+    def then(self, fn: DeadzoneCallable) -> "ResponseCurve":
+        """
+        Adds a stage that applies an arbitrary function. The function is
+        only called when the table is created, never when the curve is used.
+        """
+        return self._then(np.vectorize(fn, otypes=[float]))
+
+    def deadzone(self, deadzone: float) -> "ResponseCurve":
+        """Adds a stage that behaves like :func:`linear_deadzone`"""
+        return self._then(linear_deadzone(deadzone), deadzone)
+
+    def expo(self, amount: float) -> "ResponseCurve":
+        """
+        Adds a stage that reduces the sensitivity near the center of the
+        curve: ``(1 - amount) * x + amount * x ** 3``
+
+        :param amount: 0 is linear, 1 is fully cubic
+        """
+        assert 0.0 <= amount <= 1.0
+        return self._then(lambda x: (1.0 - amount) * x + amount * x**3)
+
+    def scale(self, scale: float) -> "ResponseCurve":
+        """Adds a stage that multiplies the output by a constant"""
+        return self._then(lambda x: x * scale)
+
+    def slew(self, rate: float) -> "SlewLimiter":
+        """
+        Returns a :class:`SlewLimiter` that limits how quickly the output of
+        this curve can change. Since this is stateful, it can't be part of
+        the table.
+
+        :param rate: Maximum change of the output per second
+        """
+        return SlewLimiter(rate, self)
+
+    def __call__(self, motor_input):
+        if isinstance(motor_input, np.ndarray):
+            # np.interp clamps to the ends of the table and passes NaN through
+            return np.interp(motor_input, self._inputs, self._table)
+
+        if motor_input >= 1.0:
+            return self._values[-1]
+        elif motor_input <= -1.0:
+            return self._values[0]
+        elif motor_input != motor_input:
+            return math.nan
+
+        # same arithmetic as np.interp, so both paths give identical results
+        inputs = self._input_values
+        idx = bisect.bisect_right(inputs, motor_input) - 1
+        x0 = inputs[idx]
+        lo = self._values[idx]
+        slope = (self._values[idx + 1] - lo) / (inputs[idx + 1] - x0)
+        return slope * (motor_input - x0) + lo
+
+
+class SlewLimiter:
+    """
+    Limits how quickly a single motor value can change, in units per second.
+    Because it remembers the previous output, each motor needs its own
+    instance, applied to the motor value before it is passed to the
+    drivetrain. It can't be used as the ``deadzone`` of a drivetrain, since
+    that is shared by all of the motors (and by ``calculate_batch``).
+
+    This behaves like :class:`wpimath.filter.SlewRateLimiter`, except that
+    it uses the ``tm_diff`` passed to ``update_sim`` instead of reading the
+    clock, so it can be used in a physics engine::
+
+        def update_sim(self, now, tm_diff):
+            l_motor = self.l_slew.calculate(self.l_motor.getSpeed(), tm_diff)
+
+    .. versionadded:: 2026.1.0
+    """
+
+    def __init__(self, rate: float, curve: typing.Optional[DeadzoneCallable] = None):
+        """
+        :param rate:  Maximum change of the output per second
+        :param curve: Optional shaping applied before the slew limit
+        """
+        assert rate > 0
+        self.rate = rate
+        self.curve = curve
+        self._last = 0.0
+
+    def reset(self, value=0.0):
+        """Sets the previous output"""
+        self._last = value
+
+    def calculate(self, motor_input: float, tm_diff: float) -> float:
+        """
+        :param motor_input: The motor value
+        :param tm_diff:     Time since the last call (seconds)
+
+        :returns: The shaped motor value, limited to ``rate * tm_diff`` away
+                  from the previous output
+        """
+        if self.curve is not None:
+            motor_input = self.curve(motor_input)
+
+        max_change = self.rate * tm_diff
+        value = self._last + min(max(motor_input - self._last, -max_change), max_change)
+        self._last = value
+        return value
+
+
+def _check_deadzone(
+    deadzone: typing.Optional[DeadzoneCallable],
+) -> typing.Optional[DeadzoneCallable]:
+    if isinstance(deadzone, SlewLimiter):
+        raise ValueError(
+            "a SlewLimiter can't be used as a drivetrain deadzone, since it "
+            "would be shared by every motor; apply a separate SlewLimiter to "
+            "each motor value instead"
+        )
+    return deadzone
+
+
+def _apply_deadzone_array(
+    deadzone: typing.Optional[DeadzoneCallable], motor: np.ndarray
+) -> np.ndarray:
+    motor = np.asarray(motor, dtype=float)
+    if deadzone is None:
+        return motor
+    if isinstance(deadzone, (_LinearDeadzone, ResponseCurve)):
+        return deadzone(motor)
+    # arbitrary user functions only accept a single value
+    return np.vectorize(deadzone, otypes=[float])(motor)
+
+
+@dataclasses.dataclass
+class ChassisSpeedsBatch:
+    """
+    Results of ``calculate_batch``: the chassis speeds and wheel speeds for
+    each set of motor values.
+
+    .. versionadded:: 2026.1.0
+    """
+
+    #: Forward velocity (m/s)
+    vx: np.ndarray
+    #: Sideways velocity (m/s), positive is left
+    vy: np.ndarray
+    #: Angular velocity (rad/s), positive is counter-clockwise
+    omega: np.ndarray
+    #: Speed of each wheel (m/s) with shape ``(N, wheels)``, in the same
+    #: order as the fields of the drivetrain's ``wheelSpeeds``
+    wheel_speeds: np.ndarray
+
+
+def _differential_batch(
+    l: np.ndarray, r: np.ndarray, trackwidth: float
+) -> ChassisSpeedsBatch:
+    # same operations as DifferentialDriveKinematics.toChassisSpeeds
+    return ChassisSpeedsBatch(
+        (l + r) / 2.0,
+        np.zeros_like(l),
+        (r - l) / trackwidth,
+        np.column_stack((l, r)),
+    )
 
 
 class TwoMotorDrivetrain:
@@ -140,7 +416,8 @@ class TwoMotorDrivetrain:
         self.kinematics = DifferentialDriveKinematics(trackwidth)
         self.speed = units.mps.m_from(speed, name="speed")
         self.wheelSpeeds = DifferentialDriveWheelSpeeds()
-        self.deadzone = deadzone
+        self.deadzone = _check_deadzone(deadzone)
+        self._trackwidth = trackwidth
 
     def calculate(self, l_motor: float, r_motor: float) -> ChassisSpeeds:
         """
@@ -165,6 +442,27 @@ class TwoMotorDrivetrain:
 
         return self.kinematics.toChassisSpeeds(self.wheelSpeeds)
 
+    def calculate_batch(
+        self, l_motor: np.ndarray, r_motor: np.ndarray
+    ) -> ChassisSpeedsBatch:
+        """
+        Same as :meth:`calculate`, but for arrays of motor values. The
+        results are identical to calling :meth:`calculate` for each pair of
+        motor values, but :attr:`wheelSpeeds` is not updated.
+
+        :param l_motor:    Left motor values (-1 to 1); 1 is forward
+        :param r_motor:    Right motor values (-1 to 1); -1 is forward
+
+        .. versionadded:: 2026.1.0
+        """
+        l_motor = _apply_deadzone_array(self.deadzone, l_motor)
+        r_motor = _apply_deadzone_array(self.deadzone, r_motor)
+
+        l = l_motor * self.speed
+        r = -r_motor * self.speed
+
+        return _differential_batch(l, r, self._trackwidth)
+
 
 class FourMotorDrivetrain:
     """
@@ -203,7 +501,8 @@ class FourMotorDrivetrain:
         self.kinematics = DifferentialDriveKinematics(trackwidth)
         self.speed = units.mps.m_from(speed, name="speed")
         self.wheelSpeeds = DifferentialDriveWheelSpeeds()
-        self.deadzone = deadzone
+        self.deadzone = _check_deadzone(deadzone)
+        self._trackwidth = trackwidth
 
     def calculate(
         self, lf_motor: float, lr_motor: float, rf_motor: float, rr_motor: float
@@ -235,6 +534,35 @@ class FourMotorDrivetrain:
 
         return self.kinematics.toChassisSpeeds(self.wheelSpeeds)
 
+    def calculate_batch(
+        self,
+        lf_motor: np.ndarray,
+        lr_motor: np.ndarray,
+        rf_motor: np.ndarray,
+        rr_motor: np.ndarray,
+    ) -> ChassisSpeedsBatch:
+        """
+        Same as :meth:`calculate`, but for arrays of motor values. The
+        results are identical to calling :meth:`calculate` for each set of
+        motor values, but :attr:`wheelSpeeds` is not updated.
+
+        :param lf_motor:   Left front motor values (-1 to 1); 1 is forward
+        :param lr_motor:   Left rear motor values (-1 to 1); 1 is forward
+        :param rf_motor:   Right front motor values (-1 to 1); -1 is forward
+        :param rr_motor:   Right rear motor values (-1 to 1); -1 is forward
+
+        .. versionadded:: 2026.1.0
+        """
+        lf_motor = _apply_deadzone_array(self.deadzone, lf_motor)
+        lr_motor = _apply_deadzone_array(self.deadzone, lr_motor)
+        rf_motor = _apply_deadzone_array(self.deadzone, rf_motor)
+        rr_motor = _apply_deadzone_array(self.deadzone, rr_motor)
+
+        l = (lf_motor + lr_motor) * 0.5 * self.speed
+        r = -(rf_motor + rr_motor) * 0.5 * self.speed
+
+        return _differential_batch(l, r, self._trackwidth)
+
 
 class MecanumDrivetrain:
     """
@@ -274,10 +602,27 @@ class MecanumDrivetrain:
         )
 
         self.speed = units.mps.m_from(speed, name="speed")
-        self.deadzone = deadzone
+        self.deadzone = _check_deadzone(deadzone)
 
         self.wheelSpeeds = MecanumDriveWheelSpeeds()
 
+        # The forward kinematics are linear, so precompute the coefficients
+        # once instead of solving the kinematics on every call. This also
+        # guarantees that calculate and calculate_batch perform the exact
+        # same floating point operations.
+        columns = []
+        for basis in np.eye(4):
+            speeds = self.kinematics.toChassisSpeeds(MecanumDriveWheelSpeeds(*basis))
+            columns.append((speeds.vx, speeds.vy, speeds.omega))
+
+        # rows of vx, vy, omega coefficients for (lf, rf, lr, rr)
+        self._forward = tuple(zip(*columns))
+
+    def _forward_kinematics(self, lf, rf, lr, rr):
+        return tuple(
+            c0 * lf + c1 * rf + c2 * lr + c3 * rr for c0, c1, c2, c3 in self._forward
+        )
+
     def calculate(
         self,
         lf_motor: float,
@@ -313,7 +658,121 @@ class MecanumDrivetrain:
         self.wheelSpeeds.frontRight = rf
         self.wheelSpeeds.rearRight = rr
 
-        return self.kinematics.toChassisSpeeds(self.wheelSpeeds)
+        return ChassisSpeeds(*self._forward_kinematics(lf, rf, lr, rr))
+
+    def calculate_batch(
+        self,
+        lf_motor: np.ndarray,
+        lr_motor: np.ndarray,
+        rf_motor: np.ndarray,
+        rr_motor: np.ndarray,
+    ) -> ChassisSpeedsBatch:
+        """
+        Same as :meth:`calculate`, but for arrays of motor values. The
+        results are identical to calling :meth:`calculate` for each set of
+        motor values, but :attr:`wheelSpeeds` is not updated.
+
+        :param lf_motor:   Left front motor values (-1 to 1); 1 is forward
+        :param lr_motor:   Left rear motor values (-1 to 1); 1 is forward
+        :param rf_motor:   Right front motor values (-1 to 1); -1 is forward
+        :param rr_motor:   Right rear motor values (-1 to 1); -1 is forward
+
+        .. versionadded:: 2026.1.0
+        """
+        lf_motor = _apply_deadzone_array(self.deadzone, lf_motor)
+        lr_motor = _apply_deadzone_array(self.deadzone, lr_motor)
+        rf_motor = _apply_deadzone_array(self.deadzone, rf_motor)
+        rr_motor = _apply_deadzone_array(self.deadzone, rr_motor)
+
+        lr = lr_motor * self.speed
+        rr = -rr_motor * self.speed
+        lf = lf_motor * self.speed
+        rf = -rf_motor * self.speed
+
+        vx, vy, omega = self._forward_kinematics(lf, rf, lr, rr)
+        return ChassisSpeedsBatch(vx, vy, omega, np.column_stack((lf, rf, lr, rr)))
+
+
+class SwerveDrivetrain:
+    """
+    Any number of swerve modules, each of which can be rotated in any
+    direction. Each module's position is specified relative to the center of
+    the robot, so modules don't need to be placed symmetrically.
+
+    The kinematics matrix for the module positions is computed once when the
+    drivetrain is created, and the chassis speeds are its least squares
+    solution for the given module velocities (which is what
+    :class:`wpimath.kinematics.SwerveDrive4Kinematics` computes for four
+    modules).
+
+    If any motors are inverted, then you will need to multiply that motor's
+    value by -1.
+
+    .. versionadded:: 2026.1.0
+    """
+
+    #: Module states you can use for encoder calculations (updated by calculate)
+    moduleStates: typing.List[SwerveModuleState]
+
+    def __init__(
+        self,
+        module_positions: typing.Sequence[Translation2d],
+        speed: units.Quantity = 5 * units.fps,
+        deadzone: typing.Optional[DeadzoneCallable] = None,
+    ):
+        """
+        :param module_positions: Location of each module relative to the center
+                                 of the robot (+x is forward, +y is left)
+        :param speed:            Speed of robot (see above)
+        :param deadzone:         A function that adjusts the output of the motor (see :func:`linear_deadzone`)
+        """
+        if len(module_positions) < 2:
+            raise ValueError("a swerve drivetrain requires at least two modules")
+
+        self.speed = units.mps.m_from(speed, name="speed")
+        self.deadzone = _check_deadzone(deadzone)
+
+        # each module's velocity is (vx - omega * y, vy + omega * x)
+        n = len(module_positions)
+        m = np.zeros((2 * n, 3))
+        for i, pos in enumerate(module_positions):
+            m[2 * i] = (1.0, 0.0, -pos.y)
+            m[2 * i + 1] = (0.0, 1.0, pos.x)
+
+        self._forward = np.linalg.pinv(m)
+
+        self.moduleStates = [SwerveModuleState() for _ in module_positions]
+
+    def calculate(
+        self, motors: typing.Sequence[float], angles: typing.Sequence[float]
+    ) -> ChassisSpeeds:
+        """
+        Given motor values and module angles, computes resulting chassis
+        speeds of robot
+
+        :param motors: Motor value of each module (-1 to 1); 1 is the
+                       direction the module is pointing
+        :param angles: Angle of each module in radians (0 is forward,
+                       counter-clockwise is positive)
+
+        :returns: ChassisSpeeds that can be passed to 'drive'
+        """
+        if self.deadzone:
+            motors = [self.deadzone(motor) for motor in motors]
+
+        speeds = np.asarray(motors, dtype=float) * self.speed
+        angles = np.asarray(angles, dtype=float)
+
+        velocities = np.empty(2 * len(speeds))
+        velocities[0::2] = speeds * np.cos(angles)
+        velocities[1::2] = speeds * np.sin(angles)
+
+        for state, speed, angle in zip(self.moduleStates, speeds, angles):
+            state.speed = float(speed)
+            state.angle = Rotation2d(float(angle))
+
+        vx, vy, omega = self._forward @ velocities
+        return ChassisSpeeds(float(vx), float(vy), float(omega))
 
 
 def four_motor_swerve_drivetrain(
@@ -353,6 +812,9 @@ def four_motor_swerve_drivetrain(
 
     :returns: ChassisSpeeds that can be passed to 'drive'
 
+    .. note:: :class:`SwerveDrivetrain` supports any number of modules
+              placed anywhere on the robot, and precomputes its geometry
+
     .. versionchanged:: 2020.1.0
 
        The output rotation angle was changed from CW to CCW to reflect the
@@ -360,6 +822,7 @@ def four_motor_swerve_drivetrain(
     """
 
     if deadzone:
+        _check_deadzone(deadzone)
         lf_motor = deadzone(lf_motor)
         lr_motor = deadzone(lr_motor)
         rf_motor = deadzone(rf_motor)
@@ -0,0 +1,493 @@
+"""
+.. versionadded:: 2026.1.0
+
+Models of common single degree of freedom mechanisms driven by DC motors:
+elevators, arms that rotate around a single joint, and flywheels. These
+are built from the same :class:`.MotorModelConfig` objects as the
+drivetrain models, and replace the hand written integration that is often
+found in ``update_sim``::
+
+    import wpilib.simulation
+
+    from pyfrc.physics import motor_cfgs
+    from pyfrc.physics.mechanisms import ElevatorModel
+    from pyfrc.physics.units import units
+
+    class PhysicsEngine:
+
+        def __init__(self, physics_controller, robot):
+            self.motor = wpilib.simulation.PWMSim(robot.elevator_motor)
+            self.encoder = wpilib.simulation.EncoderSim(robot.elevator_encoder)
+
+            self.elevator = ElevatorModel(
+                motor_cfgs.MOTOR_CFG_775PRO,
+                mass=5 * units.kg,
+                gearing=20,
+                drum_radius=1 * units.inch,
+                max_height=1.5 * units.m,
+            )
+
+        def update_sim(self, now, tm_diff):
+            height = self.elevator.calculate(self.motor.getSpeed(), tm_diff)
+            self.encoder.setDistance(height)
+
+Each mechanism is a linear system :math:`\\dot{x} = Ax + Bu` where the
+state is the position and velocity of the mechanism, and the inputs are
+the motor voltage and gravity. The system is discretized exactly for each
+timestep (see :func:`.discretize_ab`), and the coefficients are cached per
+timestep (rounded to the microsecond), so when ``tm_diff`` doesn't change
+each step is a dictionary lookup and a handful of floating point
+operations. Gravity is held
+constant during each step, which is exact for elevators and a good
+approximation for arms as long as the timestep is small.
+
+When a mechanism reaches one of its limits (hard stops), it stops there
+and its velocity is set to zero.
+
+Positions and velocities are in meters (elevator) or radians (arm,
+flywheel), and seconds.
+
+For mechanisms whose speed is simply proportional to the motor value, see
+:class:`.LinearMotion` and :class:`.MechanismBank`.
+"""
+
+import functools
+import math
+import typing
+
+import numpy as np
+
+from .motor_cfgs import MotorModelConfig
+from .statespace import _applied_voltage, _timestep_key, discretize_ab
+from .units import units
+
+#: Acceleration due to gravity (m/s^2)
+GRAVITY = 9.80665
+
+
+def _motor_gains(
+    motor_config: MotorModelConfig, gearing: float, nmotors: int
+) -> typing.Tuple[float, float, float]:
+    # Returns the nominal voltage, the output torque per volt, and the
+    # back-EMF torque per rad/s of output speed of a gearbox
+    voltage = units.volts.m_from(
+        motor_config.nominalVoltage, strict=False, name="motor_config.nominalVoltage"
+    )
+    stall_torque = units.N_m.m_from(
+        motor_config.stallTorque, name="motor_config.stallTorque"
+    )
+    stall_current = units.amp.m_from(
+        motor_config.stallCurrent, name="motor_config.stallCurrent"
+    )
+    free_current = units.amp.m_from(
+        motor_config.freeCurrent, name="motor_config.freeCurrent"
+    )
+    free_speed = (
+        units.cpm.m_from(motor_config.freeSpeed, name="motor_config.freeSpeed")
+        * 2
+        * math.pi
+        / 60.0
+    )
+
+    resistance = voltage / stall_current
+    kt = stall_torque / stall_current
+    kv = free_speed / (voltage - resistance * free_current)
+
+    torque_per_volt = nmotors * gearing * kt / resistance
+    damping = torque_per_volt * gearing / kv
+    return voltage, torque_per_volt, damping
+
+
+class _MechanismModel:
+    # Position/velocity mechanism with optional hard stops. Subclasses set
+    # self.A and self.B; B has two columns: volts and gravity.
+
+    def __init__(
+        self,
+        motor_config: MotorModelConfig,
+        gearing: float,
+        nmotors: int,
+        vintercept: units.volts,
+        min_position: typing.Optional[float],
+        max_position: typing.Optional[float],
+        cache_size: int,
+    ):
+        self._nominal_voltage, self._torque_per_volt, self._damping = _motor_gains(
+            motor_config, gearing, nmotors
+        )
+        self._vi = units.volts.m_from(vintercept, strict=False, name="vintercept")
+
+        self.min_position = -math.inf if min_position is None else min_position
+        self.max_position = math.inf if max_position is None else max_position
+        if self.min_position > self.max_position:
+            raise ValueError("minimum position is larger than maximum position")
+
+        self._position = min(max(0.0, self.min_position), self.max_position)
+        self._velocity = 0.0
+
+        self._discretize = functools.lru_cache(maxsize=cache_size)(
+            self._discretize_uncached
+        )
+
+    def _discretize_uncached(self, dt: float) -> typing.Tuple[float, ...]:
+        ad, bd = discretize_ab(self.A, self.B, dt)
+        return (
+            float(ad[0, 0]),
+            float(ad[0, 1]),
+            float(ad[1, 0]),
+            float(ad[1, 1]),
+            float(bd[0, 0]),
+            float(bd[0, 1]),
+            float(bd[1, 0]),
+            float(bd[1, 1]),
+        )
+
+    def cache_info(self):
+        """Returns hit/miss statistics of the discretization cache"""
+        return self._discretize.cache_info()
+
+    @property
+    def position(self) -> float:
+        """Current position of the mechanism"""
+        return self._position
+
+    @property
+    def velocity(self) -> float:
+        """Current velocity of the mechanism"""
+        return self._velocity
+
+    def reset(self, position: float = 0.0, velocity: float = 0.0):
+        """Moves the mechanism to ``position`` (within its limits)"""
+        self._position = min(max(position, self.min_position), self.max_position)
+        self._velocity = velocity
+
+    def _gravity(self, position: float) -> float:
+        return 1.0
+
+    def _advance(
+        self, coeffs: typing.Tuple[float, ...], x: float, v: float, volts: float
+    ) -> typing.Tuple[float, float]:
+        a00, a01, a10, a11, b00, b01, b10, b11 = coeffs
+        g = self._gravity(x)
+        x1 = a00 * x + a01 * v + b00 * volts + b01 * g
+        v1 = a10 * x + a11 * v + b10 * volts + b11 * g
+
+        if x1 < self.min_position:
+            x1 = self.min_position
+            v1 = max(v1, 0.0)
+        elif x1 > self.max_position:
+            x1 = self.max_position
+            v1 = min(v1, 0.0)
+
+        return x1, v1
+
+    def calculate(self, motor_pct: float, tm_diff: float) -> float:
+        """
+        Advances the mechanism by one timestep. Each call costs a cache
+        lookup and about a dozen floating point operations.
+
+        :param motor_pct: Motor value (-1 to 1)
+        :param tm_diff:   Elapsed time since the last call (seconds)
+
+        :returns: the new position of the mechanism
+        """
+        volts = _applied_voltage(motor_pct, self._nominal_voltage, self._vi)
+        self._position, self._velocity = self._advance(
+            self._discretize(_timestep_key(tm_diff)),
+            self._position,
+            self._velocity,
+            volts,
+        )
+        return self._position
+
+    def rollout(
+        self,
+        motor_pcts: typing.Union[typing.Sequence[float], np.ndarray],
+        tm_diff: float,
+    ) -> np.ndarray:
+        """
+        Computes the positions and velocities that the mechanism would
+        have if the motor values were applied one after another, starting
+        from the current state, without changing the state of the model.
+        Useful for testing controllers. The hard stops (and for arms,
+        gravity) make each step depend on the previous one, so this costs
+        the same per step as :meth:`calculate`, but the discretization is
+        only looked up once.
+
+        :param motor_pcts: Motor value (-1 to 1) for each step
+        :param tm_diff:    Length of each step (seconds)
+
+        :returns: array of shape ``(N, 2)`` with the position and velocity
+                  after each step
+        """
+        coeffs = self._discretize(_timestep_key(tm_diff))
+        nominal = self._nominal_voltage
+        vi = self._vi
+        advance = self._advance
+
+        x = self._position
+        v = self._velocity
+        out = np.empty((len(motor_pcts), 2))
+        for i, motor_pct in enumerate(np.asarray(motor_pcts, dtype=float).tolist()):
+            x, v = advance(coeffs, x, v, _applied_voltage(motor_pct, nominal, vi))
+            out[i] = x, v
+        return out
+
+
+class ElevatorModel(_MechanismModel):
+    """
+    A carriage lifted by a cable wound around a drum. Position is the
+    height of the carriage in meters.
+    """
+
+    def __init__(
+        self,
+        motor_config: MotorModelConfig,
+        mass: units.Quantity,
+        gearing: float,
+        drum_radius: units.Quantity,
+        nmotors: int = 1,
+        min_height: units.Quantity = 0 * units.m,
+        max_height: typing.Optional[units.Quantity] = None,
+        gravity: bool = True,
+        vintercept: units.volts = 0 * units.volts,
+        cache_size: int = 32,
+    ):
+        """
+        :param motor_config: Motor specification
+        :param mass:         Mass of the carriage
+        :param gearing:      Gear ratio between the motor and the drum
+        :param drum_radius:  Radius of the drum
+        :param nmotors:      Number of motors
+        :param min_height:   Lower hard stop (None for no limit)
+        :param max_height:   Upper hard stop (None for no limit)
+        :param gravity:      Whether gravity pulls the carriage down
+        :param vintercept:   Voltage needed to overcome static friction
+        :param cache_size:   Number of timesteps to cache discretized
+                             dynamics for
+        """
+        super().__init__(
+            motor_config,
+            gearing,
+            nmotors,
+            vintercept,
+            (
+                None
+                if min_height is None
+                else units.meters.m_from(min_height, name="min_height")
+            ),
+            (
+                None
+                if max_height is None
+                else units.meters.m_from(max_height, name="max_height")
+            ),
+            cache_size,
+        )
+
+        mass = units.kilogram.m_from(mass, name="mass")
+        r = units.meters.m_from(drum_radius, name="drum_radius")
+
+        #: Continuous system matrix
+        self.A = np.array([[0.0, 1.0], [0.0, -self._damping / (r * r * mass)]])
+        #: Continuous input matrix (volts, gravity)
+        self.B = np.array(
+            [[0.0, 0.0], [self._torque_per_volt / (r * mass), -GRAVITY * gravity]]
+        )
+
+
+class ArmModel(_MechanismModel):
+    """
+    An arm that rotates around a horizontal joint. Position is the angle
+    of the arm in radians, where 0 is horizontal and positive is up.
+    """
+
+    def __init__(
+        self,
+        motor_config: MotorModelConfig,
+        mass: units.Quantity,
+        gearing: float,
+        arm_length: units.Quantity,
+        nmotors: int = 1,
+        moi: typing.Optional[units.Quantity] = None,
+        min_angle: typing.Optional[units.Quantity] = None,
+        max_angle: typing.Optional[units.Quantity] = None,
+        gravity: bool = True,
+        vintercept: units.volts = 0 * units.volts,
+        cache_size: int = 32,
+    ):
+        """
+        :param motor_config: Motor specification
+        :param mass:         Mass of the arm
+        :param gearing:      Gear ratio between the motor and the joint
+        :param arm_length:   Length of the arm. Its center of mass is
+                             assumed to be in the middle.
+        :param nmotors:      Number of motors
+        :param moi:          Moment of inertia around the joint
+                             (``[mass] * [length]**2``). Defaults to that
+                             of a uniform rod.
+        :param min_angle:    Lower hard stop (None for no limit)
+        :param max_angle:    Upper hard stop (None for no limit)
+        :param gravity:      Whether gravity pulls the arm down
+        :param vintercept:   Voltage needed to overcome static friction
+        :param cache_size:   Number of timesteps to cache discretized
+                             dynamics for
+        """
+        super().__init__(
+            motor_config,
+            gearing,
+            nmotors,
+            vintercept,
+            (
+                None
+                if min_angle is None
+                else units.radians.m_from(min_angle, name="min_angle")
+            ),
+            (
+                None
+                if max_angle is None
+                else units.radians.m_from(max_angle, name="max_angle")
+            ),
+            cache_size,
+        )
+
+        mass = units.kilogram.m_from(mass, name="mass")
+        length = units.meters.m_from(arm_length, name="arm_length")
+        if moi is None:
+            j = mass * length * length / 3.0
+        else:
+            j = (units.kilogram * units.meter**2).m_from(moi, name="moi")
+
+        self.A = np.array([[0.0, 1.0], [0.0, -self._damping / j]])
+        # gravity torque is m * g * (L / 2) * cos(angle); the cosine is
+        # evaluated at the start of each step
+        self.B = np.array(
+            [
+                [0.0, 0.0],
+                [
+                    self._torque_per_volt / j,
+                    -GRAVITY * mass * length * 0.5 * gravity / j,
+                ],
+            ]
+        )
+
+    def _gravity(self, position: float) -> float:
+        return math.cos(position)
+
+
+class FlywheelModel:
+    """
+    A spinning wheel with no limits and no gravity. Velocity is in radians
+    per second.
+    """
+
+    def __init__(
+        self,
+        motor_config: MotorModelConfig,
+        moi: units.Quantity,
+        gearing: float,
+        nmotors: int = 1,
+        vintercept: units.volts = 0 * units.volts,
+        cache_size: int = 32,
+    ):
+        """
+        :param motor_config: Motor specification
+        :param moi:          Moment of inertia of the flywheel
+                             (``[mass] * [length]**2``)
+        :param gearing:      Gear ratio between the motor and the flywheel
+        :param nmotors:      Number of motors
+        :param vintercept:   Voltage needed to overcome static friction
+        :param cache_size:   Number of timesteps to cache discretized
+                             dynamics for
+        """
+        self._nominal_voltage, torque_per_volt, damping = _motor_gains(
+            motor_config, gearing, nmotors
+        )
+        self._vi = units.volts.m_from(vintercept, strict=False, name="vintercept")
+
+        j = (units.kilogram * units.meter**2).m_from(moi, name="moi")
+
+        self.A = np.array([[-damping / j]])
+        self.B = np.array([[torque_per_volt / j]])
+
+        self._velocity = 0.0
+
+        self._discretize = functools.lru_cache(maxsize=cache_size)(
+            self._discretize_uncached
+        )
+
+    def _discretize_uncached(self, dt: float) -> typing.Tuple[float, float]:
+        ad, bd = discretize_ab(self.A, self.B, dt)
+        return float(ad[0, 0]), float(bd[0, 0])
+
+    def cache_info(self):
+        """Returns hit/miss statistics of the discretization cache"""
+        return self._discretize.cache_info()
+
+    @property
+    def velocity(self) -> float:
+        """Current velocity of the flywheel (rad/s)"""
+        return self._velocity
+
+    @property
+    def rpm(self) -> float:
+        """Current velocity of the flywheel (revolutions per minute)"""
+        return self._velocity * 60.0 / (2 * math.pi)
+
+    def reset(self, velocity: float = 0.0):
+        """Sets the velocity of the flywheel (rad/s)"""
+        self._velocity = velocity
+
+    def calculate(self, motor_pct: float, tm_diff: float) -> float:
+        """
+        Advances the flywheel by one timestep. Each call costs a cache
+        lookup and a few floating point operations.
+
+        :param motor_pct: Motor value (-1 to 1)
+        :param tm_diff:   Elapsed time since the last call (seconds)
+
+        :returns: the new velocity of the flywheel
+        """
+        a, b = self._discretize(_timestep_key(tm_diff))
+        volts = _applied_voltage(motor_pct, self._nominal_voltage, self._vi)
+        self._velocity = a * self._velocity + b * volts
+        return self._velocity
+
+    def rollout(
+        self,
+        motor_pcts: typing.Union[typing.Sequence[float], np.ndarray],
+        tm_diff: float,
+    ) -> np.ndarray:
+        """
+        Computes the velocities that the flywheel would have if the motor
+        values were applied one after another, without changing the state
+        of the model. The discretized system is linear, so this is computed
+        with cumulative sums over the array instead of a Python loop: the
+        cost is a few NumPy operations per several hundred steps.
+
+        :param motor_pcts: Motor value (-1 to 1) for each step
+        :param tm_diff:    Length of each step (seconds)
+
+        :returns: array with the velocity after each step
+        """
+        a, b = self._discretize(_timestep_key(tm_diff))
+        u = np.asarray(motor_pcts, dtype=float) * self._nominal_voltage
+        u = np.sign(u) * np.maximum(np.abs(u) - self._vi, 0.0)
+
+        # The velocity after k steps is a**k * (v0 + sum(b * u[j] / a**(j+1))).
+        # a**k shrinks quickly, so this is evaluated in chunks that are
+        # short enough to keep the division accurate.
+        n = len(u)
+        out = np.empty(n)
+        chunk = max(1, int(math.log(1e-6) / math.log(a))) if 0 < a < 1 else 1
+        v = self._velocity
+        for start in range(0, n, chunk):
+            uc = u[start : start + chunk]
+            if a > 0:
+                powers = a ** np.arange(1, len(uc) + 1)
+                vc = powers * (v + np.cumsum(b * uc / powers))
+            else:
+                vc = b * uc
+            out[start : start + chunk] = vc
+            v = float(vc[-1])
+
+        return out
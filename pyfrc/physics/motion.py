@@ -1,6 +1,9 @@
-import hal
+import math
 import typing
 
+import hal
+import numpy as np
+
 
 class LinearMotion:
     """
@@ -58,6 +61,7 @@ class LinearMotion:
 
         self.device = hal.SimDevice(self.name)
         self.position = self.device.createDouble("position", True, 0.0)
+        self._written = 0.0
 
     def compute(self, motor_val, tm_diff):
         self.position_ft += motor_val * tm_diff * self.motor_ft_per_sec
@@ -70,5 +74,218 @@ class LinearMotion:
         self.position_ticks = int(self.position_ft * self.ticks_per_feet)
 
         # This causes a label to be rendered in the UI
-        self.position.set(self.position_ft)
+        if self.position_ft != self._written:
+            self._written = self.position_ft
+            self.position.set(self.position_ft)
         return self.position_ticks
+
+
+class MechanismBank:
+    """
+    Simulates many mechanisms like :class:`LinearMotion` at once. The
+    position, speed and limits of each mechanism are stored in NumPy arrays,
+    and :meth:`compute` advances all of them in a single vectorized step::
+
+        import wpilib.simulation
+        from pyfrc.physics.motion import MechanismBank
+
+        class PhysicsEngine:
+
+            def __init__(self, physics_controller):
+                self.bank = MechanismBank()
+                self.bank.add_linear("Elevator", 2, 360, max_position=6)
+                self.bank.add_rotary("Turret", 180, 4096, -90, 90)
+
+                self.motors = [
+                    wpilib.simulation.PWMSim(0),
+                    wpilib.simulation.PWMSim(1),
+                ]
+                self.encoders = [
+                    wpilib.simulation.EncoderSim.createForChannel(0),
+                    wpilib.simulation.EncoderSim.createForChannel(2),
+                ]
+
+            def update_sim(self, now, tm_diff):
+                ticks = self.bank.compute(
+                    [motor.getSpeed() for motor in self.motors], tm_diff
+                )
+                for encoder, count in zip(self.encoders, ticks.tolist()):
+                    encoder.setCount(count)
+
+    Positions are shown in the simulation UI, but to keep updates cheap
+    they are only written when they have changed, and at most once every
+    ``write_period`` seconds.
+
+    Like :class:`LinearMotion`, the speed of each mechanism is proportional
+    to its motor value. To model motors, mass and gravity, use the models
+    in :mod:`pyfrc.physics.mechanisms` instead.
+
+    .. versionadded:: 2026.1.0
+    """
+
+    def __init__(self, write_period: float = 0.1):
+        """
+        :param write_period: Minimum time between updates of the positions
+                             shown in the simulation UI (seconds)
+        """
+        self.write_period = write_period
+
+        #: Names of the mechanisms
+        self.names: typing.List[str] = []
+
+        #: Current position of each mechanism
+        self.positions = np.zeros(0)
+        #: Current speed of each mechanism (units per second)
+        self.velocities = np.zeros(0)
+        #: Current position of each mechanism (encoder ticks)
+        self.ticks = np.zeros(0, dtype=np.int64)
+
+        self._speeds = np.zeros(0)
+        self._ticks_per_unit = np.zeros(0)
+        self._min = np.zeros(0)
+        self._max = np.zeros(0)
+        self._written = np.zeros(0)
+        self._scratch = np.zeros(0)
+
+        self._devices: typing.List[hal.SimDevice] = []
+        self._values: typing.List[hal.SimDouble] = []
+
+        self._elapsed = 0.0
+        self._last_write = -math.inf
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add_linear(
+        self,
+        name: str,
+        motor_ft_per_sec: float,
+        ticks_per_feet: float,
+        max_position: typing.Optional[float] = None,
+        min_position: typing.Optional[float] = 0,
+    ) -> int:
+        """
+        Adds a mechanism that moves in a straight line. The parameters are
+        the same as :class:`LinearMotion`, except that ``min_position`` is
+        used even when ``max_position`` is None.
+
+        :returns: index of the mechanism
+        """
+        return self._add(
+            name,
+            "position",
+            motor_ft_per_sec,
+            ticks_per_feet,
+            min_position,
+            max_position,
+        )
+
+    def add_rotary(
+        self,
+        name: str,
+        motor_deg_per_sec: float,
+        ticks_per_rev: float,
+        min_angle: typing.Optional[float] = None,
+        max_angle: typing.Optional[float] = None,
+    ) -> int:
+        """
+        Adds a mechanism that rotates, such as a turret or an arm. Its
+        position is in degrees.
+
+        :param name: Name of the mechanism, shown in simulation UI
+        :param motor_deg_per_sec: Speed of the mechanism at full power
+        :param ticks_per_rev: Number of encoder ticks per revolution
+        :param min_angle: Minimum angle that the mechanism rotates to
+        :param max_angle: Maximum angle that the mechanism rotates to
+
+        :returns: index of the mechanism
+        """
+        return self._add(
+            name,
+            "angle",
+            motor_deg_per_sec,
+            ticks_per_rev / 360.0,
+            min_angle,
+            max_angle,
+        )
+
+    def _add(self, name, value_name, speed, ticks_per_unit, lo, hi) -> int:
+        lo = -math.inf if lo is None else lo
+        hi = math.inf if hi is None else hi
+        if lo > hi:
+            raise ValueError(f"{name}: minimum position is larger than maximum")
+
+        start = min(max(0.0, lo), hi)
+
+        self.names.append(name)
+        self.positions = np.append(self.positions, start)
+        self.velocities = np.append(self.velocities, 0.0)
+        self.ticks = np.append(self.ticks, int(start * ticks_per_unit))
+        self._speeds = np.append(self._speeds, speed)
+        self._ticks_per_unit = np.append(self._ticks_per_unit, ticks_per_unit)
+        self._min = np.append(self._min, lo)
+        self._max = np.append(self._max, hi)
+        self._written = np.append(self._written, start)
+        self._scratch = np.zeros(len(self.positions))
+
+        device = hal.SimDevice(name)
+        self._devices.append(device)
+        self._values.append(device.createDouble(value_name, True, start))
+
+        return len(self.names) - 1
+
+    def index(self, name: str) -> int:
+        """:returns: index of the mechanism called ``name``"""
+        return self.names.index(name)
+
+    def set_position(self, index: int, position: float):
+        """Moves a mechanism to ``position`` (within its limits)"""
+        position = min(max(position, self._min[index]), self._max[index])
+        self.positions[index] = position
+        self.ticks[index] = int(position * self._ticks_per_unit[index])
+
+    def compute(
+        self, motor_vals: typing.Union[typing.Sequence[float], np.ndarray], tm_diff
+    ) -> np.ndarray:
+        """
+        :param motor_vals: Motor value (-1 to 1) of each mechanism, in the
+                           order that they were added
+        :param tm_diff:    Elapsed time since the last update (seconds)
+
+        :returns: array with the position of each mechanism in encoder
+                  ticks. The array is reused by the next update.
+        """
+        velocities = self.velocities
+        positions = self.positions
+        scratch = self._scratch
+
+        np.multiply(motor_vals, self._speeds, out=velocities)
+        np.multiply(velocities, tm_diff, out=scratch)
+        positions += scratch
+        np.clip(positions, self._min, self._max, out=positions)
+
+        # truncate towards zero, like int()
+        ticks = self.ticks
+        np.multiply(positions, self._ticks_per_unit, out=scratch)
+        np.trunc(scratch, out=scratch)
+        ticks[:] = scratch
+
+        self._elapsed += tm_diff
+        if self._elapsed - self._last_write >= self.write_period:
+            self.flush()
+
+        return ticks
+
+    def flush(self):
+        """
+        Writes the positions that have changed to the simulation UI,
+        regardless of ``write_period``
+        """
+        self._last_write = self._elapsed
+
+        changed = np.flatnonzero(self.positions != self._written)
+        if len(changed):
+            self._written[changed] = self.positions[changed]
+            values = self._values
+            for i, position in zip(changed.tolist(), self.positions[changed].tolist()):
+                values[i].set(position)
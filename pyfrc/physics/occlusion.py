@@ -0,0 +1,256 @@
+"""
+.. versionadded:: 2026.1.0
+
+Determines whether the line of sight between a camera and its targets is
+blocked by field elements or other robots. This is used by
+:class:`.VisionSim` and :class:`.MultiCameraVisionSim` when they are given
+an ``occluder``::
+
+    from pyfrc.physics.collision import CollisionMap
+    from pyfrc.physics.occlusion import Occluder
+
+    collision_map = CollisionMap.load("field.json")
+    occluder = Occluder.from_collision_map(collision_map)
+
+    vision_sim = VisionSim.from_apriltag_layout(
+        "layout.json", 70, 0.3, 6, occluder=occluder
+    )
+
+Field geometry is stored as line segments in a bounding volume hierarchy
+(BVH). The rays from the camera to all candidate targets are traced through
+the hierarchy together, one level at a time, so the cost of each frame
+grows with the logarithm of the number of segments rather than linearly.
+Other robots are modeled as circles, and can be provided by an
+:class:`.OpponentRobots` instance.
+"""
+
+import typing
+
+import numpy as np
+
+from .collision import CollisionMap, Segment
+from .opponents import OpponentRobots
+
+# rays that end this close to a segment (as a fraction of the ray length)
+# are not blocked by it, so that targets mounted on walls are visible
+_END_TOLERANCE = 1e-6
+
+
+class Occluder:
+    """
+    Ray casting against static field geometry and (optionally) robots
+    """
+
+    def __init__(
+        self,
+        segments: typing.Sequence[Segment],
+        opponents: typing.Optional[OpponentRobots] = None,
+        robot_radius: float = 0.45,
+        leaf_size: int = 4,
+    ):
+        """
+        :param segments:     Field geometry as (x1, y1, x2, y2) tuples
+        :param opponents:    Robots that block the view
+        :param robot_radius: Radius of each robot in ``opponents``
+        :param leaf_size:    Maximum number of segments in each leaf of the BVH
+        """
+        self.opponents = opponents
+        self.robot_radius = robot_radius
+
+        segs = np.array(segments, dtype=float).reshape(-1, 4)
+
+        # nodes are stored in arrays; leaves have left == -1 and refer to
+        # a range of self._segs
+        self._lo: typing.List[typing.Tuple[float, float]] = []
+        self._hi: typing.List[typing.Tuple[float, float]] = []
+        self._left: typing.List[int] = []
+        self._right: typing.List[int] = []
+        self._start: typing.List[int] = []
+        self._count: typing.List[int] = []
+
+        order: typing.List[int] = []
+        if len(segs):
+            self._build(segs, np.arange(len(segs)), order, leaf_size)
+
+        self._segs = segs[order] if len(segs) else segs
+        self._node_lo = np.array(self._lo, dtype=float).reshape(-1, 2)
+        self._node_hi = np.array(self._hi, dtype=float).reshape(-1, 2)
+        self._node_left = np.array(self._left, dtype=np.intp)
+        self._node_right = np.array(self._right, dtype=np.intp)
+        self._node_start = np.array(self._start, dtype=np.intp)
+        self._node_count = np.array(self._count, dtype=np.intp)
+
+    @classmethod
+    def from_collision_map(cls, collision_map: CollisionMap, **kwargs) -> "Occluder":
+        """Uses the segments of a :class:`.CollisionMap` as the field geometry"""
+        return cls(collision_map.segments, **kwargs)
+
+    def _build(
+        self,
+        segs: np.ndarray,
+        idx: np.ndarray,
+        order: typing.List[int],
+        leaf_size: int,
+    ) -> int:
+        s = segs[idx]
+        lo = np.minimum(s[:, :2], s[:, 2:]).min(axis=0)
+        hi = np.maximum(s[:, :2], s[:, 2:]).max(axis=0)
+
+        node = len(self._lo)
+        self._lo.append(tuple(lo))
+        self._hi.append(tuple(hi))
+        self._left.append(-1)
+        self._right.append(-1)
+        self._start.append(len(order))
+        self._count.append(0)
+
+        if len(idx) <= leaf_size:
+            order.extend(idx.tolist())
+            self._count[node] = len(idx)
+            return node
+
+        # split at the median centroid along the longest axis
+        axis = int(np.argmax(hi - lo))
+        centroid = (s[:, axis] + s[:, axis + 2]) * 0.5
+        sorted_idx = idx[np.argsort(centroid, kind="stable")]
+        half = len(idx) // 2
+
+        self._left[node] = self._build(segs, sorted_idx[:half], order, leaf_size)
+        self._right[node] = self._build(segs, sorted_idx[half:], order, leaf_size)
+        return node
+
+    def blocked(self, x: float, y: float, tx: np.ndarray, ty: np.ndarray) -> np.ndarray:
+        """
+        :param x:  Camera x position
+        :param y:  Camera y position
+        :param tx: Target x positions
+        :param ty: Target y positions
+
+        :returns: boolean array that is True for each target that can't be
+                  seen from the camera
+        """
+        tx = np.asarray(tx, dtype=float)
+        ty = np.asarray(ty, dtype=float)
+        dx = tx - x
+        dy = ty - y
+
+        blocked = np.zeros(len(tx), dtype=bool)
+        if len(self._node_lo) and len(tx):
+            self._trace(x, y, dx, dy, blocked)
+
+        opponents = self.opponents
+        if opponents is not None and len(opponents.x):
+            blocked |= self._robots_block(x, y, dx, dy)
+
+        return blocked
+
+    def _trace(
+        self, x: float, y: float, dx: np.ndarray, dy: np.ndarray, blocked: np.ndarray
+    ):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_dx = 1.0 / dx
+            inv_dy = 1.0 / dy
+
+        # (ray, node) pairs that still need to be checked
+        rays = np.arange(len(dx))
+        nodes = np.zeros(len(dx), dtype=np.intp)
+
+        while len(rays):
+            # slab test of each ray segment against its node's bounding box
+            lo = self._node_lo[nodes]
+            hi = self._node_hi[nodes]
+            rdx = dx[rays]
+            rdy = dy[rays]
+            with np.errstate(invalid="ignore"):
+                t1 = (lo[:, 0] - x) * inv_dx[rays]
+                t2 = (hi[:, 0] - x) * inv_dx[rays]
+                t3 = (lo[:, 1] - y) * inv_dy[rays]
+                t4 = (hi[:, 1] - y) * inv_dy[rays]
+
+            # rays parallel to an axis only hit if they are inside the slab
+            inside_x = (x >= lo[:, 0]) & (x <= hi[:, 0])
+            inside_y = (y >= lo[:, 1]) & (y <= hi[:, 1])
+            tminx = np.where(
+                rdx == 0, np.where(inside_x, -np.inf, np.inf), np.minimum(t1, t2)
+            )
+            tmaxx = np.where(
+                rdx == 0, np.where(inside_x, np.inf, -np.inf), np.maximum(t1, t2)
+            )
+            tminy = np.where(
+                rdy == 0, np.where(inside_y, -np.inf, np.inf), np.minimum(t3, t4)
+            )
+            tmaxy = np.where(
+                rdy == 0, np.where(inside_y, np.inf, -np.inf), np.maximum(t3, t4)
+            )
+
+            tmin = np.maximum(tminx, tminy)
+            tmax = np.minimum(tmaxx, tmaxy)
+            hit = (tmax >= tmin) & (tmax >= 0) & (tmin <= 1) & ~blocked[rays]
+
+            rays = rays[hit]
+            nodes = nodes[hit]
+
+            left = self._node_left[nodes]
+            leaf = left < 0
+
+            if leaf.any():
+                self._test_leaves(x, y, dx, dy, rays[leaf], nodes[leaf], blocked)
+
+            inner = ~leaf
+            rays = np.concatenate((rays[inner], rays[inner]))
+            nodes = np.concatenate((left[inner], self._node_right[nodes[inner]]))
+
+    def _test_leaves(
+        self,
+        x: float,
+        y: float,
+        dx: np.ndarray,
+        dy: np.ndarray,
+        rays: np.ndarray,
+        nodes: np.ndarray,
+        blocked: np.ndarray,
+    ):
+        # expand each (ray, leaf) pair into (ray, segment) pairs
+        counts = self._node_count[nodes]
+        rays = np.repeat(rays, counts)
+        offsets = np.arange(len(rays)) - np.repeat(np.cumsum(counts) - counts, counts)
+        segs = self._segs[np.repeat(self._node_start[nodes], counts) + offsets]
+
+        rdx = dx[rays]
+        rdy = dy[rays]
+        sx = segs[:, 2] - segs[:, 0]
+        sy = segs[:, 3] - segs[:, 1]
+        qx = segs[:, 0] - x
+        qy = segs[:, 1] - y
+
+        denom = rdx * sy - rdy * sx
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (qx * sy - qy * sx) / denom
+            u = (qx * rdy - qy * rdx) / denom
+
+        # parallel segments never block
+        hit = (denom != 0) & (t >= 0) & (t < 1 - _END_TOLERANCE) & (u >= 0) & (u <= 1)
+        blocked[rays[hit]] = True
+
+    def _robots_block(
+        self, x: float, y: float, dx: np.ndarray, dy: np.ndarray
+    ) -> np.ndarray:
+        # distance from each robot center to each ray segment
+        cx = self.opponents.x[None, :] - x
+        cy = self.opponents.y[None, :] - y
+        rdx = dx[:, None]
+        rdy = dy[:, None]
+
+        length2 = rdx * rdx + rdy * rdy
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.clip((cx * rdx + cy * rdy) / length2, 0.0, 1.0)
+        t = np.nan_to_num(t)
+
+        ex = cx - rdx * t
+        ey = cy - rdy * t
+        r2 = self.robot_radius * self.robot_radius
+
+        # a target on a robot isn't hidden by that robot
+        fx = cx - rdx
+        fy = cy - rdy
+        return ((ex * ex + ey * ey <= r2) & (fx * fx + fy * fy > r2)).any(axis=1)
@@ -0,0 +1,308 @@
+"""
+.. versionadded:: 2026.1.0
+
+Scripted robots that move around the simulated field, so that code that
+needs to react to other robots (such as defense or collision avoidance)
+can be tested. Each robot either drives through a list of waypoints at a
+constant speed, or replays a recorded list of timestamped poses.
+
+The state of all robots is stored in NumPy arrays and advanced in a single
+vectorized step. Register the robots with
+:meth:`.PhysicsInterface.add_opponents`, and they will be updated each
+time the physics engine runs and shown on the field as a single object::
+
+    from pyfrc.physics.opponents import OpponentRobots
+    from pyfrc.physics.units import units
+    from wpimath.geometry import Translation2d
+
+    class PhysicsEngine:
+
+        def __init__(self, physics_controller):
+            self.physics_controller = physics_controller
+
+            self.opponents = OpponentRobots()
+            self.opponents.add_waypoints(
+                [Translation2d(3, 2), Translation2d(12, 2), Translation2d(12, 6)],
+                speed=10 * units.fps,
+            )
+            physics_controller.add_opponents(self.opponents)
+
+        def update_sim(self, now, tm_diff):
+            pose = self.physics_controller.get_pose()
+            indices, distances, bearings = self.opponents.query(pose, 2.0)
+            ...
+
+Positions are in meters, as used by the field.
+"""
+
+import math
+import typing
+
+import numpy as np
+from wpimath.geometry import Pose2d, Rotation2d, Translation2d
+
+from .units import units
+
+
+class OpponentRobots:
+    """
+    A group of scripted robots. Paths are converted to a padded table of
+    timestamped poses (one row per robot), and each update only advances a
+    per-robot cursor into that table, so the cost of an update doesn't
+    depend on the length of the paths.
+    """
+
+    def __init__(self):
+        self._paths: typing.List[
+            typing.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, bool]
+        ] = []
+
+        #: x position of each robot (meters)
+        self.x = np.zeros(0)
+        #: y position of each robot (meters)
+        self.y = np.zeros(0)
+        #: heading of each robot (radians, -pi to pi)
+        self.heading = np.zeros(0)
+
+        self._start: typing.Optional[float] = None
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def add_waypoints(
+        self,
+        waypoints: typing.Sequence[typing.Union[Translation2d, Pose2d]],
+        speed: units.Quantity,
+        loop: bool = True,
+    ) -> int:
+        """
+        Adds a robot that drives through ``waypoints`` at a constant speed.
+        If the waypoints are :class:`Pose2d` the robot turns to match their
+        headings, otherwise the robot faces the direction it's moving.
+
+        :param waypoints: Points to drive through, in order
+        :param speed:     Speed of the robot
+        :param loop:      When the last waypoint is reached, drive back to
+                          the first waypoint and start over
+
+        :returns: index of the new robot
+        """
+        if len(waypoints) < 2:
+            raise ValueError("at least two waypoints are required")
+
+        speed = units.mps.m_from(speed, name="speed")
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+
+        waypoints = list(waypoints)
+        if loop:
+            waypoints.append(waypoints[0])
+
+        x = np.array([wp.X() for wp in waypoints], dtype=float)
+        y = np.array([wp.Y() for wp in waypoints], dtype=float)
+        times = np.concatenate(([0.0], np.cumsum(np.hypot(np.diff(x), np.diff(y)))))
+        if times[-1] <= 0:
+            raise ValueError("waypoints must not all be at the same position")
+        times /= speed
+
+        if isinstance(waypoints[0], Pose2d):
+            heading = np.array([wp.rotation().radians() for wp in waypoints])
+        else:
+            # Face the direction of each segment. Each segment gets its own
+            # start and end point, so the robot turns instantly at each
+            # waypoint instead of gradually along the segment.
+            segment_heading = np.arctan2(np.diff(y), np.diff(x))
+            heading = np.repeat(segment_heading, 2)
+            times = np.repeat(times, 2)[1:-1]
+            x = np.repeat(x, 2)[1:-1]
+            y = np.repeat(y, 2)[1:-1]
+
+        return self._add_path(times, x, y, heading, loop)
+
+    def add_replay(
+        self,
+        times: typing.Sequence[float],
+        poses: typing.Sequence[Pose2d],
+        loop: bool = False,
+    ) -> int:
+        """
+        Adds a robot that replays recorded poses.
+
+        :param times: Time of each pose in seconds, relative to the start
+                      of the replay
+        :param poses: Recorded poses
+        :param loop:  Start over when the end of the recording is reached
+
+        :returns: index of the new robot
+        """
+        if len(times) != len(poses) or len(poses) < 2:
+            raise ValueError("times and poses must have the same length (at least 2)")
+
+        times = np.array(times, dtype=float)
+        times -= times[0]
+        if np.any(np.diff(times) <= 0):
+            raise ValueError("times must be increasing")
+
+        x = np.array([p.X() for p in poses], dtype=float)
+        y = np.array([p.Y() for p in poses], dtype=float)
+        heading = np.array([p.rotation().radians() for p in poses])
+
+        return self._add_path(times, x, y, heading, loop)
+
+    def _add_path(self, times, x, y, heading, loop) -> int:
+        # store heading as increments so interpolation takes the short way
+        heading = heading[0] + np.concatenate(
+            (
+                [0.0],
+                np.cumsum(
+                    np.remainder(np.diff(heading) + math.pi, 2 * math.pi) - math.pi
+                ),
+            )
+        )
+        self._paths.append((times, x, y, heading, loop))
+        self._dirty = True
+        return len(self._paths) - 1
+
+    def _build(self):
+        n = len(self._paths)
+        npts = max(len(p[0]) for p in self._paths)
+
+        # pad each path by repeating its last point, at an infinite time
+        self._times = np.full((n, npts + 1), np.inf)
+        self._px = np.empty((n, npts + 1))
+        self._py = np.empty((n, npts + 1))
+        self._ph = np.empty((n, npts + 1))
+        self._duration = np.empty(n)
+        self._loop = np.empty(n, dtype=bool)
+
+        for i, (times, x, y, heading, loop) in enumerate(self._paths):
+            k = len(times)
+            self._times[i, :k] = times
+            for dst, src in ((self._px, x), (self._py, y), (self._ph, heading)):
+                dst[i, :k] = src
+                dst[i, k:] = src[-1]
+            self._duration[i] = times[-1]
+            self._loop[i] = loop
+
+        self._rows = np.arange(n)
+        self._cursor = np.zeros(n, dtype=np.intp)
+        self._last_t = np.zeros(n)
+
+        self.x = self._px[:, 0].copy()
+        self.y = self._py[:, 0].copy()
+        self.heading = self._ph[:, 0].copy()
+
+        self._dirty = False
+
+    def reset(self):
+        """Moves all robots to the start of their paths"""
+        self._start = None
+        if self._paths:
+            self._build()
+
+    def update(self, now: float):
+        """
+        Moves all robots to where they should be at ``now``. The first call
+        defines the start of the paths. This is called automatically when
+        the robots are registered with :meth:`.PhysicsInterface.add_opponents`.
+
+        :param now: Current time in seconds
+        """
+        if not self._paths:
+            return
+        if self._dirty:
+            self._build()
+        if self._start is None:
+            self._start = now
+
+        elapsed = now - self._start
+        t = np.where(
+            self._loop,
+            np.remainder(elapsed, self._duration),
+            np.minimum(elapsed, self._duration),
+        )
+
+        # Time only moves forward except when a path wraps around
+        cursor = self._cursor
+        cursor[t < self._last_t] = 0
+        self._last_t = t
+
+        rows = self._rows
+        times = self._times
+        while True:
+            advance = times[rows, cursor + 1] <= t
+            if not advance.any():
+                break
+            cursor += advance
+
+        t0 = times[rows, cursor]
+        t1 = times[rows, cursor + 1]
+        with np.errstate(invalid="ignore"):
+            frac = np.where(np.isfinite(t1), (t - t0) / (t1 - t0), 0.0)
+
+        nxt = cursor + 1
+        for dst, table in (
+            (self.x, self._px),
+            (self.y, self._py),
+            (self.heading, self._ph),
+        ):
+            p0 = table[rows, cursor]
+            dst[:] = p0 + (table[rows, nxt] - p0) * frac
+
+        heading = self.heading
+        np.remainder(heading + math.pi, 2 * math.pi, out=heading)
+        heading -= math.pi
+
+    def poses(self) -> typing.List[Pose2d]:
+        """:returns: the current pose of each robot"""
+        return [
+            Pose2d(x, y, Rotation2d(h))
+            for x, y, h in zip(self.x.tolist(), self.y.tolist(), self.heading.tolist())
+        ]
+
+    def distances(self, x: float, y: float) -> np.ndarray:
+        """:returns: distance from (``x``, ``y``) to each robot's center (meters)"""
+        return np.hypot(self.x - x, self.y - y)
+
+    def nearest(self, pose: Pose2d) -> typing.Tuple[int, float]:
+        """
+        :returns: index of the robot closest to ``pose`` and its distance,
+                  or (-1, inf) if there are no robots
+        """
+        if len(self.x) == 0:
+            return -1, math.inf
+
+        d = self.distances(pose.X(), pose.Y())
+        idx = int(np.argmin(d))
+        return idx, float(d[idx])
+
+    def query(
+        self, pose: Pose2d, max_distance: float
+    ) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the robots within ``max_distance`` meters of ``pose``, which
+        is useful for modelling proximity sensors and cameras.
+
+        :returns: indices, distances and bearings of the robots, sorted by
+                  distance. Bearings are in radians relative to the heading
+                  of ``pose`` (counter-clockwise is positive).
+        """
+        px, py = pose.X(), pose.Y()
+        dx = self.x - px
+        dy = self.y - py
+        d = np.hypot(dx, dy)
+
+        idx = np.flatnonzero(d <= max_distance)
+        idx = idx[np.argsort(d[idx], kind="stable")]
+
+        bearing = np.arctan2(dy[idx], dx[idx]) - pose.rotation().radians()
+        bearing = np.remainder(bearing + math.pi, 2 * math.pi) - math.pi
+
+        return idx, d[idx], bearing
+
+    def pairwise_distances(self) -> np.ndarray:
+        """:returns: NxN matrix of the distances between the robots"""
+        return np.hypot(
+            self.x[:, None] - self.x[None, :], self.y[:, None] - self.y[None, :]
+        )
@@ -0,0 +1,501 @@
+"""
+.. versionadded:: 2026.1.0
+
+Simulates game pieces launched by a shooter, including air drag and the
+lift caused by spin (the Magnus effect). Many projectiles are integrated
+together using NumPy, which makes it practical to estimate how likely a
+shot is to score from every position on the field.
+
+A :class:`ShotMap` stores the probability of scoring for each cell of a
+grid over the field. Computing it can take a few seconds, so it can be
+cached in a file that is reused as long as the parameters don't change.
+Looking up a probability is just an array index::
+
+    import math
+
+    from pyfrc.physics.projectile import Goal, Projectile, ShotMap
+
+    class PhysicsEngine:
+
+        def __init__(self, physics_controller):
+            self.physics_controller = physics_controller
+            self.shot_map = ShotMap.compute(
+                Projectile(mass=0.27, diameter=0.24, lift_coefficient=0.5),
+                Goal(4.6, 4.0, 2.64, radius=0.45),
+                field_length=16.5,
+                field_width=8.1,
+                shooter_height=0.5,
+                speed=lambda distance: 7 + 0.6 * distance,
+                pitch=math.radians(55),
+                backspin=100,
+                speed_stddev=0.2,
+                pitch_stddev=math.radians(1),
+                cache="shotmap.npz",
+            )
+
+        def update_sim(self, now, tm_diff):
+            pose = self.physics_controller.get_pose()
+            probability = self.shot_map.probability(pose.X(), pose.Y())
+
+All values are in SI units: meters, seconds, kilograms and radians.
+"""
+
+import dataclasses
+import hashlib
+import math
+import os
+import typing
+
+import numpy as np
+
+#: Acceleration due to gravity (m/s^2)
+GRAVITY = 9.80665
+
+ArrayLike = typing.Union[float, typing.Sequence[float], np.ndarray]
+
+
+@dataclasses.dataclass(frozen=True)
+class Projectile:
+    """Physical properties of a game piece"""
+
+    #: Mass (kg)
+    mass: float = 0.27
+
+    #: Diameter (m)
+    diameter: float = 0.24
+
+    #: Drag coefficient (0.47 for a smooth sphere)
+    drag_coefficient: float = 0.47
+
+    #: Lift coefficient per unit of spin ratio (surface speed of the spin
+    #: divided by the speed of the projectile). 0 disables lift.
+    lift_coefficient: float = 0.0
+
+    #: Density of air (kg/m^3)
+    air_density: float = 1.225
+
+    def accelerations(
+        self, velocities: np.ndarray, spins: typing.Optional[np.ndarray]
+    ) -> np.ndarray:
+        """
+        :param velocities: Array of velocities with shape ``(N, 3)``
+        :param spins:      Array of angular velocities with shape ``(N, 3)``,
+                           or None
+
+        :returns: the acceleration of each projectile
+        """
+        radius = self.diameter * 0.5
+        k = 0.5 * self.air_density * math.pi * radius * radius / self.mass
+
+        speed = np.sqrt(np.einsum("ij,ij->i", velocities, velocities))
+        acc = velocities * (-k * self.drag_coefficient * speed)[:, None]
+
+        # lift is Cl * spin ratio, so the force is proportional to spin x v
+        if spins is not None and self.lift_coefficient:
+            c = k * self.lift_coefficient * radius
+            wx, wy, wz = spins[:, 0], spins[:, 1], spins[:, 2]
+            vx, vy, vz = velocities[:, 0], velocities[:, 1], velocities[:, 2]
+            acc[:, 0] += (wy * vz - wz * vy) * c
+            acc[:, 1] += (wz * vx - wx * vz) * c
+            acc[:, 2] += (wx * vy - wy * vx) * c
+
+        acc[:, 2] -= GRAVITY
+        return acc
+
+
+@dataclasses.dataclass(frozen=True)
+class Goal:
+    """A horizontal circular opening that projectiles score by falling through"""
+
+    #: Position of the center of the opening
+    x: float
+    y: float
+    z: float
+
+    #: Maximum distance from the center that the center of the projectile
+    #: can pass through
+    radius: float
+
+
+@dataclasses.dataclass
+class Trajectories:
+    """Output of :func:`simulate`"""
+
+    #: Time of each step, with shape ``(S,)``
+    times: np.ndarray
+
+    #: Position of each projectile at each step, with shape ``(S, N, 3)``
+    positions: np.ndarray
+
+    #: Velocity of each projectile at each step, with shape ``(S, N, 3)``
+    velocities: np.ndarray
+
+
+def flywheel_launch(
+    flywheel_velocity: ArrayLike,
+    wheel_radius: float,
+    projectile_diameter: float,
+    efficiency: float = 0.5,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimates the launch speed and backspin of a projectile shot by a
+    single flywheel against a fixed hood, such as one modelled by
+    :class:`.FlywheelModel`. The projectile rolls against the hood, so
+    it leaves at about half of the surface speed of the wheel.
+
+    :param flywheel_velocity: Flywheel velocity (rad/s)
+    :param wheel_radius:      Flywheel radius (m)
+    :param projectile_diameter: Diameter of the projectile (m)
+    :param efficiency:        Fraction of the wheel surface speed that the
+                              projectile leaves with
+
+    :returns: launch speed (m/s) and backspin (rad/s)
+    """
+    speed = np.asarray(flywheel_velocity, dtype=float) * wheel_radius * efficiency
+    return speed, speed / (projectile_diameter * 0.5)
+
+
+def launch_state(
+    speed: ArrayLike,
+    pitch: ArrayLike,
+    yaw: ArrayLike,
+    backspin: ArrayLike = 0.0,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts launch parameters to velocity and spin vectors
+
+    :param speed:    Launch speed (m/s)
+    :param pitch:    Angle above horizontal (radians)
+    :param yaw:      Direction on the field (radians, counter-clockwise from
+                     the x axis)
+    :param backspin: Backspin (rad/s)
+
+    :returns: velocities and spins, each with shape ``(N, 3)``
+    """
+    speed, pitch, yaw, backspin = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(v, dtype=float))
+            for v in (speed, pitch, yaw, backspin)
+        )
+    )
+
+    cos_yaw = np.cos(yaw)
+    sin_yaw = np.sin(yaw)
+    horizontal = speed * np.cos(pitch)
+
+    velocities = np.stack(
+        (horizontal * cos_yaw, horizontal * sin_yaw, speed * np.sin(pitch)), axis=1
+    )
+
+    # backspin rotates around the horizontal axis to the right of the shot
+    spins = np.stack(
+        (backspin * sin_yaw, -backspin * cos_yaw, np.zeros_like(yaw)), axis=1
+    )
+    return velocities, spins
+
+
+def _step(
+    projectile: Projectile,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    spins: typing.Optional[np.ndarray],
+    dt: float,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    # midpoint method
+    a0 = projectile.accelerations(velocities, spins)
+    v_mid = velocities + a0 * (dt * 0.5)
+    a_mid = projectile.accelerations(v_mid, spins)
+    return positions + v_mid * dt, velocities + a_mid * dt
+
+
+def simulate(
+    projectile: Projectile,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    spins: typing.Optional[np.ndarray] = None,
+    dt: float = 0.005,
+    duration: float = 3.0,
+) -> Trajectories:
+    """
+    Integrates the trajectories of many projectiles at once. Projectiles
+    keep going after they reach the ground; use :func:`hits` to check
+    shots against a goal without storing every step.
+
+    :param projectile: Properties of the projectiles
+    :param positions:  Initial positions, with shape ``(N, 3)``
+    :param velocities: Initial velocities, with shape ``(N, 3)``
+    :param spins:      Angular velocities, with shape ``(N, 3)``. Spin is
+                       assumed to be constant during the flight.
+    :param dt:         Integration timestep
+    :param duration:   Length of the simulation
+    """
+    steps = int(math.ceil(duration / dt))
+
+    p = np.array(positions, dtype=float).reshape(-1, 3)
+    v = np.array(velocities, dtype=float).reshape(-1, 3)
+
+    out_p = np.empty((steps + 1,) + p.shape)
+    out_v = np.empty((steps + 1,) + v.shape)
+    out_p[0] = p
+    out_v[0] = v
+
+    for i in range(1, steps + 1):
+        p, v = _step(projectile, p, v, spins, dt)
+        out_p[i] = p
+        out_v[i] = v
+
+    return Trajectories(np.arange(steps + 1) * dt, out_p, out_v)
+
+
+def hits(
+    projectile: Projectile,
+    goal: Goal,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    spins: typing.Optional[np.ndarray] = None,
+    dt: float = 0.005,
+    duration: float = 3.0,
+) -> np.ndarray:
+    """
+    Determines which projectiles fall through the goal. Projectiles stop
+    being integrated once they have fallen below the height of the goal,
+    so the cost of each step shrinks as the shots land.
+
+    The parameters are the same as :func:`simulate`.
+
+    :returns: boolean array that is True for each projectile that scores
+    """
+    p = np.array(positions, dtype=float).reshape(-1, 3)
+    v = np.array(velocities, dtype=float).reshape(-1, 3)
+    s = None if spins is None else np.array(spins, dtype=float).reshape(-1, 3)
+
+    result = np.zeros(len(p), dtype=bool)
+    active = np.arange(len(p))
+
+    for _ in range(int(math.ceil(duration / dt))):
+        if not len(active):
+            break
+
+        p1, v1 = _step(projectile, p, v, s, dt)
+
+        # crossed the goal height while falling?
+        crossed = (p[:, 2] >= goal.z) & (p1[:, 2] < goal.z)
+        if crossed.any():
+            p0c = p[crossed]
+            p1c = p1[crossed]
+            frac = (p0c[:, 2] - goal.z) / (p0c[:, 2] - p1c[:, 2])
+            x = p0c[:, 0] + (p1c[:, 0] - p0c[:, 0]) * frac
+            y = p0c[:, 1] + (p1c[:, 1] - p0c[:, 1]) * frac
+            result[active[crossed]] = np.hypot(x - goal.x, y - goal.y) <= goal.radius
+
+        # projectiles below the goal that are falling can't score anymore
+        keep = ~crossed & ~((p1[:, 2] < goal.z) & (v1[:, 2] <= 0))
+        active = active[keep]
+        p = p1[keep]
+        v = v1[keep]
+        if s is not None:
+            s = s[keep]
+
+    return result
+
+
+class ShotMap:
+    """
+    Probability of scoring from each cell of a grid on the field. Cell
+    ``[j, i]`` covers ``x0 + i * cell_size <= x < x0 + (i + 1) * cell_size``
+    and the same for y with ``j``.
+    """
+
+    def __init__(
+        self,
+        probabilities: np.ndarray,
+        x0: float = 0.0,
+        y0: float = 0.0,
+        cell_size: float = 0.25,
+    ):
+        #: Probability of scoring from each cell, with shape ``(ny, nx)``
+        self.probabilities = np.asarray(probabilities, dtype=float)
+        self.x0 = x0
+        self.y0 = y0
+        self.cell_size = cell_size
+        self._inv_cell_size = 1.0 / cell_size
+
+    @classmethod
+    def compute(
+        cls,
+        projectile: Projectile,
+        goal: Goal,
+        field_length: float,
+        field_width: float,
+        shooter_height: float,
+        speed: typing.Union[float, typing.Callable[[np.ndarray], np.ndarray]],
+        pitch: typing.Union[float, typing.Callable[[np.ndarray], np.ndarray]],
+        backspin: float = 0.0,
+        speed_stddev: float = 0.0,
+        pitch_stddev: float = 0.0,
+        yaw_stddev: float = 0.0,
+        cell_size: float = 0.25,
+        samples: int = 32,
+        seed: int = 0,
+        dt: float = 0.005,
+        duration: float = 3.0,
+        cache: typing.Optional[typing.Union[str, os.PathLike]] = None,
+    ) -> "ShotMap":
+        """
+        Computes the shot map by simulating ``samples`` shots from the
+        center of each cell, aimed at the center of the goal. Launch
+        parameters are randomized with the given standard deviations
+        (using ``seed``, so the result is reproducible). All of the shots
+        are simulated together.
+
+        :param projectile:     Properties of the game piece
+        :param goal:           Goal to shoot at
+        :param field_length:   Size of the grid along the x axis
+        :param field_width:    Size of the grid along the y axis
+        :param shooter_height: Height that projectiles are launched from
+        :param speed:          Launch speed, or a function that computes
+                               the launch speeds from an array of
+                               horizontal distances to the goal
+        :param pitch:          Launch angle above horizontal, or a function
+                               of distance like ``speed``
+        :param backspin:       Backspin of the projectile (rad/s)
+        :param samples:        Number of shots from each cell
+        :param cache:          If set, the shot map is loaded from this file
+                               if it was computed with the same parameters,
+                               otherwise it is computed and saved there
+        """
+        nx = int(math.ceil(field_length / cell_size))
+        ny = int(math.ceil(field_width / cell_size))
+
+        cx = (np.arange(nx) + 0.5) * cell_size
+        cy = (np.arange(ny) + 0.5) * cell_size
+        gx, gy = np.meshgrid(cx, cy)
+        gx = gx.ravel()
+        gy = gy.ravel()
+
+        distance = np.hypot(goal.x - gx, goal.y - gy)
+        yaw = np.arctan2(goal.y - gy, goal.x - gx)
+        cell_speed = np.broadcast_to(
+            speed(distance) if callable(speed) else speed, distance.shape
+        )
+        cell_pitch = np.broadcast_to(
+            pitch(distance) if callable(pitch) else pitch, distance.shape
+        )
+
+        key = None
+        if cache is not None:
+            h = hashlib.sha256()
+            h.update(
+                repr(
+                    (
+                        projectile,
+                        goal,
+                        field_length,
+                        field_width,
+                        shooter_height,
+                        backspin,
+                        speed_stddev,
+                        pitch_stddev,
+                        yaw_stddev,
+                        cell_size,
+                        samples,
+                        seed,
+                        dt,
+                        duration,
+                    )
+                ).encode()
+            )
+            h.update(np.ascontiguousarray(cell_speed, dtype=float).tobytes())
+            h.update(np.ascontiguousarray(cell_pitch, dtype=float).tobytes())
+            key = h.hexdigest()
+
+            if os.path.exists(cache):
+                shot_map, cached_key = cls._load(cache)
+                if cached_key == key:
+                    return shot_map
+
+        rng = np.random.default_rng(seed)
+        n = len(gx) * samples
+
+        def _sample(values, stddev):
+            values = np.repeat(values, samples)
+            if stddev > 0:
+                values = values + rng.normal(0.0, stddev, n)
+            return values
+
+        velocities, spins = launch_state(
+            _sample(cell_speed, speed_stddev),
+            _sample(cell_pitch, pitch_stddev),
+            _sample(yaw, yaw_stddev),
+            backspin,
+        )
+        positions = np.stack(
+            (
+                np.repeat(gx, samples),
+                np.repeat(gy, samples),
+                np.full(n, float(shooter_height)),
+            ),
+            axis=1,
+        )
+
+        scored = hits(
+            projectile,
+            goal,
+            positions,
+            velocities,
+            spins if backspin else None,
+            dt,
+            duration,
+        )
+        probabilities = scored.reshape(ny, nx, samples).mean(axis=2)
+
+        shot_map = cls(probabilities, 0.0, 0.0, cell_size)
+        if cache is not None:
+            shot_map._save(cache, key)
+        return shot_map
+
+    def probability(self, x: float, y: float) -> float:
+        """:returns: probability of scoring from (``x``, ``y``), or 0 outside the map"""
+        i = math.floor((x - self.x0) * self._inv_cell_size)
+        j = math.floor((y - self.y0) * self._inv_cell_size)
+        ny, nx = self.probabilities.shape
+        if 0 <= i < nx and 0 <= j < ny:
+            return float(self.probabilities[j, i])
+        return 0.0
+
+    def probabilities_at(self, x: ArrayLike, y: ArrayLike) -> np.ndarray:
+        """Vectorized version of :meth:`probability`"""
+        i = np.floor((np.asarray(x) - self.x0) * self._inv_cell_size).astype(np.intp)
+        j = np.floor((np.asarray(y) - self.y0) * self._inv_cell_size).astype(np.intp)
+        ny, nx = self.probabilities.shape
+        inside = (i >= 0) & (i < nx) & (j >= 0) & (j < ny)
+        return np.where(
+            inside,
+            self.probabilities[np.clip(j, 0, ny - 1), np.clip(i, 0, nx - 1)],
+            0.0,
+        )
+
+    def save(self, fname: typing.Union[str, os.PathLike]):
+        """Saves the shot map to a ``.npz`` file"""
+        self._save(fname, None)
+
+    @classmethod
+    def load(cls, fname: typing.Union[str, os.PathLike]) -> "ShotMap":
+        """Loads a shot map saved by :meth:`save`"""
+        return cls._load(fname)[0]
+
+    def _save(self, fname, key: typing.Optional[str]):
+        with open(fname, "wb") as fp:
+            np.savez(
+                fp,
+                probabilities=self.probabilities,
+                origin=np.array((self.x0, self.y0, self.cell_size)),
+                key=np.array("" if key is None else key),
+            )
+
+    @classmethod
+    def _load(cls, fname) -> typing.Tuple["ShotMap", str]:
+        with np.load(fname) as data:
+            x0, y0, cell_size = data["origin"].tolist()
+            shot_map = cls(data["probabilities"], x0, y0, cell_size)
+            return shot_map, str(data["key"])
@@ -0,0 +1,328 @@
+"""
+.. versionadded:: 2026.1.0
+
+State-space models of robot mechanisms. Each model is a linear system
+:math:`\\dot{x} = Ax + Bu` that is discretized exactly for a given timestep
+(assuming the input is held constant during the step). Discretizing
+requires a matrix exponential, so the discrete matrices are cached per
+timestep: when the timestep doesn't change (such as in tests, or when using
+``robotpy sim --max-speed``) each step is just a couple of small matrix
+multiplies.
+"""
+
+import functools
+import math
+import typing
+
+import numpy as np
+from wpimath.geometry import Transform2d
+
+from .motor_cfgs import MotorModelConfig
+from .tankmodel import (
+    _arc_offset,
+    _kitbot_length,
+    _kitbot_wheelbase,
+    _kitbot_width,
+    _theory_kv_ka,
+)
+from .units import units, Helpers
+
+
+def expm(m: np.ndarray) -> np.ndarray:
+    """
+    Matrix exponential of a small square matrix, computed using scaling
+    and squaring of a Taylor series.
+    """
+    norm = np.linalg.norm(m, ord=np.inf)
+
+    # scale so that the series converges quickly
+    squarings = max(0, int(math.ceil(math.log2(norm))) + 1) if norm > 0.5 else 0
+    m = m / (2.0**squarings)
+
+    result = np.eye(m.shape[0])
+    term = np.eye(m.shape[0])
+    for k in range(1, 20):
+        term = term @ m / k
+        result = result + term
+        if np.abs(term).max() < 1e-17 * np.abs(result).max():
+            break
+
+    for _ in range(squarings):
+        result = result @ result
+
+    return result
+
+
+def discretize_ab(
+    a: np.ndarray, b: np.ndarray, dt: float
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Discretizes the continuous system :math:`\\dot{x} = Ax + Bu` assuming that
+    :math:`u` is held constant for ``dt`` seconds.
+
+    :returns: discrete ``A`` and ``B`` matrices
+    """
+    states = a.shape[0]
+    inputs = b.shape[1]
+
+    m = np.zeros((states + inputs, states + inputs))
+    m[:states, :states] = a
+    m[:states, states:] = b
+
+    phi = expm(m * dt)
+    return phi[:states, :states], phi[:states, states:]
+
+
+def _timestep_key(tm_diff: float) -> float:
+    # Rounds a timestep to the resolution of the FPGA timestamp (1us), so
+    # that timesteps which only differ by floating point error share an
+    # entry in the discretization caches
+    return round(tm_diff, 6)
+
+
+def _applied_voltage(motor_pct: float, nominal: float, vintercept: float) -> float:
+    # same as MotorModel.compute
+    voltage = nominal * motor_pct
+    return math.copysign(max(abs(voltage) - vintercept, 0), voltage)
+
+
+class StateSpaceTankModel:
+    """
+    A tankdrive-style drivetrain model that is constructed from the same
+    inputs as :class:`.TankModel`, and provides the same ``calculate`` API,
+    but models the drivetrain as a linear system instead of as two
+    independent motors.
+
+    The state of the model is the position and velocity of each side of the
+    drivetrain. Each side is driven by a force proportional to
+    :math:`V - k_v v`, and the left/right sides are coupled through the mass
+    and rotational inertia of the robot:
+
+    .. math::
+
+        \\dot{v}_l = c_1 F_l + c_2 F_r
+
+        \\dot{v}_r = c_2 F_l + c_1 F_r
+
+        c_1 = \\frac{1}{m} + \\frac{r_b^2}{J}, c_2 = \\frac{1}{m} - \\frac{r_b^2}{J}
+
+    Where :math:`r_b` is half the wheelbase and :math:`J` is the moment of
+    inertia. When both sides are commanded equally, this is identical to
+    :class:`.TankModel`. Rotation is computed from the difference in wheel
+    travel, assuming the wheels don't slip.
+
+    The discretized matrices are cached for the most recently used
+    timesteps (see ``cache_size``), so with a constant ``tm_diff`` each call
+    to :meth:`calculate` costs two 4x4 matrix-vector products. ``tm_diff`` is
+    rounded to the nearest microsecond (the resolution of the FPGA
+    timestamp), so that steps that only differ by floating point error
+    share a cache entry. A ``tm_diff`` that varies by more than that will
+    miss the cache most of the time.
+
+    Output units for position and velocity are in feet and ft/s.
+    """
+
+    @classmethod
+    def theory(
+        cls,
+        motor_config: MotorModelConfig,
+        robot_mass: units.Quantity,
+        gearing: float,
+        nmotors: int = 1,
+        x_wheelbase: units.Quantity = _kitbot_wheelbase,
+        robot_width: units.Quantity = _kitbot_width,
+        robot_length: units.Quantity = _kitbot_length,
+        wheel_diameter: units.Quantity = 6 * units.inch,
+        vintercept: units.volts = 1.3 * units.volts,
+        *,
+        cache_size: int = 32,
+    ) -> "StateSpaceTankModel":
+        """
+        Use this to create the drivetrain model when you haven't measured
+        ``kv`` and ``ka`` for your robot. The parameters are the same as
+        :meth:`.TankModel.theory`.
+        """
+        Helpers.ensure_mass(robot_mass)
+        Helpers.ensure_length(wheel_diameter)
+
+        kv, ka = _theory_kv_ka(
+            motor_config, robot_mass, gearing, nmotors, wheel_diameter
+        )
+
+        return cls(
+            motor_config,
+            robot_mass,
+            x_wheelbase,
+            robot_width,
+            robot_length,
+            kv,
+            ka,
+            vintercept,
+            kv,
+            ka,
+            vintercept,
+            cache_size=cache_size,
+        )
+
+    def __init__(
+        self,
+        motor_config: MotorModelConfig,
+        robot_mass: units.Quantity,
+        x_wheelbase: units.Quantity,
+        robot_width: units.Quantity,
+        robot_length: units.Quantity,
+        l_kv: units.Quantity,
+        l_ka: units.Quantity,
+        l_vi: units.volts,
+        r_kv: units.Quantity,
+        r_ka: units.Quantity,
+        r_vi: units.volts,
+        *,
+        cache_size: int = 32,
+    ):
+        """
+        The parameters are the same as the :class:`.TankModel` constructor.
+
+        :param cache_size: Number of timesteps to cache discretized matrices for
+        """
+        Helpers.ensure_mass(robot_mass)
+        Helpers.ensure_length(x_wheelbase)
+        Helpers.ensure_length(robot_width)
+        Helpers.ensure_length(robot_length)
+
+        mass = units.pound.m_from(robot_mass, name="robot_mass")
+        width = units.foot.m_from(robot_width, name="robot_width")
+        length = units.foot.m_from(robot_length, name="robot_length")
+
+        self._nominal_voltage = units.volts.m_from(
+            motor_config.nominalVoltage,
+            strict=False,
+            name="motor_config.nominalVoltage",
+        )
+        self._l_vi = units.volts.m_from(l_vi, strict=False, name="l_vi")
+        self._r_vi = units.volts.m_from(r_vi, strict=False, name="r_vi")
+
+        self._mass = mass
+        self._wheelbase = units.foot.m_from(x_wheelbase, name="x_wheelbase")
+        self._l_kv = units.tm_kv.m_from(l_kv, strict=False, name="l_kv")
+        self._l_ka = units.tm_ka.m_from(l_ka, strict=False, name="l_ka")
+        self._r_kv = units.tm_kv.m_from(r_kv, strict=False, name="r_kv")
+        self._r_ka = units.tm_ka.m_from(r_ka, strict=False, name="r_ka")
+
+        # state: left position, right position, left velocity, right velocity
+        self._x = np.zeros(4)
+
+        self._discretize = functools.lru_cache(maxsize=cache_size)(
+            self._discretize_uncached
+        )
+
+        # computes A/B
+        self.inertia = (1 / 12.0) * robot_mass * (robot_length**2 + robot_width**2)
+
+    @property
+    def inertia(self):
+        """
+        Moment of inertia of the robot, computed from the given mass and
+        robot width/length. Set this property to use a different moment of
+        inertia.
+
+        Units are ``[mass] * [length] ** 2``
+        """
+        return self._inertia * units.foot**2 * units.pound
+
+    @inertia.setter
+    @units.wraps(None, (None, units.foot**2 * units.pound))
+    def inertia(self, value):
+        self._inertia = value
+
+        rb2 = (self._wheelbase / 2.0) ** 2
+        c1 = 1.0 / self._mass + rb2 / value
+        c2 = 1.0 / self._mass - rb2 / value
+
+        # force per volt on each side (from ka, which is defined as the
+        # voltage needed to accelerate the whole robot when both sides
+        # are driven equally)
+        gl = self._mass / (2.0 * self._l_ka)
+        gr = self._mass / (2.0 * self._r_ka)
+
+        a = np.zeros((4, 4))
+        a[0, 2] = 1.0
+        a[1, 3] = 1.0
+        a[2, 2] = -c1 * gl * self._l_kv
+        a[2, 3] = -c2 * gr * self._r_kv
+        a[3, 2] = -c2 * gl * self._l_kv
+        a[3, 3] = -c1 * gr * self._r_kv
+
+        b = np.zeros((4, 2))
+        b[2, 0] = c1 * gl
+        b[2, 1] = c2 * gr
+        b[3, 0] = c2 * gl
+        b[3, 1] = c1 * gr
+
+        #: Continuous system matrix
+        self.A = a
+        #: Continuous input matrix
+        self.B = b
+
+        self._discretize.cache_clear()
+
+    def _discretize_uncached(self, dt: float) -> typing.Tuple[np.ndarray, np.ndarray]:
+        return discretize_ab(self.A, self.B, dt)
+
+    @property
+    def l_velocity(self) -> float:
+        """The velocity of the left side (in ft/s)"""
+        return float(self._x[2])
+
+    @property
+    def r_velocity(self) -> float:
+        """The velocity of the right side (in ft/s)"""
+        return float(self._x[3])
+
+    @property
+    def l_position(self) -> float:
+        """The linear position of the left side wheel (in feet)"""
+        return float(self._x[0])
+
+    @property
+    def r_position(self) -> float:
+        """The linear position of the right side wheel (in feet)"""
+        return float(self._x[1])
+
+    def cache_info(self):
+        """Returns hit/miss statistics of the discretization cache"""
+        return self._discretize.cache_info()
+
+    def calculate(self, l_motor: float, r_motor: float, tm_diff: float) -> Transform2d:
+        """
+        Given motor values and the amount of time elapsed since this was last
+        called, retrieves the x,y,angle that the robot has moved. Pass these
+        values to :meth:`.PhysicsInterface.move_robot`.
+
+        :param l_motor:    Left motor value (-1 to 1); 1 is forward
+        :param r_motor:    Right motor value (-1 to 1); -1 is forward
+        :param tm_diff:    Elapsed time since last call to this function
+
+        :returns: transform containing x/y/angle offsets of robot travel
+        """
+        u = np.array(
+            (
+                _applied_voltage(l_motor, self._nominal_voltage, self._l_vi),
+                _applied_voltage(-r_motor, self._nominal_voltage, self._r_vi),
+            )
+        )
+
+        ad, bd = self._discretize(_timestep_key(tm_diff))
+
+        x0 = self._x
+        x1 = ad @ x0 + bd @ u
+        self._x = x1
+
+        l_distance = float(x1[0] - x0[0])
+        r_distance = float(x1[1] - x0[1])
+
+        distance = (l_distance + r_distance) * 0.5
+        angle = (r_distance - l_distance) / self._wheelbase
+
+        x, y = _arc_offset(distance, angle)
+        return Transform2d.fromFeet(x, y, angle)
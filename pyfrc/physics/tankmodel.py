@@ -12,9 +12,11 @@
           FRC season.
 """
 
+import dataclasses
 import math
 import typing
 
+import numpy as np
 from wpimath.geometry import Transform2d
 
 from .motor_cfgs import MotorModelConfig
@@ -35,6 +37,57 @@ _inertia_units = (units.foot**2) * units.pound
 _bm_units = units.foot * units.pound
 
 
+def _theory_kv_ka(
+    motor_config: MotorModelConfig,
+    robot_mass: units.Quantity,
+    gearing: float,
+    nmotors: int,
+    wheel_diameter: units.Quantity,
+) -> typing.Tuple[units.Quantity, units.Quantity]:
+    # Computes theoretical kv/ka, see TankModel.theory for details
+    max_velocity = (motor_config.freeSpeed * math.pi * wheel_diameter) / gearing
+    max_acceleration = (2.0 * nmotors * motor_config.stallTorque * gearing) / (
+        wheel_diameter * robot_mass
+    )
+
+    Helpers.ensure_velocity(max_velocity)
+    Helpers.ensure_acceleration(max_acceleration)
+
+    kv = motor_config.nominalVoltage / max_velocity
+    ka = motor_config.nominalVoltage / max_acceleration
+
+    kv = units.tm_kv.from_(kv, name="kv")
+    ka = units.tm_ka.from_(ka, name="ka")
+
+    logger.info(
+        "Motor config: %d %s motors @ %.2f gearing with %.1f diameter wheels",
+        nmotors,
+        motor_config.name,
+        gearing,
+        wheel_diameter.m,
+    )
+
+    logger.info(
+        "- Theoretical: vmax=%.3f ft/s, amax=%.3f ft/s^2, kv=%.3f, ka=%.3f",
+        max_velocity.m_as(units.foot / units.second),
+        max_acceleration.m_as(units.foot / units.second**2),
+        kv.m,
+        ka.m,
+    )
+
+    return kv, ka
+
+
+def _arc_offset(distance: float, angle: float) -> typing.Tuple[float, float]:
+    # x/y offset after moving along a constant curvature arc of the given
+    # length that ends at the given relative angle
+    if abs(angle) < 1e-9:
+        return distance, distance * angle * 0.5
+
+    radius = distance / angle
+    return radius * math.sin(angle), radius * (1.0 - math.cos(angle))
+
+
 class MotorModel:
     """
     Motor model used by the :class:`TankModel`. You should not need to create
@@ -108,6 +161,45 @@ class MotorModel:
 
         return self.velocity
 
+    def compute_exact(self, motor_pct: float, tm_diff: float) -> float:
+        r"""
+        Same as :meth:`compute`, but advances the model using the closed form
+        solution of :math:`V = k_v v + k_a a` instead of numeric integration,
+        so the result is exact for any ``tm_diff`` (assuming the motor output
+        is constant during that time).
+
+        .. math::
+
+            v(t) = v_{ss} + (v_0 - v_{ss}) e^{-t k_v / k_a}
+
+        where :math:`v_{ss} = V / k_v` is the steady state velocity.
+
+        :param motor_pct: Percentage of power for motor in range [1..-1]
+        :param tm_diff:   Time elapsed since this function was last called
+
+        :returns: velocity
+
+        .. versionadded:: 2026.1.0
+        """
+
+        appliedVoltage = self._nominalVoltage * motor_pct
+        appliedVoltage = math.copysign(
+            max(abs(appliedVoltage) - self._vintercept, 0), appliedVoltage
+        )
+
+        tau = self._ka / self._kv
+        vss = appliedVoltage / self._kv
+        dv0 = self.velocity - vss
+
+        # expm1 keeps precision when tm_diff is small relative to tau
+        decay = -math.expm1(-tm_diff / tau)
+
+        self.position += vss * tm_diff + dv0 * tau * decay
+        self.velocity = vss + dv0 * (1.0 - decay)
+        self.acceleration = (appliedVoltage - self._kv * self.velocity) / self._ka
+
+        return self.velocity
+
 
 class TankModel:
     """
@@ -184,6 +276,7 @@ class TankModel:
         wheel_diameter: units.Quantity = 6 * units.inch,
         vintercept: units.volts = 1.3 * units.volts,
         timestep: int = 5 * units.ms,
+        exact: bool = False,
     ):
         r"""
         Use this to create the drivetrain model when you haven't measured
@@ -201,6 +294,7 @@ class TankModel:
                                 torque to overcome steady-state friction (see the
                                 paper for more details)
         :param timestep_ms:     Model computation timestep
+        :param exact:           Use exact discretization (see :class:`TankModel`)
 
         Computation of ``kv`` and ``ka`` are done as follows:
 
@@ -231,34 +325,8 @@ class TankModel:
         Helpers.ensure_length(robot_length)
         Helpers.ensure_length(wheel_diameter)
 
-        max_velocity = (motor_config.freeSpeed * math.pi * wheel_diameter) / gearing
-        max_acceleration = (2.0 * nmotors * motor_config.stallTorque * gearing) / (
-            wheel_diameter * robot_mass
-        )
-
-        Helpers.ensure_velocity(max_velocity)
-        Helpers.ensure_acceleration(max_acceleration)
-
-        kv = motor_config.nominalVoltage / max_velocity
-        ka = motor_config.nominalVoltage / max_acceleration
-
-        kv = units.tm_kv.from_(kv, name="kv")
-        ka = units.tm_ka.from_(ka, name="ka")
-
-        logger.info(
-            "Motor config: %d %s motors @ %.2f gearing with %.1f diameter wheels",
-            nmotors,
-            motor_config.name,
-            gearing,
-            wheel_diameter.m,
-        )
-
-        logger.info(
-            "- Theoretical: vmax=%.3f ft/s, amax=%.3f ft/s^2, kv=%.3f, ka=%.3f",
-            max_velocity.m_as(units.foot / units.second),
-            max_acceleration.m_as(units.foot / units.second**2),
-            kv.m,
-            ka.m,
+        kv, ka = _theory_kv_ka(
+            motor_config, robot_mass, gearing, nmotors, wheel_diameter
         )
 
         return cls(
@@ -274,6 +342,7 @@ class TankModel:
             ka,
             vintercept,
             timestep,
+            exact,
         )
 
     def __init__(
@@ -290,6 +359,7 @@ class TankModel:
         r_ka: units.Quantity,
         r_vi: units.volts,
         timestep: units.Quantity = 5 * units.ms,
+        exact: bool = False,
     ):
         """
         Use the constructor if you have measured ``kv``, ``ka``, and
@@ -315,6 +385,14 @@ class TankModel:
         :param r_ka:         Right side ``ka``
         :param r_vi:         Right side ``Vintercept``
         :param timestep:     Model computation timestep
+        :param exact:        If True, the motors are advanced using their
+                             closed form solution and the robot moves along
+                             a single arc per call, instead of integrating
+                             in ``timestep`` increments. This makes the cost
+                             of :meth:`calculate` independent of ``tm_diff``.
+
+        .. versionchanged:: 2026.1.0
+           Added ``exact`` parameter
         """
 
         # check input parameters
@@ -341,6 +419,7 @@ class TankModel:
         self._bm = _bm_units.m_from((x_wheelbase / 2.0) * robot_mass)
 
         self._timestep = units.milliseconds.m_from(timestep, name="timestep") * 100
+        self._exact = exact
 
     @property
     def l_velocity(self):
@@ -399,6 +478,15 @@ class TankModel:
 
         .. versionadded:: 2020.1.0
         """
+        return Transform2d.fromFeet(*self._step(l_motor, r_motor, tm_diff))
+
+    def _step(
+        self, l_motor: float, r_motor: float, tm_diff: float
+    ) -> typing.Tuple[float, float, float]:
+        # returns x, y (in feet) and angle offsets of robot travel
+
+        if self._exact:
+            return self._step_exact(l_motor, r_motor, tm_diff)
 
         # This isn't quite right, the right way is to use matrix math. However,
         # this is Good Enough for now...
@@ -443,4 +531,351 @@ class TankModel:
             y += distance * math.sin(angle)
             angle += turn
 
-        return Transform2d.fromFeet(x, y, angle)
+        return x, y, angle
+
+    def _step_exact(
+        self, l_motor: float, r_motor: float, tm_diff: float
+    ) -> typing.Tuple[float, float, float]:
+        l_position = self._lmotor.position
+        r_position = self._rmotor.position
+
+        self._lmotor.compute_exact(l_motor, tm_diff)
+        self._rmotor.compute_exact(-r_motor, tm_diff)
+
+        l_distance = self._lmotor.position - l_position
+        r_distance = self._rmotor.position - r_position
+
+        # The rotation rate is proportional to the difference in wheel
+        # velocities, so integrating it gives the difference in distances
+        distance = (l_distance + r_distance) * 0.5
+        angle = self._bm * (r_distance - l_distance) / self._inertia
+
+        # move along a constant curvature arc (exact when both sides are at
+        # steady state, and a close approximation otherwise)
+        x, y = _arc_offset(distance, angle)
+        return x, y, angle
+
+    def rollout(
+        self,
+        l_cmds: typing.Sequence[float],
+        r_cmds: typing.Sequence[float],
+        dt: typing.Union[float, typing.Sequence[float]],
+    ) -> "TankModelRollout":
+        """
+        Applies a sequence of motor commands and returns the entire resulting
+        trajectory. This is equivalent to calling :meth:`calculate` once per
+        command and composing the resulting transforms, but doesn't create any
+        wpimath objects along the way.
+
+        The trajectory is relative to the robot pose before the first
+        command. The model state (velocity, position, etc) is updated just as
+        if :meth:`calculate` had been called.
+
+        :param l_cmds: Left motor values (-1 to 1); 1 is forward
+        :param r_cmds: Right motor values (-1 to 1); -1 is forward
+        :param dt:     Duration of each command, either a single value or
+                       one value per command
+
+        :returns: State of the robot after each command
+
+        .. versionadded:: 2026.1.0
+        """
+        l_cmds = np.asarray(l_cmds, dtype=float)
+        r_cmds = np.asarray(r_cmds, dtype=float)
+        n = len(l_cmds)
+        if len(r_cmds) != n:
+            raise ValueError("l_cmds and r_cmds must be the same length")
+
+        dts = np.broadcast_to(np.asarray(dt, dtype=float), (n,))
+
+        result = TankModelRollout(
+            x=np.empty(n),
+            y=np.empty(n),
+            heading=np.empty(n),
+            l_position=np.empty(n),
+            r_position=np.empty(n),
+            l_velocity=np.empty(n),
+            r_velocity=np.empty(n),
+        )
+
+        lmotor = self._lmotor
+        rmotor = self._rmotor
+        step = self._step
+        cos = math.cos
+        sin = math.sin
+
+        x = 0.0
+        y = 0.0
+        heading = 0.0
+
+        for i, (l_motor, r_motor, tm_diff) in enumerate(
+            zip(l_cmds.tolist(), r_cmds.tolist(), dts.tolist())
+        ):
+            dx, dy, dheading = step(l_motor, r_motor, tm_diff)
+
+            # same as Pose2d + Transform2d
+            c = cos(heading)
+            s = sin(heading)
+            x += dx * c - dy * s
+            y += dx * s + dy * c
+            heading += dheading
+
+            result.x[i] = x
+            result.y[i] = y
+            result.heading[i] = heading
+            result.l_position[i] = lmotor.position
+            result.r_position[i] = rmotor.position
+            result.l_velocity[i] = lmotor.velocity
+            result.r_velocity[i] = rmotor.velocity
+
+        return result
+
+
+@dataclasses.dataclass
+class TankModelRollout:
+    """
+    Trajectory returned by :meth:`TankModel.rollout`. Each array has one
+    element per motor command, containing the state after that command.
+
+    .. versionadded:: 2026.1.0
+    """
+
+    #: X position (in feet)
+    x: np.ndarray
+    #: Y position (in feet)
+    y: np.ndarray
+    #: Heading (in radians, not wrapped to +/- pi)
+    heading: np.ndarray
+    #: Linear position of the left side wheel (in feet)
+    l_position: np.ndarray
+    #: Linear position of the right side wheel (in feet)
+    r_position: np.ndarray
+    #: Velocity of the left side (in ft/s)
+    l_velocity: np.ndarray
+    #: Velocity of the right side (in ft/s)
+    r_velocity: np.ndarray
+
+
+class TankModelBatch:
+    """
+    Simulates many independent :class:`TankModel` instances at once, with
+    the state of each instance stored in NumPy arrays. This is useful for
+    parameter sweeps, where you want to see how thousands of variations of
+    gearing, mass, ``kv``/``ka``, etc. behave.
+
+    :meth:`calculate` produces the same results as calling
+    :meth:`TankModel.calculate` on each model individually::
+
+        from pyfrc.physics import motor_cfgs, tankmodel
+        from pyfrc.physics.units import units
+
+        batch = tankmodel.TankModelBatch.theory(
+            [
+                dict(
+                    motor_config=motor_cfgs.MOTOR_CFG_CIM,
+                    robot_mass=mass * units.lbs,
+                    gearing=gearing,
+                    nmotors=2,
+                )
+                for mass in range(90, 130, 5)
+                for gearing in (8.45, 10.71, 12.75)
+            ]
+        )
+
+        for _ in range(100):
+            x, y, angle = batch.calculate(1.0, -1.0, 0.02)
+
+    .. versionadded:: 2026.1.0
+    """
+
+    @classmethod
+    def theory(
+        cls, param_sets: typing.Sequence[typing.Dict[str, typing.Any]]
+    ) -> "TankModelBatch":
+        """
+        Creates a batch from a list of keyword argument dictionaries, each of
+        which is passed to :meth:`TankModel.theory`
+        """
+        return cls.from_models([TankModel.theory(**params) for params in param_sets])
+
+    @classmethod
+    def from_models(cls, models: typing.Sequence[TankModel]) -> "TankModelBatch":
+        """
+        Creates a batch from existing models. The current state of each model
+        is copied into the batch, the models themselves are not modified.
+        """
+        return cls(models)
+
+    def __init__(self, models: typing.Sequence[TankModel]):
+        if not models:
+            raise ValueError("at least one model is required")
+
+        exact = {m._exact for m in models}
+        if len(exact) != 1:
+            raise ValueError("all models must use the same 'exact' setting")
+        self._exact = exact.pop()
+
+        def _motor_array(attr: str, side: str) -> np.ndarray:
+            return np.array(
+                [getattr(getattr(m, side), attr) for m in models], dtype=float
+            )
+
+        for side, prefix in (("_lmotor", "l"), ("_rmotor", "r")):
+            setattr(self, f"_{prefix}_nominal", _motor_array("_nominalVoltage", side))
+            setattr(self, f"_{prefix}_vi", _motor_array("_vintercept", side))
+            setattr(self, f"_{prefix}_kv", _motor_array("_kv", side))
+            setattr(self, f"_{prefix}_ka", _motor_array("_ka", side))
+
+        #: Left side velocity of each instance (in ft/s)
+        self.l_velocity = _motor_array("velocity", "_lmotor")
+        #: Right side velocity of each instance (in ft/s)
+        self.r_velocity = _motor_array("velocity", "_rmotor")
+        #: Left side acceleration of each instance (in ft/s^2)
+        self.l_acceleration = _motor_array("acceleration", "_lmotor")
+        #: Right side acceleration of each instance (in ft/s^2)
+        self.r_acceleration = _motor_array("acceleration", "_rmotor")
+        #: Left side wheel position of each instance (in feet)
+        self.l_position = _motor_array("position", "_lmotor")
+        #: Right side wheel position of each instance (in feet)
+        self.r_position = _motor_array("position", "_rmotor")
+
+        self._bm = np.array([m._bm for m in models], dtype=float)
+        self._inertia = np.array([m._inertia for m in models], dtype=float)
+        self._timestep = np.array([m._timestep for m in models], dtype=float)
+
+    def __len__(self) -> int:
+        return len(self._bm)
+
+    @staticmethod
+    def _applied_voltage(motor_pct, nominal: np.ndarray, vi: np.ndarray) -> np.ndarray:
+        v = nominal * motor_pct
+        return np.copysign(np.maximum(np.abs(v) - vi, 0.0), v)
+
+    def calculate(
+        self,
+        l_motor: typing.Union[float, np.ndarray],
+        r_motor: typing.Union[float, np.ndarray],
+        tm_diff: float,
+    ) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Advances every instance by ``tm_diff`` seconds.
+
+        :param l_motor: Left motor value (-1 to 1); 1 is forward. Either a
+                        single value for all instances or an array with one
+                        value per instance.
+        :param r_motor: Right motor value (-1 to 1); -1 is forward
+        :param tm_diff: Elapsed time since last call to this function
+
+        :returns: arrays of x, y (in feet) and angle (in radians) that each
+                  instance moved, relative to its previous pose
+        """
+
+        l_voltage = self._applied_voltage(l_motor, self._l_nominal, self._l_vi)
+        r_voltage = self._applied_voltage(-r_motor, self._r_nominal, self._r_vi)
+
+        if self._exact:
+            return self._calculate_exact(l_voltage, r_voltage, tm_diff)
+
+        # split the time difference into timestep_ms steps, exactly as
+        # TankModel.calculate does (but each instance can have its own
+        # timestep, so the number of steps varies)
+        total_time = int(tm_diff * 100000)
+        steps = total_time // self._timestep
+        remainder = total_time % self._timestep
+        step = self._timestep / 100000.0
+        last_step = np.where(remainder != 0, remainder / 100000.0, step)
+        steps = steps + (remainder != 0)
+
+        n = len(self)
+        x = np.zeros(n)
+        y = np.zeros(n)
+        angle = np.zeros(n)
+
+        l_kv, l_ka = self._l_kv, self._l_ka
+        r_kv, r_ka = self._r_kv, self._r_ka
+        bm = self._bm
+        inertia = self._inertia
+
+        max_steps = int(steps.max()) if n else 0
+        uniform = bool(np.all(steps == max_steps))
+
+        for i in range(max_steps):
+            # instances that are finished take a zero-length step, which
+            # doesn't change anything except the acceleration
+            dt = np.where(i == steps - 1, last_step, step)
+            if not uniform:
+                active = i < steps
+                dt = np.where(active, dt, 0.0)
+
+            l, l_acc = self._heun(
+                self.l_velocity, self.l_acceleration, l_voltage, l_kv, l_ka, dt
+            )
+            r, r_acc = self._heun(
+                self.r_velocity, self.r_acceleration, r_voltage, r_kv, r_ka, dt
+            )
+
+            self.l_position += (self.l_velocity + l) * 0.5 * dt
+            self.r_position += (self.r_velocity + r) * 0.5 * dt
+            self.l_velocity = l
+            self.r_velocity = r
+
+            if uniform:
+                self.l_acceleration = l_acc
+                self.r_acceleration = r_acc
+            else:
+                self.l_acceleration = np.where(active, l_acc, self.l_acceleration)
+                self.r_acceleration = np.where(active, r_acc, self.r_acceleration)
+
+            distance = (l + r) * 0.5 * dt
+            turn = bm * (r - l) / inertia * dt
+
+            x += distance * np.cos(angle)
+            y += distance * np.sin(angle)
+            angle += turn
+
+        return x, y, angle
+
+    @staticmethod
+    def _heun(v0, a0, voltage, kv, ka, dt):
+        # same operations (and order) as MotorModel.compute
+        v1 = v0 + a0 * dt
+        a1 = (voltage - kv * v1) / ka
+        v1 = v0 + (a0 + a1) * 0.5 * dt
+        a1 = (voltage - kv * v1) / ka
+        return v1, a1
+
+    def _calculate_exact(self, l_voltage, r_voltage, tm_diff):
+        l_distance, self.l_velocity, self.l_acceleration = self._exact_motor(
+            self.l_velocity, l_voltage, self._l_kv, self._l_ka, tm_diff
+        )
+        r_distance, self.r_velocity, self.r_acceleration = self._exact_motor(
+            self.r_velocity, r_voltage, self._r_kv, self._r_ka, tm_diff
+        )
+
+        self.l_position = self.l_position + l_distance
+        self.r_position = self.r_position + r_distance
+
+        distance = (l_distance + r_distance) * 0.5
+        angle = self._bm * (r_distance - l_distance) / self._inertia
+
+        # see TankModel._step_exact
+        small = np.abs(angle) < 1e-9
+        radius = distance / np.where(small, 1.0, angle)
+        x = np.where(small, distance, radius * np.sin(angle))
+        y = np.where(small, distance * angle * 0.5, radius * (1.0 - np.cos(angle)))
+
+        return x, y, angle
+
+    @staticmethod
+    def _exact_motor(velocity, voltage, kv, ka, tm_diff):
+        # see MotorModel.compute_exact
+        tau = ka / kv
+        vss = voltage / kv
+        dv0 = velocity - vss
+        decay = -np.expm1(-tm_diff / tau)
+
+        distance = vss * tm_diff + dv0 * tau * decay
+        velocity = vss + dv0 * (1.0 - decay)
+        acceleration = (voltage - kv * velocity) / ka
+
+        return distance, velocity, acceleration
@@ -1,10 +1,35 @@
 """
 The 'vision simulator' provides objects that assist in modeling inputs
 from a camera processing system.
+
+.. versionchanged:: 2026.1.0
+
+   Targets can be created from an AprilTag field layout using
+   :meth:`VisionSim.from_apriltag_layout`, and several cameras can be
+   simulated using :class:`MultiCameraVisionSim`
 """
 
 import collections
+import dataclasses
+import heapq
+import itertools
+import json
 import math
+import os
+import typing
+
+import numpy as np
+from wpimath.geometry import (
+    Pose2d,
+    Pose3d,
+    Quaternion,
+    Rotation3d,
+    Transform2d,
+    Translation3d,
+)
+
+if typing.TYPE_CHECKING:
+    from .occlusion import Occluder
 
 inf = float("inf")
 twopi = math.pi * 2.0
@@ -75,6 +100,191 @@ class VisionSimTarget:
             return (1, now, offset, distance)
 
 
+def _read_layout_json(fname) -> typing.List[typing.Tuple[int, Pose3d]]:
+    with open(fname) as fp:
+        data = json.load(fp)
+
+    tags = []
+    for tag in data["tags"]:
+        t = tag["pose"]["translation"]
+        q = tag["pose"]["rotation"]["quaternion"]
+        pose = Pose3d(
+            Translation3d(t["x"], t["y"], t["z"]),
+            Rotation3d(Quaternion(q["W"], q["X"], q["Y"], q["Z"])),
+        )
+        tags.append((tag["ID"], pose))
+    return tags
+
+
+def _layout_tags(layout) -> typing.List[typing.Tuple[int, Pose3d]]:
+    if isinstance(layout, (str, os.PathLike)):
+        return _read_layout_json(layout)
+    return [(tag.ID, tag.pose) for tag in layout.getTags()]
+
+
+def apriltag_targets(layout, view_angle: float = 150) -> typing.List[VisionSimTarget]:
+    """
+    Creates a target for each tag in an AprilTag field layout. A tag faces
+    along the x axis of its pose, so each target can be seen from within
+    ``view_angle`` degrees centered on the direction that the tag faces.
+    Positions are in meters, and each target has a ``tag_id`` attribute.
+
+    :param layout:     ``robotpy_apriltag.AprilTagFieldLayout``, or the
+                       filename of a field layout JSON file (which doesn't
+                       require robotpy_apriltag to be installed)
+    :param view_angle: Angle in front of each tag that it can be seen from
+                       (in degrees)
+
+    .. versionadded:: 2026.1.0
+    """
+    tags = _layout_tags(layout)
+
+    half = view_angle / 2.0
+    targets = []
+    for tag_id, pose in tags:
+        facing = math.degrees(pose.rotation().Z())
+        target = VisionSimTarget(pose.X(), pose.Y(), facing - half, facing + half)
+        target.tag_id = tag_id
+        targets.append(target)
+
+    return targets
+
+
+def _target_state(targets: typing.List[VisionSimTarget]) -> list:
+    # used to detect changes to targets after they were loaded
+    return [
+        (target, target.x, target.y, target.view_angle_start, target.view_angle_end)
+        for target in targets
+    ]
+
+
+class _TargetSet:
+    """
+    Evaluates the same checks as :meth:`VisionSimTarget.compute` for many
+    targets at once. Target positions and view intervals are stored in
+    NumPy arrays, and targets are binned into a grid with cells as large as
+    the maximum view distance so that only targets in the cells around the
+    camera need to be checked.
+    """
+
+    def __init__(
+        self,
+        targets: typing.List[VisionSimTarget],
+        fov2: float,
+        view_dst_start: float,
+        view_dst_end: float,
+    ):
+        self.fov2 = fov2
+        self.view_dst_start = view_dst_start
+        self.view_dst_end = view_dst_end
+
+        # one element per target
+        self.x = np.array([t.x for t in targets], dtype=float)
+        self.y = np.array([t.y for t in targets], dtype=float)
+        self.view_start = np.array([t.view_angle_start for t in targets], dtype=float)
+        self.view_span = np.remainder(
+            np.array([t.view_angle_end for t in targets], dtype=float)
+            - self.view_start,
+            twopi,
+        )
+
+        self._cell_size = float(view_dst_end)
+        self._cells: typing.Dict[typing.Tuple[int, int], typing.List[int]] = {}
+        for i, target in enumerate(targets):
+            cell = self._cell(target.x, target.y)
+            self._cells.setdefault(cell, []).append(i)
+
+        # candidates are cached per cell
+        self._candidates: typing.Dict[typing.Tuple[int, int], np.ndarray] = {}
+
+    def _cell(self, x, y) -> typing.Tuple[int, int]:
+        if self._cell_size <= 0 or math.isinf(self._cell_size):
+            return 0, 0
+        return math.floor(x / self._cell_size), math.floor(y / self._cell_size)
+
+    def candidates(self, x, y) -> np.ndarray:
+        cell = self._cell(x, y)
+        candidates = self._candidates.get(cell)
+        if candidates is None:
+            cx, cy = cell
+            indices = []
+            for ix in (cx - 1, cx, cx + 1):
+                for iy in (cy - 1, cy, cy + 1):
+                    indices.extend(self._cells.get((ix, iy), ()))
+            candidates = self._candidates[cell] = np.array(
+                sorted(indices), dtype=np.intp
+            )
+        return candidates
+
+    def visible(
+        self, x, y, angle, occluder: typing.Optional["Occluder"] = None
+    ) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :returns: indices of the visible targets, their offset from the
+                  camera angle (radians) and their distance, unsorted
+        """
+        idx = self.candidates(x, y)
+        if len(idx) == 0:
+            return idx, np.zeros(0), np.zeros(0)
+
+        dx = self.x[idx] - x
+        dy = self.y[idx] - y
+        distance = np.hypot(dx, dy)
+        target_angle = np.arctan2(dy, dx)
+        shifted = target_angle + math.pi
+
+        a = angle - self.fov2 + math.pi
+        b = angle + self.fov2 + math.pi
+
+        visible = (
+            (distance >= self.view_dst_start)
+            & (distance <= self.view_dst_end)
+            & (
+                np.remainder(shifted - self.view_start[idx], twopi)
+                <= self.view_span[idx]
+            )
+            & (np.remainder(shifted - a, twopi) <= (b - a) % twopi)
+        )
+
+        found = np.flatnonzero(visible)
+        if occluder is not None and len(found):
+            found = found[
+                ~occluder.blocked(x, y, self.x[idx[found]], self.y[idx[found]])
+            ]
+
+        offset = np.remainder((target_angle[found] - angle) + math.pi, twopi) - math.pi
+        return idx[found], offset, distance[found]
+
+    def compute(
+        self,
+        now,
+        x,
+        y,
+        angle,
+        max_targets: typing.Optional[int] = None,
+        occluder: typing.Optional["Occluder"] = None,
+    ) -> typing.List[tuple]:
+        _, offset, distance = self.visible(x, y, angle, occluder)
+        if len(offset) == 0:
+            return []
+
+        offset = np.degrees(offset)
+
+        # order by absolute offset, only sorting the targets that are returned
+        key = np.abs(offset)
+        k = max_targets
+        if k is not None and k < len(key):
+            top = np.argpartition(key, k - 1)[:k]
+            order = top[np.argsort(key[top], kind="stable")]
+        else:
+            order = np.argsort(key, kind="stable")
+
+        return [
+            (1, now, o, d)
+            for o, d in zip(offset[order].tolist(), distance[order].tolist())
+        ]
+
+
 class VisionSim:
     """
     This helper object is designed to help you simulate input from a
@@ -128,6 +338,8 @@ class VisionSim:
         data_frequency=15,
         data_lag=0.050,
         physics_controller=None,
+        max_targets: typing.Optional[int] = None,
+        occluder: typing.Optional["Occluder"] = None,
     ):
         """
         There are a lot of constructor parameters:
@@ -141,6 +353,18 @@ class VisionSim:
         :param data_lag:         How long it takes for the camera data to be processed
                                  and make it to the robot
         :param physics_controller: If set, will draw target information in UI
+        :param max_targets:      If set, only this many targets (the ones with the
+                                 smallest offset) are returned
+        :param occluder:         If set, targets that are hidden by field elements
+                                 or robots are not returned (see :mod:`pyfrc.physics.occlusion`)
+
+        .. versionchanged:: 2026.1.0
+
+           Added ``max_targets`` and ``occluder``. Targets are evaluated together using NumPy;
+           if ``targets`` is modified or a target is moved, the targets are
+           reloaded on the next call to :meth:`compute`. Targets whose class
+           overrides :meth:`VisionSimTarget.compute` are evaluated one at a
+           time using that method.
         """
 
         fov2 = math.radians(camera_fov / 2.0)
@@ -152,8 +376,6 @@ class VisionSim:
         self.last_compute_time = -10
         self.send_queue = collections.deque()
 
-        self.targets = targets
-
         assert view_dst_start < view_dst_end
         assert self.data_lag > 0.001
 
@@ -161,16 +383,84 @@ class VisionSim:
         # if physics_controller:
         #     objects = physics_controller.config_obj["pyfrc"]["field"]["objects"]
 
+        self.max_targets = max_targets
+        self.occluder = occluder
+        self._camera_fov = camera_fov
+        self._fov2 = fov2
+        self._view_dst_start = view_dst_start
+        self._view_dst_end = view_dst_end
+
+        self.set_targets(targets)
+
+    def set_targets(self, targets: typing.List[VisionSimTarget]):
+        """
+        Replaces the targets that the camera can see
+
+        .. versionadded:: 2026.1.0
+        """
+        self.targets = targets
+
         for target in targets:
-            target.camera_fov = camera_fov
-            target.view_dst_start = view_dst_start
-            target.view_dst_end = view_dst_end
-            target.fov2 = fov2
+            target.camera_fov = self._camera_fov
+            target.view_dst_start = self._view_dst_start
+            target.view_dst_end = self._view_dst_end
+            target.fov2 = self._fov2
 
             # objects.append(
             #     {"color": "red", "rect": [target.x - 0.1, target.y - 0.1, 0.4, 0.4]}
             # )
 
+        self._target_set = _TargetSet(
+            targets, self._fov2, self._view_dst_start, self._view_dst_end
+        )
+        self._target_state = _target_state(targets)
+
+        # subclasses that override compute are evaluated individually
+        self._compute_each = any(
+            type(target).compute is not VisionSimTarget.compute for target in targets
+        )
+
+    def load_apriltag_layout(self, layout, view_angle: float = 150):
+        """
+        Replaces the targets with the tags in an AprilTag field layout. See
+        :func:`apriltag_targets`.
+
+        .. versionadded:: 2026.1.0
+        """
+        self.set_targets(apriltag_targets(layout, view_angle))
+
+    @classmethod
+    def from_apriltag_layout(
+        cls,
+        layout,
+        camera_fov,
+        view_dst_start,
+        view_dst_end,
+        view_angle: float = 150,
+        **kwargs,
+    ) -> "VisionSim":
+        """
+        Creates a vision simulator that can see the tags in an AprilTag
+        field layout. See :func:`apriltag_targets`. Since the tag positions
+        are in meters, the view distances and robot positions passed to
+        :meth:`compute` must also be in meters.
+
+        :param layout:     ``robotpy_apriltag.AprilTagFieldLayout``, or the
+                           filename of a field layout JSON file
+        :param view_angle: Angle in front of each tag that it can be seen
+                           from (in degrees)
+        :param kwargs:     Other arguments for the constructor
+
+        .. versionadded:: 2026.1.0
+        """
+        return cls(
+            apriltag_targets(layout, view_angle),
+            camera_fov,
+            view_dst_start,
+            view_dst_end,
+            **kwargs,
+        )
+
     def dont_compute(self):
         """
         Call this when vision processing should be disabled
@@ -206,20 +496,13 @@ class VisionSim:
         """
 
         # Normalize angle to [-180,180]
-        output = []
         angle = ((angle + math.pi) % (math.pi * 2)) - math.pi
-
-        for target in self.targets:
-            proposed = target.compute(now, x, y, angle)
-            if proposed:
-                output.append(proposed)
+        output = self._compute_targets(now, x, y, angle)
 
         if not output:
             output.append((0, now, inf, 0))
             self.distance = None
         else:
-            # order by absolute offset
-            output.sort(key=lambda i: abs(i[2]))
             self.distance = output[-1][3]
 
         # Only store stuff every once in awhile
@@ -232,3 +515,241 @@ class VisionSim:
             output = self.send_queue[-1]
             if now - output[0][1] > self.data_lag:
                 return self.send_queue.pop()
+
+    def _compute_targets(self, now, x, y, angle) -> typing.List[tuple]:
+        # targets may have been changed by the user since they were loaded
+        targets = self.targets
+        if _target_state(targets) != self._target_state:
+            self.set_targets(targets)
+
+        if self._compute_each:
+            return self._compute_each_target(now, x, y, angle)
+
+        return self._target_set.compute(
+            now, x, y, angle, self.max_targets, self.occluder
+        )
+
+    def _compute_each_target(self, now, x, y, angle) -> typing.List[tuple]:
+        found = []
+        for target in self.targets:
+            proposed = target.compute(now, x, y, angle)
+            if proposed:
+                found.append((target, proposed))
+
+        if self.occluder is not None and found:
+            blocked = self.occluder.blocked(
+                x, y, [t.x for t, _ in found], [t.y for t, _ in found]
+            )
+            found = [item for item, b in zip(found, blocked.tolist()) if not b]
+
+        # order by absolute offset
+        output = [proposed for _, proposed in found]
+        output.sort(key=lambda i: abs(i[2]))
+        if self.max_targets is not None:
+            del output[self.max_targets :]
+        return output
+
+
+@dataclasses.dataclass
+class VisionCamera:
+    """
+    Describes a camera used by :class:`MultiCameraVisionSim`
+
+    .. versionadded:: 2026.1.0
+    """
+
+    #: Name of the camera, used to identify its frames
+    name: str
+
+    #: Location of the camera relative to the center of the robot
+    robot_to_camera: Transform2d
+
+    #: Field of view of camera (in degrees)
+    fov: float
+
+    #: If the camera is closer than this, a target cannot be seen
+    view_dst_start: float
+
+    #: If the camera is farther than this, a target cannot be seen
+    view_dst_end: float
+
+    #: Frames captured per second
+    fps: float = 15
+
+    #: Average time between capturing a frame and the result reaching the robot
+    latency: float = 0.050
+
+    #: Standard deviation of the latency. Latency is never less than zero.
+    latency_stddev: float = 0.0
+
+    #: If set, only this many targets (the ones with the smallest offset)
+    #: are returned in each frame
+    max_targets: typing.Optional[int] = None
+
+
+@dataclasses.dataclass
+class VisionFrame:
+    """
+    Results of a single frame captured by a :class:`VisionCamera`
+
+    .. versionadded:: 2026.1.0
+    """
+
+    #: Name of the camera that captured the frame
+    camera: str
+
+    #: Time that the frame was captured
+    capture_time: float
+
+    #: Time that the frame reached the robot
+    release_time: float
+
+    #: Visible targets as (1, capture_time, offset_degrees, distance) tuples,
+    #: ordered by absolute offset (same as :meth:`VisionSim.compute`). This is
+    #: empty if no targets were visible.
+    targets: typing.List[tuple]
+
+
+class MultiCameraVisionSim:
+    """
+    Simulates several cameras mounted on the robot, each with its own
+    position, field of view, frame rate and latency.
+
+    Upcoming captures and frames that are waiting for their latency to
+    expire are kept in a single heap ordered by time, so each call to
+    :meth:`compute` only does work for cameras that are due to capture a
+    frame and frames that are due to be released::
+
+        # in PhysicsEngine.__init__
+        self.vision = MultiCameraVisionSim.from_apriltag_layout(
+            "field.json",
+            [
+                VisionCamera("front", Transform2d(0.3, 0, 0), 70, 0.3, 6, fps=30),
+                VisionCamera("back", Transform2d(-0.3, 0, math.pi), 70, 0.3, 6),
+            ],
+        )
+
+        # in PhysicsEngine.update_sim
+        for frame in self.vision.compute(now, self.physics_controller.get_pose()):
+            ...
+
+    Positions and distances must use the same units as the targets (meters
+    when using an AprilTag layout).
+
+    .. versionadded:: 2026.1.0
+    """
+
+    def __init__(
+        self,
+        targets: typing.List[VisionSimTarget],
+        cameras: typing.Sequence[VisionCamera],
+        seed: typing.Optional[int] = None,
+        occluder: typing.Optional["Occluder"] = None,
+    ):
+        """
+        :param targets:  Targets that the cameras can see
+        :param cameras:  Cameras on the robot
+        :param seed:     Seed used to generate random latencies
+        :param occluder: If set, targets that are hidden by field elements
+                         or robots are not returned (see :mod:`pyfrc.physics.occlusion`)
+        """
+        self.cameras = list(cameras)
+        self.occluder = occluder
+        self._rng = np.random.default_rng(seed)
+        self.set_targets(targets)
+        self.reset()
+
+    @classmethod
+    def from_apriltag_layout(
+        cls,
+        layout,
+        cameras: typing.Sequence[VisionCamera],
+        view_angle: float = 150,
+        **kwargs,
+    ) -> "MultiCameraVisionSim":
+        """
+        Creates a vision simulator that can see the tags in an AprilTag
+        field layout. See :func:`apriltag_targets`.
+        """
+        return cls(apriltag_targets(layout, view_angle), cameras, **kwargs)
+
+    def set_targets(self, targets: typing.List[VisionSimTarget]):
+        """Replaces the targets that the cameras can see"""
+        self.targets = targets
+        self._target_sets = [
+            _TargetSet(
+                targets,
+                math.radians(camera.fov / 2.0),
+                camera.view_dst_start,
+                camera.view_dst_end,
+            )
+            for camera in self.cameras
+        ]
+
+    def reset(self):
+        """
+        Discards frames that haven't been released yet. Each camera will
+        capture a frame on the next call to :meth:`compute`. Call this when
+        vision processing is disabled.
+        """
+        # entries are (time, sequence, camera index, frame); frame is None
+        # for a capture event
+        self._heap: typing.List[
+            typing.Tuple[float, int, int, typing.Optional[VisionFrame]]
+        ] = []
+        self._seq = itertools.count()
+        self._start: typing.Optional[float] = None
+
+    def compute(self, now: float, pose: Pose2d) -> typing.List[VisionFrame]:
+        """
+        Captures frames for cameras that are due, and returns the frames
+        whose latency has expired (ordered by release time).
+
+        :param now:  The value passed to ``update_sim``
+        :param pose: Current pose of the robot
+        """
+        heap = self._heap
+        if self._start is None:
+            self._start = now
+            for i in range(len(self.cameras)):
+                heapq.heappush(heap, (now, next(self._seq), i, None))
+
+        released = []
+        while heap and heap[0][0] <= now:
+            tm, _, i, frame = heapq.heappop(heap)
+            if frame is not None:
+                released.append(frame)
+                continue
+
+            camera = self.cameras[i]
+            frame = self._capture(i, camera, now, pose)
+            heapq.heappush(heap, (frame.release_time, next(self._seq), i, frame))
+
+            # schedule the next capture, skipping any that were missed
+            next_capture = tm + 1.0 / camera.fps
+            if next_capture <= now:
+                next_capture = now + 1.0 / camera.fps
+            heapq.heappush(heap, (next_capture, next(self._seq), i, None))
+
+        return released
+
+    def _capture(
+        self, i: int, camera: VisionCamera, now: float, pose: Pose2d
+    ) -> VisionFrame:
+        camera_pose = pose.transformBy(camera.robot_to_camera)
+        angle = camera_pose.rotation().radians()
+
+        targets = self._target_sets[i].compute(
+            now,
+            camera_pose.X(),
+            camera_pose.Y(),
+            angle,
+            camera.max_targets,
+            self.occluder,
+        )
+
+        latency = camera.latency
+        if camera.latency_stddev > 0:
+            latency = max(0.0, self._rng.normal(latency, camera.latency_stddev))
+
+        return VisionFrame(camera.name, now, now + latency, targets)
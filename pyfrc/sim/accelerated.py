@@ -0,0 +1,249 @@
+"""
+Runs the robot code with the simulation clock driven by pyfrc instead of
+the wall clock. This is what ``robotpy sim --nogui --speed N`` and
+``robotpy sim --nogui --max-speed`` use, and it is useful for soak-testing
+long scenarios without having to wait for them in real time.
+
+A driver station schedule can be provided as a TOML file, which is a list
+of modes and how long (in simulated seconds) to stay in each of them::
+
+    [[step]]
+    mode = "disabled"
+    duration = 1
+
+    [[step]]
+    mode = "autonomous"
+    duration = 15
+
+    [[step]]
+    mode = "teleop"
+    duration = 135
+
+Valid modes are ``disabled``, ``autonomous``, ``teleop`` and ``test``. The
+simulation exits when the schedule is complete, when ``duration`` has
+elapsed, or when the optional ``until`` callable returns True.
+"""
+
+import dataclasses
+import logging
+import pathlib
+import threading
+import time
+import typing
+
+import tomli
+import wpilib
+from wpilib.simulation import DriverStationSim, pauseTiming, stepTiming
+
+logger = logging.getLogger("pyfrc.sim")
+
+_modes = {
+    # mode: (enabled, autonomous, test)
+    "disabled": (False, False, False),
+    "autonomous": (True, True, False),
+    "teleop": (True, False, False),
+    "test": (True, False, True),
+}
+
+
+@dataclasses.dataclass
+class DsScheduleStep:
+    """A single step of a driver station schedule"""
+
+    #: One of disabled, autonomous, teleop, or test
+    mode: str
+
+    #: Simulated seconds to stay in this mode
+    duration: float
+
+    def __post_init__(self):
+        if self.mode not in _modes:
+            raise ValueError(
+                f"invalid mode {self.mode!r} (must be one of {', '.join(_modes)})"
+            )
+        if self.duration <= 0:
+            raise ValueError(f"duration must be positive (got {self.duration})")
+
+
+def _robot_starter():
+    # RobotBase.main doesn't provide access to the robot instance, or a way
+    # to stop the robot without reporting an error, so the class that it
+    # uses internally is used instead
+    try:
+        from wpilib._impl.start import RobotStarter
+    except ImportError as e:
+        raise RuntimeError(
+            f"accelerated simulation is not supported by wpilib {wpilib.__version__}"
+            " (wpilib._impl.start.RobotStarter is not available)"
+        ) from e
+
+    return RobotStarter()
+
+
+def load_ds_schedule(fname: pathlib.Path) -> typing.List[DsScheduleStep]:
+    """Loads a driver station schedule from a TOML file"""
+    with open(fname, "rb") as fp:
+        data = tomli.load(fp)
+
+    return [DsScheduleStep(**step) for step in data.get("step", [])]
+
+
+class AcceleratedSim:
+    """
+    Steps the simulation clock from a separate thread while the robot
+    runs. If ``speed`` is None, time is stepped as fast as possible,
+    otherwise the simulation is throttled to ``speed`` times real time.
+    """
+
+    def __init__(
+        self,
+        speed: typing.Optional[float] = None,
+        schedule: typing.Optional[typing.Sequence[DsScheduleStep]] = None,
+        duration: typing.Optional[float] = None,
+        until: typing.Optional[typing.Callable[[wpilib.RobotBase], bool]] = None,
+    ):
+        """
+        :param speed:    Real time factor to run at, or None for as fast as
+                         possible
+        :param schedule: Driver station modes to step through
+        :param duration: Maximum simulated seconds to run for
+        :param until:    Called with the robot after each step, simulation
+                         exits when it returns True
+        """
+        assert speed is None or speed > 0
+
+        self.speed = speed
+        self.schedule = list(schedule) if schedule else []
+        self.duration = duration
+        self.until = until
+
+        #: Simulated seconds elapsed
+        self.sim_time = 0.0
+
+        #: Wall clock seconds elapsed
+        self.wall_time = 0.0
+
+        #: Wall clock seconds spent in each step
+        self.step_times: typing.List[float] = []
+
+        self._starter = _robot_starter()
+        self._initialized = threading.Event()
+        self._init_ok = False
+        self._stop = False
+
+    def run(self, robot_class: typing.Type[wpilib.RobotBase]) -> bool:
+        """Runs the robot until an exit condition is reached"""
+
+        sim = self
+
+        class AcceleratedRobot(robot_class):
+            def robotInit(self):
+                try:
+                    super().robotInit()
+                    sim._init_ok = True
+                finally:
+                    sim._initialized.set()
+
+        AcceleratedRobot.__name__ = robot_class.__name__
+        AcceleratedRobot.__module__ = robot_class.__module__
+        AcceleratedRobot.__qualname__ = robot_class.__qualname__
+
+        pauseTiming()
+
+        th = threading.Thread(target=self._step_thread, name="SimStepper", daemon=True)
+        th.start()
+
+        try:
+            return self._starter.run(AcceleratedRobot)
+        finally:
+            # wake up the stepper if the robot failed before robotInit, and
+            # stop it if the robot exited on its own
+            self._stop = True
+            self._initialized.set()
+            th.join()
+
+    def _step_thread(self):
+        self._initialized.wait()
+
+        robot = self._starter.robot
+        if robot is None or not self._init_ok:
+            logger.error("robot failed to initialize, not stepping simulation")
+            return
+
+        period = getattr(robot, "getPeriod", lambda: 0.020)()
+
+        schedule = iter(self.schedule)
+        step_end = 0.0
+        current = None
+
+        if self.schedule:
+            DriverStationSim.setDsAttached(True)
+
+        # small tolerance so that accumulated float error doesn't cause an
+        # extra step to be taken
+        eps = period * 1e-6
+
+        start = time.perf_counter()
+        step_times = self.step_times
+        steps = 0
+
+        while not self._stop:
+            if self.duration is not None and self.sim_time >= self.duration - eps:
+                break
+
+            if self.schedule and self.sim_time >= step_end - eps:
+                current = next(schedule, None)
+                if current is None:
+                    break
+
+                step_end += current.duration
+                enabled, autonomous, test = _modes[current.mode]
+                DriverStationSim.setEnabled(enabled)
+                DriverStationSim.setAutonomous(autonomous)
+                DriverStationSim.setTest(test)
+                logger.info("t=%.2f: %s", self.sim_time, current.mode)
+
+            DriverStationSim.notifyNewData()
+
+            t = time.perf_counter()
+            stepTiming(period)
+            step_times.append(time.perf_counter() - t)
+
+            steps += 1
+            self.sim_time = steps * period
+
+            if self.until is not None and self.until(robot):
+                break
+
+            if self.speed is not None:
+                delay = start + self.sim_time / self.speed - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+        self.wall_time = time.perf_counter() - start
+
+        if not self._stop:
+            self._starter.suppressExitWarning = True
+            robot.endCompetition()
+
+    def print_stats(self):
+        """Prints the achieved real time factor and step statistics"""
+
+        step_times = sorted(self.step_times)
+        if not step_times or self.wall_time <= 0:
+            print("No simulation steps were executed")
+            return
+
+        n = len(step_times)
+        mean = sum(step_times) / n
+
+        print(
+            f"Simulated {self.sim_time:.2f}s in {self.wall_time:.2f}s "
+            f"({self.sim_time / self.wall_time:.1f}x real time)"
+        )
+        print(
+            f"- {n} steps: mean={mean * 1000:.3f}ms "
+            f"p50={step_times[n // 2] * 1000:.3f}ms "
+            f"p99={step_times[min(n - 1, int(n * 0.99))] * 1000:.3f}ms "
+            f"max={step_times[-1] * 1000:.3f}ms"
+        )
@@ -0,0 +1,330 @@
+"""
+Measures how regularly the robot loop and physics updates run while the
+simulator is running. Enable it with ``robotpy sim --monitor``.
+
+For each loop the monitor tracks the actual period, the jitter (difference
+from the expected period) and the number of overruns (periods that were
+late by more than the allowed tolerance). A rolling histogram of the
+jitter over the most recent loops is published to NetworkTables under
+``/pyfrc/monitor/<loop>``, and a JSON summary of the whole run is written
+when the simulator exits.
+
+All measurements are wall clock times, so when combined with ``--speed``
+or ``--max-speed`` they describe how fast the simulation is running, not
+the simulated time.
+"""
+
+import collections
+import inspect
+import json
+import logging
+import pathlib
+import time
+import typing
+
+import ntcore
+import wpilib
+
+from ..physics.core import PhysicsInterface
+
+logger = logging.getLogger("pyfrc.sim")
+
+# Methods that IterativeRobotBase calls in each loop before robotPeriodic
+_LOOP_METHODS = (
+    "driverStationConnected",
+    "disabledExit",
+    "autonomousExit",
+    "teleopExit",
+    "testExit",
+    "disabledInit",
+    "autonomousInit",
+    "teleopInit",
+    "testInit",
+    "disabledPeriodic",
+    "autonomousPeriodic",
+    "teleopPeriodic",
+    "testPeriodic",
+)
+
+
+class LoopStats:
+    """
+    Period/jitter statistics for a single loop. Jitter is binned into a
+    histogram of ``bin_width`` second bins, with the last bin collecting
+    everything larger.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        expected_period: float,
+        window: int = 500,
+        bin_width: float = 0.0005,
+        nbins: int = 40,
+        overrun_tolerance: float = 0.25,
+    ):
+        """
+        :param name:              Name of the loop
+        :param expected_period:   Period the loop is supposed to run at (seconds)
+        :param window:            Number of recent periods in the rolling histogram
+        :param bin_width:         Width of each histogram bin (seconds)
+        :param nbins:             Number of histogram bins
+        :param overrun_tolerance: A period longer than ``expected_period * (1 + overrun_tolerance)``
+                                  counts as an overrun
+        """
+        self.name = name
+        self.expected_period = expected_period
+        self.bin_width = bin_width
+        self.overrun_threshold = expected_period * (1.0 + overrun_tolerance)
+
+        #: Number of periods measured
+        self.count = 0
+
+        #: Number of periods that were too long
+        self.overruns = 0
+
+        self.period_sum = 0.0
+        self.period_min = float("inf")
+        self.period_max = 0.0
+
+        #: Time spent executing the loop body
+        self.busy_sum = 0.0
+        self.busy_max = 0.0
+
+        #: Number of times :meth:`busy` was called
+        self.busy_count = 0
+
+        #: Jitter histogram for the entire run
+        self.histogram = [0] * nbins
+
+        #: Jitter histogram for the last ``window`` periods
+        self.rolling_histogram = [0] * nbins
+
+        self._window: typing.Deque[int] = collections.deque(maxlen=window)
+        self._last_start: typing.Optional[float] = None
+
+    def start(self, tm: float):
+        """Call at the start of each loop iteration"""
+        last_start = self._last_start
+        self._last_start = tm
+        if last_start is None:
+            return
+
+        period = tm - last_start
+
+        self.count += 1
+        self.period_sum += period
+        if period < self.period_min:
+            self.period_min = period
+        if period > self.period_max:
+            self.period_max = period
+        if period > self.overrun_threshold:
+            self.overruns += 1
+
+        nbins = len(self.histogram)
+        idx = min(int(abs(period - self.expected_period) / self.bin_width), nbins - 1)
+        self.histogram[idx] += 1
+
+        window = self._window
+        if len(window) == window.maxlen:
+            self.rolling_histogram[window[0]] -= 1
+        window.append(idx)
+        self.rolling_histogram[idx] += 1
+
+    def busy(self, duration: float):
+        """Records how long the loop body took to execute"""
+        self.busy_sum += duration
+        self.busy_count += 1
+        if duration > self.busy_max:
+            self.busy_max = duration
+
+    def jitter_percentile(self, pct: float) -> float:
+        """Approximate jitter percentile (upper edge of the histogram bin)"""
+        target = self.count * pct
+        total = 0
+        for i, n in enumerate(self.histogram):
+            total += n
+            if total >= target:
+                return (i + 1) * self.bin_width
+        return len(self.histogram) * self.bin_width
+
+    def summary(self) -> typing.Dict[str, typing.Any]:
+        count = self.count
+        return {
+            "expected_period": self.expected_period,
+            "count": count,
+            "overruns": self.overruns,
+            "period_mean": self.period_sum / count if count else None,
+            "period_min": self.period_min if count else None,
+            "period_max": self.period_max if count else None,
+            "busy_mean": self.busy_sum / self.busy_count if self.busy_count else None,
+            "busy_max": self.busy_max,
+            "jitter_p50": self.jitter_percentile(0.5) if count else None,
+            "jitter_p99": self.jitter_percentile(0.99) if count else None,
+            "jitter_bin_width": self.bin_width,
+            "jitter_histogram": self.histogram,
+        }
+
+
+class LoopMonitor:
+    """
+    Attaches to a robot class and collects :class:`LoopStats` for the robot
+    loop and (if physics is enabled) for physics updates.
+    """
+
+    def __init__(
+        self,
+        physics: typing.Optional[PhysicsInterface],
+        publish_period: float = 1.0,
+        **stats_kwargs,
+    ):
+        """
+        :param physics:        The physics interface, if any
+        :param publish_period: Minimum seconds between NetworkTables updates
+        :param stats_kwargs:   Passed to each :class:`LoopStats`
+        """
+        self.physics = physics
+        self.publish_period = publish_period
+        self._stats_kwargs = stats_kwargs
+
+        self.robot_stats: typing.Optional[LoopStats] = None
+        self.physics_stats: typing.Optional[LoopStats] = None
+
+        self._loop_start = 0.0
+        self._in_loop = False
+        self._next_publish = 0.0
+        self._publishers: typing.Dict[str, typing.Any] = {}
+
+    def attach(
+        self, robot_class: typing.Type[wpilib.RobotBase]
+    ) -> typing.Type[wpilib.RobotBase]:
+        """Returns a robot class that reports its loop timing to this monitor"""
+
+        monitor = self
+        physics = self.physics
+        perf_counter = time.perf_counter
+
+        class MonitorRobot(robot_class):
+            def robotPeriodic(self):
+                monitor._begin_loop(self)
+                super().robotPeriodic()
+
+            def _simulationPeriodic(self):
+                tm = perf_counter()
+                last_tm = physics.last_tm if physics is not None else None
+                super()._simulationPeriodic()
+                now = perf_counter()
+
+                # last_tm only changes when update_sim was called
+                physics_stats = monitor.physics_stats
+                if (
+                    physics_stats is not None
+                    and last_tm is not None
+                    and physics.last_tm != last_tm
+                ):
+                    physics_stats.start(tm)
+                    physics_stats.busy(now - tm)
+
+                # _simulationPeriodic is the last thing called in each loop
+                robot_stats = monitor.robot_stats
+                if robot_stats is not None and monitor._in_loop:
+                    monitor._in_loop = False
+                    robot_stats.busy(now - monitor._loop_start)
+                    if now >= monitor._next_publish:
+                        monitor._next_publish = now + monitor.publish_period
+                        monitor._publish()
+
+        # The loop function itself can't be overridden, so the loop starts
+        # at whichever of these methods is called first after the previous
+        # loop ended. The mode methods are called before robotPeriodic, and
+        # only need to be measured if the robot implements them.
+        for name in _LOOP_METHODS:
+            if inspect.isfunction(getattr(robot_class, name, None)):
+                setattr(MonitorRobot, name, self._wrap(MonitorRobot, name))
+
+        MonitorRobot.__name__ = robot_class.__name__
+        MonitorRobot.__module__ = robot_class.__module__
+        MonitorRobot.__qualname__ = robot_class.__qualname__
+
+        return MonitorRobot
+
+    def _begin_loop(self, robot: wpilib.RobotBase):
+        if not self._in_loop:
+            tm = time.perf_counter()
+            robot_stats = self.robot_stats
+            if robot_stats is None:
+                robot_stats = self._create_stats(robot)
+            robot_stats.start(tm)
+            self._loop_start = tm
+            self._in_loop = True
+
+    def _wrap(self, robot_class: typing.Type[wpilib.RobotBase], name: str):
+        monitor = self
+
+        def method(robot):
+            monitor._begin_loop(robot)
+            return getattr(super(robot_class, robot), name)()
+
+        method.__name__ = name
+        return method
+
+    def _create_stats(self, robot: wpilib.RobotBase) -> LoopStats:
+        period = getattr(robot, "getPeriod", lambda: 0.020)()
+        self.robot_stats = LoopStats("robot", period, **self._stats_kwargs)
+        if self.physics is not None:
+            # physics runs at most once per robot loop, and never faster than 100hz
+            self.physics_stats = LoopStats(
+                "physics", max(period, 0.010), **self._stats_kwargs
+            )
+        return self.robot_stats
+
+    def _publish(self):
+        table = None
+        for stats in (self.robot_stats, self.physics_stats):
+            if stats is None or stats.count == 0:
+                continue
+
+            pubs = self._publishers.get(stats.name)
+            if pubs is None:
+                if table is None:
+                    table = ntcore.NetworkTableInstance.getDefault().getTable(
+                        "pyfrc/monitor"
+                    )
+                subtable = table.getSubTable(stats.name)
+                pubs = self._publishers[stats.name] = (
+                    subtable.getDoubleTopic("period_mean").publish(),
+                    subtable.getDoubleTopic("period_max").publish(),
+                    subtable.getIntegerTopic("overruns").publish(),
+                    subtable.getDoubleArrayTopic("jitter_histogram").publish(),
+                )
+
+            period_mean, period_max, overruns, histogram = pubs
+            period_mean.set(stats.period_sum / stats.count)
+            period_max.set(stats.period_max)
+            overruns.set(stats.overruns)
+            histogram.set([float(n) for n in stats.rolling_histogram])
+
+    def summary(self) -> typing.Dict[str, typing.Any]:
+        return {
+            stats.name: stats.summary()
+            for stats in (self.robot_stats, self.physics_stats)
+            if stats is not None
+        }
+
+    def write_summary(self, fname: pathlib.Path):
+        """Writes a JSON summary of all loop statistics"""
+        with open(fname, "w") as fp:
+            json.dump(self.summary(), fp, indent=2)
+
+        for stats in (self.robot_stats, self.physics_stats):
+            if stats is not None and stats.count:
+                logger.info(
+                    "%s loop: %d periods, mean=%.2fms max=%.2fms, %d overruns",
+                    stats.name,
+                    stats.count,
+                    stats.period_sum / stats.count * 1000.0,
+                    stats.period_max * 1000.0,
+                    stats.overruns,
+                )
+
+        logger.info("Loop monitor summary written to %s", fname)
@@ -0,0 +1,122 @@
+import hal
+import pytest
+import wpilib
+import wpilib.simulation
+
+from pyfrc.physics.bindings import SensorBindings
+from pyfrc.physics.units import units
+
+
+class Model:
+    l_position = 0.0
+    l_velocity = 0.0
+    angle = 0.0
+
+
+def test_bind_setter():
+    model = Model()
+    values = []
+
+    bindings = SensorBindings()
+    bindings.bind(
+        model,
+        "l_position",
+        values.append,
+        scale=2,
+        offset=1,
+        source_units=units.foot,
+        sensor_units=units.inch,
+    )
+    bindings.bind(model, lambda m: m.l_velocity * 10, values.append, integer=True)
+    assert len(bindings) == 2
+
+    assert bindings.sync() == 2
+    assert values == [1, 0]
+
+    model.l_position = 1.0
+    assert bindings.sync() == 1
+    assert values[2] == 25
+
+    # unchanged values aren't written
+    assert bindings.sync() == 0
+
+    bindings.invalidate()
+    assert bindings.sync() == 2
+
+
+def test_bind_units_mismatch():
+    with pytest.raises(ValueError):
+        SensorBindings().bind(Model(), "angle", print, source_units=units.foot)
+
+
+def test_bind_encoder():
+    encoder = wpilib.Encoder(0, 1)
+    encoder.setDistancePerPulse(0.0001)
+
+    model = Model()
+    bindings = SensorBindings()
+    bindings.bind_encoder(
+        wpilib.simulation.EncoderSim(encoder),
+        model,
+        position="l_position",
+        rate="l_velocity",
+        source_units=units.foot,
+        sensor_units=units.meter,
+    )
+
+    model.l_position = 10
+    model.l_velocity = -2
+    bindings.sync()
+
+    assert encoder.getDistance() == pytest.approx(3.048, abs=1e-3)
+    assert encoder.getRate() == pytest.approx(-0.6096)
+
+
+def test_bind_encoder_ticks():
+    encoder = wpilib.Encoder(2, 3)
+
+    model = Model()
+    bindings = SensorBindings()
+    bindings.bind_encoder(
+        wpilib.simulation.EncoderSim(encoder),
+        model,
+        position="l_position",
+        ticks_per_unit=360,
+    )
+
+    model.l_position = 1.5
+    bindings.sync()
+    assert encoder.get() == 540
+    assert len(bindings) == 1
+
+    # the count and the distance would both write to the same encoder
+    encoder_sim = wpilib.simulation.EncoderSim(encoder)
+    with pytest.raises(ValueError):
+        bindings.bind_encoder(
+            encoder_sim, model, "l_position", "l_velocity", ticks_per_unit=360
+        )
+    with pytest.raises(ValueError):
+        bindings.bind_encoder(
+            encoder_sim,
+            model,
+            "l_position",
+            source_units=units.foot,
+            sensor_units=units.meter,
+            ticks_per_unit=360,
+        )
+
+
+def test_bind_sim_value_late():
+    model = Model()
+    bindings = SensorBindings()
+    bindings.bind_sim_value("test_bindings_gyro", "angle", model, "angle", scale=-1)
+
+    # device doesn't exist yet
+    assert bindings.sync() == 0
+
+    device = hal.SimDevice("test_bindings_gyro")
+    angle = device.createDouble("angle", False, 0.0)
+
+    model.angle = 45
+    assert bindings.sync() == 1
+    assert angle.get() == -45
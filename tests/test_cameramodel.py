@@ -0,0 +1,117 @@
+import math
+
+import numpy as np
+import pytest
+
+from wpimath.geometry import (
+    Pose2d,
+    Pose3d,
+    Rotation2d,
+    Rotation3d,
+    Transform3d,
+    Translation3d,
+)
+
+from pyfrc.physics.cameramodel import CameraModel
+
+
+def _tags():
+    return [
+        # facing -x, 1m up
+        (1, Pose3d(Translation3d(5, 0, 1), Rotation3d(0, 0, math.pi))),
+        # facing +x, behind the robot
+        (2, Pose3d(Translation3d(-5, 0, 1), Rotation3d(0, 0, 0))),
+        # facing -x, but far to the side
+        (3, Pose3d(Translation3d(5, 10, 1), Rotation3d(0, 0, math.pi))),
+        # facing away from the robot
+        (4, Pose3d(Translation3d(6, 0, 1), Rotation3d(0, 0, 0))),
+    ]
+
+
+def _camera(**kwargs):
+    camera = CameraModel(
+        640,
+        480,
+        500,
+        500,
+        320,
+        240,
+        Transform3d(Translation3d(0, 0, 1), Rotation3d()),
+        **kwargs,
+    )
+    camera.set_tags(_tags(), tag_size=0.2)
+    return camera
+
+
+def test_project_centered():
+    camera = _camera()
+    detections = camera.project(Pose2d())
+
+    assert detections.ids.tolist() == [1]
+    assert detections.distances == pytest.approx([5])
+
+    # 0.2m tag at 5m with f=500 is 20 pixels across
+    expected = [[310, 250], [330, 250], [330, 230], [310, 230]]
+    assert detections.corners.shape == (1, 4, 2)
+    assert np.allclose(detections.corners[0], expected)
+
+
+def test_project_matches_pinhole():
+    camera = _camera()
+    pose = Pose2d(1, -0.5, Rotation2d.fromDegrees(10))
+    detections = camera.project(pose)
+    assert detections.ids.tolist() == [1]
+
+    # project each corner individually
+    camera_pose = Pose3d(pose).transformBy(camera.robot_to_camera)
+    s = 0.1
+    for corner, (dy, dz) in zip(
+        detections.corners[0], [(-s, -s), (s, -s), (s, s), (-s, s)]
+    ):
+        # tag faces -x, so its +y is the field's -y
+        point = Pose3d(Translation3d(5, -dy, 1 + dz), Rotation3d())
+        rel = point.relativeTo(camera_pose).translation()
+        u = 320 + 500 * (-rel.Y() / rel.X())
+        v = 240 + 500 * (-rel.Z() / rel.X())
+        assert corner == pytest.approx([u, v])
+
+
+def test_project_rotated():
+    camera = _camera()
+
+    # facing backwards sees tag 2
+    detections = camera.project(Pose2d(0, 0, Rotation2d.fromDegrees(180)))
+    assert detections.ids.tolist() == [2]
+
+    # nothing in view
+    detections = camera.project(Pose2d(0, 0, Rotation2d.fromDegrees(-90)))
+    assert detections.ids.tolist() == []
+    assert detections.corners.shape == (0, 4, 2)
+
+
+def test_project_min_distance():
+    camera = _camera(min_distance=5.05)
+
+    # 5m straight ahead
+    assert camera.project(Pose2d()).ids.tolist() == []
+
+    # still 5m deep, but further away than min_distance
+    detections = camera.project(Pose2d(0, -1, Rotation2d()))
+    assert detections.ids.tolist() == [1]
+    assert detections.distances == pytest.approx([math.hypot(5, 1)])
+
+
+def test_project_noise():
+    clean = _camera().project(Pose2d())
+    noisy1 = _camera(noise_stddev=1.0, seed=5).project(Pose2d())
+    noisy2 = _camera(noise_stddev=1.0, seed=5).project(Pose2d())
+
+    assert np.array_equal(noisy1.corners, noisy2.corners)
+    assert not np.array_equal(noisy1.corners, clean.corners)
+    assert np.abs(noisy1.corners - clean.corners).max() < 6
+
+
+def test_from_fov():
+    camera = CameraModel.from_fov(640, 480, 90, Transform3d())
+    assert camera.K[0, 0] == pytest.approx(400)
+    assert camera.K[0, 2] == pytest.approx(319.5)
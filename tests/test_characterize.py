@@ -0,0 +1,166 @@
+import argparse
+import math
+import struct
+
+import numpy as np
+import pytest
+
+from pyfrc.physics import characterize
+
+
+def _simulate(kv, ka, vi, dt=0.005):
+    # forward and reverse voltage ramps
+    t = []
+    volts = []
+    vel = []
+    tm = 0.0
+    v = 0.0
+    for direction in (1, -1):
+        for target in (3.0, 6.0, 9.0):
+            for i in range(400):
+                voltage = direction * min(target, 0.05 * i + 2.0)
+                friction = vi * math.copysign(1.0, v) if v else vi * direction
+                t.append(tm)
+                volts.append(voltage)
+                vel.append(v)
+                # small steps to keep the data close to the continuous model
+                for _ in range(10):
+                    a = (voltage - kv * v - friction) / ka
+                    v += a * dt / 10
+                tm += dt
+    return np.array(t), np.array(volts), np.array(vel)
+
+
+def test_side_fitter_chunks():
+    t, volts, vel = _simulate(0.9, 0.25, 1.1)
+
+    whole = characterize.SideFitter()
+    whole.add(t, volts, vel)
+
+    chunked = characterize.SideFitter()
+    for i in range(0, len(t), 7):
+        chunked.add(t[i : i + 7], volts[i : i + 7], vel[i : i + 7])
+
+    r1 = whole.solve()
+    r2 = chunked.solve()
+
+    assert r1.samples == r2.samples
+    assert math.isclose(r1.kv, r2.kv, rel_tol=1e-9)
+    assert math.isclose(r1.ka, r2.ka, rel_tol=1e-9)
+    assert math.isclose(r1.vintercept, r2.vintercept, rel_tol=1e-9)
+
+    assert math.isclose(r1.kv, 0.9, rel_tol=0.01)
+    assert math.isclose(r1.ka, 0.25, rel_tol=0.02)
+    assert math.isclose(r1.vintercept, 1.1, rel_tol=0.02)
+    assert r1.r_squared > 0.99
+
+
+def test_characterize_csv(tmp_path):
+    t, volts, vel = _simulate(0.9, 0.25, 1.1)
+    _, rvolts, rvel = _simulate(1.0, 0.3, 1.2)
+
+    fname = tmp_path / "log.csv"
+    with open(fname, "w") as fp:
+        fp.write("time,left_v,r_voltage,left_vel,r_velocity\n")
+        for row in zip(t, volts, rvolts, vel * 0.3048, rvel * 0.3048):
+            fp.write(",".join(str(x) for x in row) + "\n")
+
+    left, right = characterize.characterize(
+        fname,
+        {"l_voltage": "left_v", "l_velocity": "left_vel"},
+        distance_units="meter",
+        chunk_size=100,
+    )
+
+    assert math.isclose(left.kv, 0.9, rel_tol=0.01)
+    assert math.isclose(right.kv, 1.0, rel_tol=0.01)
+    assert math.isclose(right.vintercept, 1.2, rel_tol=0.02)
+
+
+def _write_wpilog(fname, names, rows):
+    # minimal DataLog writer: each record uses a 4 byte entry id, a 4 byte
+    # payload size and an 8 byte timestamp
+    def record(entry, timestamp, payload):
+        return struct.pack("<BIIQ", 0x7F, entry, len(payload), timestamp) + payload
+
+    def string(s):
+        data = s.encode()
+        return struct.pack("<I", len(data)) + data
+
+    data = b"WPILOG" + struct.pack("<HI", 0x0100, 0)
+    for entry, name in enumerate(names, 1):
+        payload = b"\x00" + struct.pack("<I", entry)
+        payload += string(name) + string("double") + string("")
+        data += record(0, 0, payload)
+
+    for t, *values in rows:
+        for entry, value in enumerate(values, 1):
+            data += record(entry, int(t * 1000000), struct.pack("<d", value))
+
+    fname.write_bytes(data)
+
+
+def test_characterize_wpilog(tmp_path):
+    t, volts, vel = _simulate(0.9, 0.25, 1.1)
+    _, rvolts, rvel = _simulate(1.0, 0.3, 1.2)
+
+    fname = tmp_path / "log.wpilog"
+    _write_wpilog(
+        fname,
+        ["/drive/left_v", "r_voltage", "/drive/left_vel", "r_velocity", "other"],
+        zip(t, volts, rvolts, vel, rvel, vel),
+    )
+
+    left, right = characterize.characterize(
+        fname,
+        {"l_voltage": "/drive/left_v", "l_velocity": "/drive/left_vel"},
+        chunk_size=100,
+    )
+
+    # every sample was read from the log
+    expected = characterize.SideFitter()
+    expected.add(t, volts, vel)
+    assert left.samples == expected.solve().samples
+
+    assert math.isclose(left.kv, 0.9, rel_tol=0.01)
+    assert math.isclose(right.kv, 1.0, rel_tol=0.01)
+    assert math.isclose(right.vintercept, 1.2, rel_tol=0.02)
+
+
+def test_characterize_missing_column(tmp_path):
+    fname = tmp_path / "log.csv"
+    fname.write_text("time,l_voltage\n0,0\n")
+
+    with pytest.raises(ValueError):
+        characterize.characterize(fname)
+
+
+def test_characterize_blank_rows(tmp_path):
+    t, volts, vel = _simulate(0.9, 0.25, 1.1)
+
+    fname = tmp_path / "log.csv"
+    with open(fname, "w") as fp:
+        fp.write("time,l_voltage,r_voltage,l_velocity,r_velocity\n")
+        for row in zip(t, volts, volts, vel, vel):
+            fp.write(",".join(str(x) for x in row) + "\n")
+        fp.write("\n\n")
+
+    left, _ = characterize.characterize(fname, chunk_size=100)
+    assert math.isclose(left.kv, 0.9, rel_tol=0.01)
+
+
+def test_characterize_bad_units(tmp_path):
+    fname = tmp_path / "log.csv"
+    fname.write_text("time,l_voltage,r_voltage,l_velocity,r_velocity\n")
+
+    for distance_units in ("furlongs_per_fortnight_x", "volt"):
+        with pytest.raises(ValueError):
+            characterize.characterize(fname, distance_units=distance_units)
+
+    from pyfrc.mains.cli_characterize import PyFrcCharacterize
+
+    parser = argparse.ArgumentParser()
+    PyFrcCharacterize(parser)
+    assert parser.parse_args([str(fname), "--distance-units", "meter"])
+    with pytest.raises(SystemExit):
+        parser.parse_args([str(fname), "--distance-units", "bogus"])
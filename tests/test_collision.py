@@ -0,0 +1,124 @@
+import json
+import math
+
+import pytest
+import wpilib
+
+from wpimath.geometry import Pose2d, Rotation2d, Transform2d, Translation2d
+from wpimath.kinematics import ChassisSpeeds
+
+from pyfrc.physics import core
+from pyfrc.physics.collision import CollisionMap
+from pyfrc.physics.units import units
+
+
+def _field():
+    collision_map = CollisionMap(cell_size=1 * units.m)
+    collision_map.add_boundary(16 * units.m, 8 * units.m)
+    collision_map.add_polygon(
+        [
+            Translation2d(7, 3),
+            Translation2d(9, 3),
+            Translation2d(9, 5),
+            Translation2d(7, 5),
+        ]
+    )
+    return collision_map
+
+
+def test_collides():
+    collision_map = _field()
+
+    assert not collision_map.collides(Pose2d(2, 2, Rotation2d()), 0.5, 0.5)
+    assert collision_map.collides(Pose2d(0.3, 2, Rotation2d()), 0.5, 0.5)
+    assert collision_map.collides(Pose2d(6.6, 4, Rotation2d()), 0.5, 0.5)
+
+    # rotating the robot changes its footprint
+    assert collision_map.collides(Pose2d(6.3, 4, Rotation2d()), 0.8, 0.2)
+    assert not collision_map.collides(
+        Pose2d(6.3, 4, Rotation2d.fromDegrees(90)), 0.8, 0.2
+    )
+
+
+def test_query_is_local():
+    collision_map = _field()
+
+    # only the boundary segments near the corner are returned
+    found = collision_map.query(0.2, 0.2, 0.8, 0.8)
+    assert {collision_map.segments[i] for i in found} == {
+        (0.0, 0.0, 0.0, 8.0),
+        (16.0, 0.0, 0.0, 0.0),
+    }
+
+    assert collision_map.query(3.2, 3.2, 3.8, 3.8) == set()
+
+
+def test_resolve_stops_at_wall():
+    collision_map = _field()
+
+    start = Pose2d(5, 4, Rotation2d())
+    end = Pose2d(7, 4, Rotation2d())
+    pose = collision_map.resolve(start, end, 0.5, 0.5)
+
+    assert pose.X() == pytest.approx(6.5, abs=0.01)
+    assert pose.X() < 6.5
+    assert pose.Y() == pytest.approx(4)
+    assert not collision_map.collides(pose, 0.5, 0.5)
+
+
+def test_resolve_slides_along_wall():
+    collision_map = _field()
+
+    start = Pose2d(3, 1, Rotation2d())
+    end = Pose2d(4, -1, Rotation2d())
+    pose = collision_map.resolve(start, end, 0.5, 0.5)
+
+    assert pose.X() == pytest.approx(4)
+    assert pose.Y() == pytest.approx(0.5, abs=0.01)
+    assert not collision_map.collides(pose, 0.5, 0.5)
+
+
+def test_resolve_free_motion():
+    collision_map = _field()
+
+    start = Pose2d(3, 3, Rotation2d())
+    end = Pose2d(3.1, 3.2, Rotation2d(0.1))
+    assert collision_map.resolve(start, end, 0.5, 0.5) == end
+
+
+def test_load(tmp_path):
+    fname = tmp_path / "field.json"
+    fname.write_text(
+        json.dumps(
+            {
+                "segments": [[1, 0, 1, 2]],
+                "polygons": [[[3, 0], [4, 0], [4, 1]]],
+            }
+        )
+    )
+
+    collision_map = CollisionMap.load(fname, cell_size=0.5 * units.m)
+    assert collision_map.cell_size == 0.5
+    assert len(collision_map.segments) == 4
+
+
+def test_physics_interface_collision():
+    interface = core.PhysicsInterface(None)
+    interface.field = wpilib.Field2d()
+    interface.field.setRobotPose(Pose2d(2, 2, Rotation2d()))
+
+    interface.set_collision_map(
+        _field(), robot_width=1 * units.m, robot_length=1 * units.m
+    )
+
+    for _ in range(100):
+        pose = interface.drive(ChassisSpeeds(0, -1, 0), 0.02)
+    assert pose.Y() == pytest.approx(0.5, abs=0.01)
+
+    pose = interface.move_robot(Transform2d(-5, 0, Rotation2d()))
+    assert pose.X() == pytest.approx(0.5, abs=0.01)
+
+    # disabling collisions lets the robot leave the field
+    interface.set_collision_map(None)
+    pose = interface.move_robot(Transform2d(-5, 0, Rotation2d()))
+    assert pose.X() == pytest.approx(-4.5, abs=0.01)
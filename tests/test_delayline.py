@@ -0,0 +1,90 @@
+import math
+
+import numpy as np
+import pytest
+
+from pyfrc.physics.delayline import DelayLine
+
+
+def test_delayline_empty():
+    assert math.isnan(DelayLine(0.1).get(1.0))
+
+
+def test_delayline_delay():
+    line = DelayLine(0.25, capacity=16)
+    for i in range(10):
+        line.push(i * 0.125, float(i))
+
+    # newest sample is at 1.125
+    assert line.get(1.125) == pytest.approx(7)
+    assert line.get(1.0625) == pytest.approx(6.5)
+
+    # clamped at both ends
+    assert line.sample(-1) == 0
+    assert line.sample(10) == 9
+
+
+def test_delayline_hold():
+    line = DelayLine(0.0, interpolate=False)
+    line.push(0.0, 1.0)
+    line.push(1.0, 2.0)
+    assert line.sample(0.99) == 1.0
+    assert line.sample(1.0) == 2.0
+
+
+def test_delayline_wraps():
+    line = DelayLine(0.0, capacity=4)
+    for i in range(10):
+        assert line.update(float(i), float(i)) == i
+
+    assert len(line) == 4
+    assert line.sample(0) == 6
+    assert line.sample(7.5) == pytest.approx(7.5)
+
+
+def test_delayline_out_of_order():
+    line = DelayLine(0.0)
+    line.push(1.0, 1.0)
+    with pytest.raises(ValueError):
+        line.push(0.5, 1.0)
+
+
+def test_delayline_array():
+    line = DelayLine(0.5, width=3)
+    line.push(0.0, [0, 10, 20])
+    line.push(1.0, np.array([1, 11, 21]))
+
+    out = line.get(1.0)
+    assert out.tolist() == pytest.approx([0.5, 10.5, 20.5])
+
+    # the output buffer is reused
+    assert line.get(1.5) is out
+    assert out.tolist() == [1, 11, 21]
+
+
+def test_delayline_noise_quantization():
+    kwargs = dict(capacity=1000, noise_stddev=0.5, quantization=0.25, seed=42)
+    line1 = DelayLine(0.0, **kwargs)
+    line2 = DelayLine(0.0, **kwargs)
+
+    values = [line1.update(i * 0.02, 3.0) for i in range(1000)]
+    assert values == [line2.update(i * 0.02, 3.0) for i in range(1000)]
+
+    values = np.array(values)
+    assert np.all(np.remainder(values, 0.25) == 0)
+    assert values.mean() == pytest.approx(3.0, abs=0.1)
+    assert values.std() == pytest.approx(0.5, abs=0.1)
+
+
+def test_delayline_quantized_interpolation():
+    line = DelayLine(0.01, quantization=1.0)
+    line.push(0.0, 0.0)
+    line.push(0.02, 3.0)
+
+    # halfway between the samples is 1.5, which is rounded
+    assert line.get(0.02) == 2.0
+
+    line = DelayLine(0.013, width=2, quantization=0.25)
+    for i in range(20):
+        out = line.update(i * 0.02, [math.sin(i), i * 0.37])
+        assert np.all(np.remainder(out, 0.25) == 0)
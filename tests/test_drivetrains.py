@@ -1,8 +1,14 @@
+import math
+
+import numpy as np
 import pytest
 from pyfrc.physics import drivetrains
 from pyfrc.physics.units import units
 from math import sqrt
 
+from wpimath.geometry import Rotation2d, Translation2d
+from wpimath.kinematics import SwerveDrive4Kinematics, SwerveModuleState
+
 
 @pytest.mark.parametrize(
     "l_motor,r_motor,output",
@@ -110,3 +116,234 @@ def test_four_motor_swerve_drivetrain(
     assert abs(result.vx_fps - output[0]) < 0.001
     assert abs(result.vy_fps - output[1]) < 0.001
     assert abs(result.omega - output[2]) < 0.001
+
+
+_swerve_positions = [
+    Translation2d(0.3, 0.25),
+    Translation2d(0.3, -0.25),
+    Translation2d(-0.2, 0.25),
+    Translation2d(-0.2, -0.25),
+]
+
+
+@pytest.mark.parametrize(
+    "motors,angles",
+    [
+        ((0, 0, 0, 0), (0, 0, 0, 0)),
+        ((1, 1, 1, 1), (0, 0, 0, 0)),
+        ((0.5, -0.5, 0.25, 1), (0.1, 1.2, -2.0, 3.0)),
+        ((1, 1, 1, 1), (math.pi / 4, -math.pi / 4, 3 * math.pi / 4, -3 * math.pi / 4)),
+    ],
+)
+def test_swerve_drivetrain(motors, angles):
+    drivetrain = drivetrains.SwerveDrivetrain(_swerve_positions, speed=2 * units.mps)
+    result = drivetrain.calculate(motors, angles)
+
+    kinematics = SwerveDrive4Kinematics(*_swerve_positions)
+    expected = kinematics.toChassisSpeeds(
+        tuple(
+            SwerveModuleState(motor * 2, Rotation2d(angle))
+            for motor, angle in zip(motors, angles)
+        )
+    )
+
+    assert result.vx == pytest.approx(expected.vx, abs=1e-9)
+    assert result.vy == pytest.approx(expected.vy, abs=1e-9)
+    assert result.omega == pytest.approx(expected.omega, abs=1e-9)
+
+    for state, motor, angle in zip(drivetrain.moduleStates, motors, angles):
+        assert state.speed == pytest.approx(motor * 2)
+        assert state.angle.radians() == pytest.approx(Rotation2d(angle).radians())
+
+
+def test_swerve_drivetrain_three_modules():
+    positions = [
+        Translation2d(0.4, 0.0),
+        Translation2d(-0.2, 0.3),
+        Translation2d(-0.2, -0.3),
+    ]
+    drivetrain = drivetrains.SwerveDrivetrain(positions, speed=1 * units.mps)
+
+    # point each module tangent to its position so that the robot spins in place
+    omega = 1.5
+    motors = [omega * p.norm() for p in positions]
+    angles = [math.atan2(p.y, p.x) + math.pi / 2 for p in positions]
+
+    result = drivetrain.calculate(motors, angles)
+    assert result.vx == pytest.approx(0, abs=1e-9)
+    assert result.vy == pytest.approx(0, abs=1e-9)
+    assert result.omega == pytest.approx(omega)
+
+
+def test_swerve_drivetrain_requires_modules():
+    with pytest.raises(ValueError):
+        drivetrains.SwerveDrivetrain([Translation2d()])
+
+
+_batch_motors = np.random.default_rng(42).uniform(-1.1, 1.1, (4, 200))
+_batch_motors[:, :5] = 0.0
+_batch_motors[:, 5:10] = 0.2
+
+
+def _custom_deadzone(motor):
+    return motor * 0.5 if abs(motor) > 0.1 else 0.0
+
+
+@pytest.mark.parametrize(
+    "deadzone", [None, drivetrains.linear_deadzone(0.2), _custom_deadzone]
+)
+def test_two_motor_drivetrain_batch(deadzone):
+    drivetrain = drivetrains.TwoMotorDrivetrain(deadzone=deadzone)
+    l_motor, r_motor = _batch_motors[:2]
+    result = drivetrain.calculate_batch(l_motor, r_motor)
+
+    for i in range(len(l_motor)):
+        speeds = drivetrain.calculate(float(l_motor[i]), float(r_motor[i]))
+        assert result.vx[i] == speeds.vx
+        assert result.vy[i] == speeds.vy
+        assert result.omega[i] == speeds.omega
+        assert result.wheel_speeds[i, 0] == drivetrain.wheelSpeeds.left
+        assert result.wheel_speeds[i, 1] == drivetrain.wheelSpeeds.right
+
+
+@pytest.mark.parametrize(
+    "deadzone", [None, drivetrains.linear_deadzone(0.2), _custom_deadzone]
+)
+def test_four_motor_drivetrain_batch(deadzone):
+    drivetrain = drivetrains.FourMotorDrivetrain(deadzone=deadzone)
+    result = drivetrain.calculate_batch(*_batch_motors)
+
+    for i in range(_batch_motors.shape[1]):
+        speeds = drivetrain.calculate(*(float(m) for m in _batch_motors[:, i]))
+        assert result.vx[i] == speeds.vx
+        assert result.vy[i] == speeds.vy
+        assert result.omega[i] == speeds.omega
+        assert result.wheel_speeds[i, 0] == drivetrain.wheelSpeeds.left
+        assert result.wheel_speeds[i, 1] == drivetrain.wheelSpeeds.right
+
+
+@pytest.mark.parametrize(
+    "deadzone", [None, drivetrains.linear_deadzone(0.2), _custom_deadzone]
+)
+def test_mecanum_drivetrain_batch(deadzone):
+    drivetrain = drivetrains.MecanumDrivetrain(deadzone=deadzone)
+    result = drivetrain.calculate_batch(*_batch_motors)
+
+    for i in range(_batch_motors.shape[1]):
+        speeds = drivetrain.calculate(*(float(m) for m in _batch_motors[:, i]))
+        assert result.vx[i] == speeds.vx
+        assert result.vy[i] == speeds.vy
+        assert result.omega[i] == speeds.omega
+
+        ws = drivetrain.wheelSpeeds
+        assert tuple(result.wheel_speeds[i]) == (
+            ws.frontLeft,
+            ws.frontRight,
+            ws.rearLeft,
+            ws.rearRight,
+        )
+
+        # still the same as the wpimath kinematics
+        expected = drivetrain.kinematics.toChassisSpeeds(ws)
+        assert speeds.vx == pytest.approx(expected.vx, abs=1e-12)
+        assert speeds.vy == pytest.approx(expected.vy, abs=1e-12)
+        assert speeds.omega == pytest.approx(expected.omega, abs=1e-12)
+
+
+def test_response_curve_deadzone():
+    deadzone = drivetrains.linear_deadzone(0.2)
+    curve = drivetrains.ResponseCurve(resolution=2000).deadzone(0.2)
+
+    values = np.linspace(-1, 1, 1001)
+    expected = deadzone(values)
+    assert np.allclose(curve(values), expected, atol=1e-3)
+
+    for value in (-1.0, -0.5, 0.0, 0.1, 0.2, 0.3, 1.0):
+        assert curve(value) == pytest.approx(deadzone(value), abs=1e-3)
+
+
+def test_response_curve_scalar_matches_array():
+    curve = (
+        drivetrains.ResponseCurve(resolution=100)
+        .deadzone(0.1)
+        .expo(0.5)
+        .scale(0.8)
+        .then(lambda x: min(x, 0.5))
+    )
+
+    values = np.random.default_rng(0).uniform(-1.5, 1.5, 500)
+    result = curve(values)
+    for i, value in enumerate(values):
+        assert result[i] == curve(float(value))
+
+    assert curve(2.0) == pytest.approx(0.5)
+    assert curve(-2.0) == pytest.approx(-0.8)
+    assert curve(0.0) == 0.0
+
+
+def test_response_curve_is_immutable():
+    base = drivetrains.ResponseCurve()
+    scaled = base.scale(0.5)
+    assert base(1.0) == 1.0
+    assert scaled(1.0) == 0.5
+
+
+def test_response_curve_drivetrain():
+    curve = drivetrains.ResponseCurve().deadzone(0.2).expo(0.3)
+    drivetrain = drivetrains.TwoMotorDrivetrain(deadzone=curve)
+
+    l_motor, r_motor = _batch_motors[:2]
+    result = drivetrain.calculate_batch(l_motor, r_motor)
+    for i in range(len(l_motor)):
+        speeds = drivetrain.calculate(float(l_motor[i]), float(r_motor[i]))
+        assert result.vx[i] == speeds.vx
+        assert result.omega[i] == speeds.omega
+
+
+def test_response_curve_deadzone_exact():
+    curve = drivetrains.ResponseCurve().deadzone(0.1)
+    assert curve(0.0999) == 0.0
+    assert curve(-0.0999) == 0.0
+    assert curve(0.1) == 0.0
+    assert np.all(curve(np.linspace(-0.1, 0.1, 101)) == 0.0)
+
+    # the deadzone edges also come from the previous stages
+    curve = drivetrains.ResponseCurve().scale(0.5).deadzone(0.1).expo(0.3)
+    assert curve(0.1999) == 0.0
+    assert curve(-0.2) == 0.0
+    assert curve(0.21) > 0.0
+
+
+def test_response_curve_non_finite():
+    deadzone = drivetrains.linear_deadzone(0.1)
+    curve = drivetrains.ResponseCurve().deadzone(0.1).scale(0.5)
+
+    assert math.isnan(deadzone(math.nan))
+    assert math.isnan(curve(math.nan))
+    assert curve(math.inf) == 0.5
+    assert curve(-math.inf) == -0.5
+
+    result = curve(np.array([math.nan, math.inf, -math.inf, 0.0]))
+    assert math.isnan(result[0])
+    assert result[1:].tolist() == [0.5, -0.5, 0.0]
+
+
+def test_slew_limiter():
+    limiter = drivetrains.ResponseCurve().scale(0.5).slew(5.0)
+
+    assert limiter.calculate(1.0, 0.02) == pytest.approx(0.1)
+    assert limiter.calculate(1.0, 0.02) == pytest.approx(0.2)
+    assert limiter.calculate(0.3, 0.02) == pytest.approx(0.15)
+    assert limiter.calculate(-1.0, 0.01) == pytest.approx(0.1)
+
+    # the rate is per second, not per call
+    assert limiter.calculate(-1.0, 0.04) == pytest.approx(-0.1)
+
+    limiter.reset(0.5)
+    assert limiter.calculate(-1.0, 0.02) == pytest.approx(0.4)
+
+    # a single limiter would be shared by every motor of a drivetrain
+    with pytest.raises(ValueError):
+        drivetrains.TwoMotorDrivetrain(deadzone=limiter)
+    with pytest.raises(ValueError):
+        drivetrains.FourMotorDrivetrain(deadzone=limiter)
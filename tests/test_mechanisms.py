@@ -0,0 +1,115 @@
+import math
+
+import numpy as np
+import pytest
+
+from pyfrc.physics import motor_cfgs
+from pyfrc.physics.mechanisms import ArmModel, ElevatorModel, FlywheelModel
+from pyfrc.physics.units import units
+
+motor = motor_cfgs.MOTOR_CFG_775PRO
+
+
+def _elevator(**kwargs):
+    return ElevatorModel(motor, 5 * units.kg, 20, 1 * units.inch, **kwargs)
+
+
+def test_elevator_hard_stops():
+    elevator = _elevator(max_height=1.5 * units.m)
+
+    # gravity can't pull it through the floor
+    for _ in range(10):
+        assert elevator.calculate(0, 0.02) == 0
+        assert elevator.velocity == 0
+
+    for _ in range(200):
+        elevator.calculate(1, 0.02)
+    assert elevator.position == 1.5
+    assert elevator.velocity == 0
+
+    for _ in range(200):
+        elevator.calculate(-1, 0.02)
+    assert elevator.position == 0
+
+    assert elevator.cache_info().misses == 1
+
+    # timesteps computed from microsecond timestamps share the cache entry
+    for i in range(1, 101):
+        now = (500000 + i * 20000) / 1e6
+        last = (500000 + (i - 1) * 20000) / 1e6
+        elevator.calculate(0.5, now - last)
+    assert elevator.cache_info().misses == 1
+
+
+def test_elevator_matches_euler():
+    elevator = _elevator(min_height=None)
+
+    # integrate the continuous system with tiny steps
+    x = np.zeros(2)
+    u = np.array((12.0 * 0.5, 1.0))
+    for _ in range(20000):
+        x = x + (elevator.A @ x + elevator.B @ u) * 1e-5
+
+    for _ in range(10):
+        elevator.calculate(0.5, 0.02)
+
+    assert elevator.position == pytest.approx(x[0], rel=1e-3)
+    assert elevator.velocity == pytest.approx(x[1], rel=1e-3)
+
+
+def test_elevator_no_gravity():
+    elevator = _elevator(gravity=False)
+    for _ in range(10):
+        elevator.calculate(0, 0.02)
+    elevator.reset(1.0)
+    for _ in range(10):
+        elevator.calculate(0, 0.02)
+    assert elevator.position == 1.0
+
+
+def test_rollout_matches_calculate():
+    arm = ArmModel(
+        motor,
+        2 * units.kg,
+        100,
+        0.5 * units.m,
+        min_angle=-90 * units.degree,
+        max_angle=90 * units.degree,
+    )
+    motor_pcts = np.sin(np.arange(500) * 0.05)
+
+    rollout = arm.rollout(motor_pcts, 0.02)
+    assert arm.position == 0
+
+    expected = [[arm.calculate(m, 0.02), arm.velocity] for m in motor_pcts]
+    assert rollout.tolist() == expected
+
+
+def test_arm_falls_to_hard_stop():
+    arm = ArmModel(
+        motor,
+        2 * units.kg,
+        10,
+        0.5 * units.m,
+        min_angle=-45 * units.degree,
+    )
+    arm.reset(math.pi / 4)
+    for _ in range(100):
+        arm.calculate(0, 0.02)
+
+    assert arm.position == pytest.approx(-math.pi / 4)
+    assert arm.velocity == 0
+
+
+def test_flywheel():
+    flywheel = FlywheelModel(motor, 0.002 * units.kg * units.m**2, 1)
+
+    motor_pcts = np.concatenate((np.ones(1500), np.zeros(500), -np.ones(100)))
+    rollout = flywheel.rollout(motor_pcts, 0.02)
+    expected = [flywheel.calculate(m, 0.02) for m in motor_pcts]
+    assert rollout == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+    # spins up to about its free speed
+    assert rollout[1499] * 60 / (2 * math.pi) == pytest.approx(18730, rel=0.01)
+    assert rollout[1999] < rollout[1499] / 2
+    assert flywheel.velocity < 0
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from wpilib.simulation import SimDeviceSim
+
+from pyfrc.physics.motion import LinearMotion, MechanismBank
+
+
+def test_bank_matches_linear_motion():
+    motion = LinearMotion("test_bank_linear_ref", 2, 360, 6)
+
+    bank = MechanismBank()
+    bank.add_linear("test_bank_linear", 2, 360, 6)
+
+    for motor in [1, 1, 1, 0.5, -1, -1, 0.25] * 20:
+        expected = motion.compute(motor, 0.1)
+        ticks = bank.compute([motor], 0.1)
+        assert ticks[0] == expected
+        assert bank.positions[0] == pytest.approx(motion.position_ft)
+
+
+def test_bank_limits():
+    bank = MechanismBank()
+    bank.add_linear("test_bank_lim_elevator", 2, 100, max_position=3)
+    bank.add_rotary("test_bank_lim_turret", 90, 360, -45, 45)
+    bank.add_rotary("test_bank_lim_wheel", 360, 4096)
+
+    for _ in range(50):
+        ticks = bank.compute(np.array([1.0, -1.0, 1.0]), 0.1)
+
+    assert bank.positions.tolist() == pytest.approx([3, -45, 1800])
+    assert ticks.tolist() == [300, -45, 20480]
+    assert bank.velocities.tolist() == [2, -90, 360]
+
+    bank.set_position(bank.index("test_bank_lim_turret"), 100)
+    assert bank.positions[1] == 45
+    assert bank.ticks[1] == 45
+
+
+def test_bank_throttled_writes():
+    bank = MechanismBank(write_period=0.1)
+    bank.add_linear("test_bank_writes_a", 1, 1)
+    bank.add_linear("test_bank_writes_b", 1, 1)
+
+    a = SimDeviceSim("test_bank_writes_a").getDouble("position")
+    b = SimDeviceSim("test_bank_writes_b").getDouble("position")
+
+    # first update writes the changed value
+    bank.compute([1, 0], 0.02)
+    assert a.get() == pytest.approx(0.02)
+    assert b.get() == 0
+
+    # throttled
+    for _ in range(4):
+        bank.compute([1, 0], 0.02)
+    assert bank.positions[0] == pytest.approx(0.1)
+    assert a.get() == pytest.approx(0.02)
+
+    bank.compute([1, 0], 0.02)
+    assert a.get() == pytest.approx(0.12)
+
+    # flush writes immediately
+    bank.compute([0, 1], 0.02)
+    assert b.get() == 0
+    bank.flush()
+    assert b.get() == pytest.approx(0.02)
+    assert a.get() == pytest.approx(0.12)
+
+    # unchanged positions aren't written again
+    a.set(5)
+    for _ in range(10):
+        bank.compute([0, 0], 0.02)
+    assert a.get() == 5
+
+
+def test_bank_min_max():
+    with pytest.raises(ValueError):
+        MechanismBank().add_linear("test_bank_bad", 1, 1, max_position=-1)
@@ -0,0 +1,93 @@
+import numpy as np
+
+from wpimath.geometry import Translation2d
+
+from pyfrc.physics.collision import CollisionMap
+from pyfrc.physics.occlusion import Occluder
+from pyfrc.physics.opponents import OpponentRobots
+from pyfrc.physics.units import units
+from pyfrc.physics.visionsim import VisionSim, VisionSimTarget
+
+
+def _brute_force(segments, x, y, tx, ty):
+    blocked = []
+    for ex, ey in zip(tx, ty):
+        rx, ry = ex - x, ey - y
+        hit = False
+        for x1, y1, x2, y2 in segments:
+            sx, sy = x2 - x1, y2 - y1
+            qx, qy = x1 - x, y1 - y
+            denom = rx * sy - ry * sx
+            if denom == 0:
+                continue
+            t = (qx * sy - qy * sx) / denom
+            u = (qx * ry - qy * rx) / denom
+            if 0 <= t < 1 - 1e-6 and 0 <= u <= 1:
+                hit = True
+                break
+        blocked.append(hit)
+    return np.array(blocked)
+
+
+def test_occluder_matches_brute_force():
+    rng = np.random.default_rng(7)
+    start = rng.uniform(0, 16, (100, 2))
+    end = start + rng.uniform(-0.5, 0.5, (100, 2))
+    segments = np.hstack((start, end))
+
+    occluder = Occluder(segments.tolist())
+
+    for _ in range(20):
+        x, y = rng.uniform(0, 16, 2)
+        tx = rng.uniform(0, 16, 50)
+        ty = rng.uniform(0, 16, 50)
+        expected = _brute_force(segments, x, y, tx, ty)
+        assert expected.any()
+        assert not expected.all()
+        assert (occluder.blocked(x, y, tx, ty) == expected).all()
+
+
+def test_occluder_axis_aligned():
+    occluder = Occluder([(2, -1, 2, 1), (-1, 3, 1, 3)])
+
+    blocked = occluder.blocked(0, 0, [4, 0, -4, 0, 4], [0, 4, 0, -4, 4])
+    assert blocked.tolist() == [True, True, False, False, False]
+
+
+def test_occluder_target_on_wall():
+    collision_map = CollisionMap()
+    collision_map.add_boundary(16 * units.m, 8 * units.m)
+    occluder = Occluder.from_collision_map(collision_map)
+
+    # tags mounted on the walls are visible
+    assert not occluder.blocked(8, 4, [0, 16, 8], [4, 4, 8]).any()
+    # but not from outside the field
+    assert occluder.blocked(-1, 4, [16], [4]).all()
+
+
+def test_occluder_robots():
+    opponents = OpponentRobots()
+    opponents.add_waypoints(
+        [Translation2d(3, 0), Translation2d(3, 1)], speed=1 * units.mps
+    )
+    opponents.update(0)
+
+    occluder = Occluder([], opponents=opponents, robot_radius=0.5)
+    assert occluder.blocked(0, 0, [6, 0, 3], [0, 6, 0.2]).tolist() == [
+        True,
+        False,
+        False,
+    ]
+
+
+def test_visionsim_occlusion():
+    occluder = Occluder([(5, -1, 5, 1)])
+    targets = [VisionSimTarget(8, 0, 90, 270), VisionSimTarget(8, 3, 90, 270)]
+
+    vision_sim = VisionSim(targets, 90, 1, 15, data_lag=0.002, occluder=occluder)
+    result = vision_sim._compute_targets(0, 0, 0, 0)
+    assert len(result) == 1
+    assert result[0][2] > 0
+
+    vision_sim.occluder = None
+    assert len(vision_sim._compute_targets(0, 0, 0, 0)) == 2
@@ -0,0 +1,132 @@
+import math
+
+import numpy as np
+import pytest
+import wpilib
+
+from wpimath.geometry import Pose2d, Rotation2d, Translation2d
+
+from pyfrc.physics import core
+from pyfrc.physics.opponents import OpponentRobots
+from pyfrc.physics.units import units
+
+
+def _square():
+    return [
+        Translation2d(0, 0),
+        Translation2d(2, 0),
+        Translation2d(2, 2),
+        Translation2d(0, 2),
+    ]
+
+
+def test_waypoints():
+    opponents = OpponentRobots()
+    assert opponents.add_waypoints(_square(), speed=1 * units.mps) == 0
+    assert opponents.add_waypoints(_square()[:2], speed=2 * units.mps, loop=False) == 1
+
+    opponents.update(10.0)
+    assert np.allclose(opponents.x, [0, 0])
+    assert np.allclose(opponents.y, [0, 0])
+
+    opponents.update(11.5)
+    assert np.allclose(opponents.x, [1.5, 2])
+    assert np.allclose(opponents.y, [0, 0])
+    assert np.allclose(opponents.heading, [0, 0])
+
+    opponents.update(13.0)
+    assert np.allclose(opponents.x, [2, 2])
+    assert np.allclose(opponents.y, [1, 0])
+    assert opponents.heading[0] == pytest.approx(math.pi / 2)
+
+    # the first robot loops back around, the second stays at the end
+    opponents.update(17.5)
+    assert np.allclose(opponents.x, [0, 2])
+    assert np.allclose(opponents.y, [0.5, 0])
+    assert opponents.heading[0] == pytest.approx(-math.pi / 2)
+    opponents.update(19.0)
+    assert np.allclose(opponents.x, [1, 2])
+    assert np.allclose(opponents.y, [0, 0])
+
+
+def test_waypoints_zero_length():
+    opponents = OpponentRobots()
+    point = Translation2d(1, 1)
+    for loop in (True, False):
+        with pytest.raises(ValueError):
+            opponents.add_waypoints(
+                [point, point, point], speed=1 * units.mps, loop=loop
+            )
+
+    # repeated waypoints are fine as long as the robot moves somewhere
+    opponents.add_waypoints([point, point, Translation2d(2, 1)], speed=1 * units.mps)
+    opponents.update(0.0)
+    opponents.update(0.5)
+    assert np.isfinite(opponents.x).all()
+    assert np.isfinite(opponents.heading).all()
+
+
+def test_replay():
+    opponents = OpponentRobots()
+    opponents.add_replay(
+        [5.0, 6.0, 8.0],
+        [
+            Pose2d(0, 0, Rotation2d.fromDegrees(170)),
+            Pose2d(1, 0, Rotation2d.fromDegrees(-170)),
+            Pose2d(1, 2, Rotation2d.fromDegrees(-90)),
+        ],
+    )
+
+    opponents.update(0.0)
+    opponents.update(0.5)
+    assert opponents.x[0] == pytest.approx(0.5)
+    # heading takes the short way around
+    assert abs(opponents.heading[0]) == pytest.approx(math.pi)
+
+    opponents.update(2.0)
+    assert opponents.x[0] == pytest.approx(1)
+    assert opponents.y[0] == pytest.approx(1)
+
+    opponents.update(100.0)
+    (pose,) = opponents.poses()
+    assert pose.X() == pytest.approx(1)
+    assert pose.Y() == pytest.approx(2)
+    assert pose.rotation().degrees() == pytest.approx(-90)
+
+
+def test_query():
+    opponents = OpponentRobots()
+    for x in (1.0, 3.0, -2.0):
+        opponents.add_waypoints(
+            [Translation2d(x, 0), Translation2d(x, 1)], speed=1 * units.mps
+        )
+    opponents.update(0)
+
+    pose = Pose2d(0, 0, Rotation2d.fromDegrees(90))
+    indices, distances, bearings = opponents.query(pose, 2.5)
+    assert indices.tolist() == [0, 2]
+    assert np.allclose(distances, [1, 2])
+    assert np.allclose(bearings, [-math.pi / 2, math.pi / 2])
+
+    assert opponents.nearest(pose) == (0, pytest.approx(1))
+    assert opponents.pairwise_distances()[1, 2] == pytest.approx(5)
+
+    assert OpponentRobots().nearest(pose) == (-1, math.inf)
+
+
+def test_physics_interface_opponents():
+    interface = core.PhysicsInterface(None)
+    interface.field = wpilib.Field2d()
+
+    opponents = OpponentRobots()
+    opponents.add_waypoints(_square(), speed=1 * units.mps)
+    opponents.add_waypoints(_square()[::-1], speed=1 * units.mps)
+    interface.add_opponents(opponents, "Defense")
+
+    interface._update_opponents(1.0)
+    interface._update_opponents(2.0)
+
+    poses = interface.field.getObject("Defense").getPoses()
+    assert len(poses) == 2
+    assert poses[0].X() == pytest.approx(1)
+    assert poses[1].Y() == pytest.approx(2)
@@ -0,0 +1,80 @@
+import argparse
+
+import pytest
+
+from pyfrc.mains.cli_physics_bench import PyFrcPhysicsBench
+from pyfrc.physics.bench import PhysicsBench
+
+
+class _Engine:
+    def __init__(self, physics_controller, robot):
+        self.physics_controller = physics_controller
+        self.robot = robot
+        self.calls = []
+
+    def update_sim(self, now, tm_diff):
+        self.calls.append((now, tm_diff))
+
+
+def test_physics_bench():
+    inputs = []
+
+    bench = PhysicsBench(_Engine, robot="robot")
+    assert bench.engine.robot == "robot"
+    assert bench.engine.physics_controller is bench.interface
+
+    result = bench.run(50, timestep=0.01, inputs=inputs.append, warmup=10)
+
+    assert result.steps == 50
+    assert len(result.latencies) == 50
+    assert result.latencies == sorted(result.latencies)
+    assert result.steps_per_second > 0
+
+    assert len(bench.engine.calls) == 60
+    assert len(inputs) == 60
+    assert abs(bench.engine.calls[-1][0] - 0.6) < 1e-9
+    assert bench.engine.calls[-1][1] == 0.01
+
+
+def _run_cli(project_path):
+    cli = PyFrcPhysicsBench(argparse.ArgumentParser())
+    return cli.run(project_path, steps=5, timestep=0.02, warmup=1, pwm=[(3, 0.5)])
+
+
+def test_physics_bench_cli(tmp_path, capsys):
+    (tmp_path / "physics.py").write_text(
+        "class PhysicsEngine:\n"
+        "    def __init__(self, physics_controller):\n"
+        "        pass\n"
+        "    def update_sim(self, now, tm_diff):\n"
+        "        pass\n"
+    )
+    assert _run_cli(tmp_path) == 0
+    assert capsys.readouterr().out
+
+
+def test_physics_bench_cli_uses_robot(tmp_path, capsys):
+    (tmp_path / "physics.py").write_text(
+        "class PhysicsEngine:\n"
+        "    def __init__(self, physics_controller, robot):\n"
+        "        self.motor = robot.l_motor\n"
+        "    def update_sim(self, now, tm_diff):\n"
+        "        pass\n"
+    )
+    assert _run_cli(tmp_path) == 1
+    err = capsys.readouterr().err
+    assert "'l_motor'" in err
+    assert "robot passed to PhysicsEngine is None" in err
+
+
+def test_physics_bench_cli_error_without_robot(tmp_path):
+    # errors from an engine that doesn't take a robot aren't blamed on it
+    (tmp_path / "physics.py").write_text(
+        "class PhysicsEngine:\n"
+        "    def __init__(self, physics_controller):\n"
+        "        self.motor = None.l_motor\n"
+        "    def update_sim(self, now, tm_diff):\n"
+        "        pass\n"
+    )
+    with pytest.raises(AttributeError):
+        _run_cli(tmp_path)
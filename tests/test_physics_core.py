@@ -0,0 +1,170 @@
+import importlib.util
+import pathlib
+import os
+import sys
+import weakref
+
+from wpilib.simulation import SimDeviceSim
+from wpimath.geometry import Pose2d, Rotation2d
+
+from pyfrc.physics import core
+
+
+def test_load_physics_module(tmp_path: pathlib.Path, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+
+    physics_file = tmp_path / "physics.py"
+    physics_file.write_text("class PhysicsEngine:\n    value = 1\n")
+
+    module1 = core._load_physics_module(physics_file)
+    assert module1.PhysicsEngine.value == 1
+
+    # the import system caches the bytecode next to the source
+    assert pathlib.Path(importlib.util.cache_from_source(str(physics_file))).exists()
+
+    # each load executes the module again
+    module2 = core._load_physics_module(physics_file)
+    assert module2 is not module1
+    assert module2.PhysicsEngine is not module1.PhysicsEngine
+
+
+def _write_newer(path: pathlib.Path, text: str):
+    # ensure the mtime changes even on filesystems with coarse timestamps
+    st = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _reload_interface(physics_file: pathlib.Path) -> core.PhysicsInterface:
+    module = core._load_physics_module(physics_file)
+    interface = core.PhysicsInterface(module, physics_file, reload_period=0)
+    interface._simulationInit(None)
+    return interface
+
+
+def test_physics_hot_reload(tmp_path: pathlib.Path):
+    physics_file = tmp_path / "physics.py"
+    physics_file.write_text("""
+class PhysicsEngine:
+    value = 1
+
+    def __init__(self, physics_controller):
+        self.position = 0
+
+    def get_reload_state(self):
+        return self.position
+
+    def set_reload_state(self, state):
+        self.position = state
+""")
+
+    interface = _reload_interface(physics_file)
+    interface.engine.position = 5
+
+    # unchanged file doesn't reload
+    engine = interface.engine
+    interface._check_reload()
+    assert interface.engine is engine
+
+    # broken file keeps the old engine
+    _write_newer(physics_file, "class PhysicsEngine(\n")
+    interface._check_reload()
+    assert interface.engine is engine
+
+    _write_newer(
+        physics_file,
+        "class PhysicsEngine:\n"
+        "    value = 2\n"
+        "    def __init__(self, physics_controller):\n"
+        "        self.position = 0\n"
+        "    def set_reload_state(self, state):\n"
+        "        self.position = state\n",
+    )
+    interface._check_reload()
+    assert interface.engine is not engine
+    assert interface.engine.value == 2
+    assert interface.engine.position == 5
+
+    # if the new engine can't be created, the previous one is recreated
+    engine = interface.engine
+    _write_newer(
+        physics_file,
+        "class PhysicsEngine:\n"
+        "    def __init__(self, physics_controller):\n"
+        "        raise ValueError()\n",
+    )
+    interface._check_reload()
+    assert interface.engine is not engine
+    assert interface.engine.value == 2
+
+
+def test_physics_hot_reload_revert(tmp_path: pathlib.Path):
+    source = """
+created = []
+
+class PhysicsEngine:
+    value = 1
+
+    def __init__(self, physics_controller):
+        created.append(self)
+"""
+    physics_file = tmp_path / "physics.py"
+    physics_file.write_text(source)
+
+    interface = _reload_interface(physics_file)
+    module = interface.module
+    assert len(module.created) == 1
+
+    _write_newer(physics_file, source.replace("value = 1", "value = 2"))
+    interface._check_reload()
+    assert interface.engine.value == 2
+    edited = interface.module
+    assert edited is not module
+
+    # reverting executes the module again instead of reusing the first one
+    _write_newer(physics_file, source)
+    interface._check_reload()
+    assert interface.engine.value == 1
+    assert interface.module is not module
+    assert interface.module is not edited
+    assert interface.module.created == [interface.engine]
+    assert len(module.created) == 1
+
+    # saving without changes also executes the module again
+    reverted = interface.module
+    _write_newer(physics_file, source)
+    interface._check_reload()
+    assert interface.module is not reverted
+    assert interface.module.created == [interface.engine]
+
+
+def test_physics_hot_reload_sim_devices(tmp_path: pathlib.Path):
+    physics_file = tmp_path / "physics.py"
+    physics_file.write_text("""
+from wpimath.geometry import Pose2d, Rotation2d
+from pyfrc.physics.motion import LinearMotion
+
+class PhysicsEngine:
+    def __init__(self, physics_controller):
+        physics_controller.field.setRobotPose(Pose2d(1, 1, Rotation2d()))
+        self.motion = LinearMotion("test_hot_reload_elevator", 2, 360)
+""")
+
+    interface = _reload_interface(physics_file)
+    assert interface.get_pose() == Pose2d(1, 1, Rotation2d())
+    interface.field.setRobotPose(Pose2d(3, 2, Rotation2d.fromDegrees(90)))
+
+    _write_newer(physics_file, physics_file.read_text() + "\n")
+    engine = weakref.ref(interface.engine)
+    interface._check_reload()
+    assert engine() is None
+
+    # the device of the old engine was released, so the new one is valid
+    motion = interface.engine.motion
+    assert motion.device
+    motion.compute(1, 0.5)
+    value = SimDeviceSim("test_hot_reload_elevator").getDouble("position")
+    assert value.get() == 1
+
+    # the pose is kept, even though the constructor set a starting pose
+    assert interface.get_pose() == Pose2d(3, 2, Rotation2d.fromDegrees(90))
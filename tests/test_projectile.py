@@ -0,0 +1,125 @@
+import math
+
+import numpy as np
+import pytest
+
+from pyfrc.physics import projectile as projectile_mod
+from pyfrc.physics.projectile import (
+    GRAVITY,
+    Goal,
+    Projectile,
+    ShotMap,
+    flywheel_launch,
+    hits,
+    launch_state,
+    simulate,
+)
+
+vacuum = Projectile(drag_coefficient=0.0)
+
+
+def test_simulate_vacuum():
+    velocities, _ = launch_state([5, 10], math.radians(45), [0, math.pi / 2])
+    result = simulate(vacuum, np.zeros((2, 3)), velocities, dt=0.01, duration=1.0)
+
+    t = result.times[-1]
+    assert result.positions.shape == (101, 2, 3)
+
+    v = 10 / math.sqrt(2)
+    assert result.positions[-1, 1] == pytest.approx(
+        [0, v * t, v * t - 0.5 * GRAVITY * t * t], abs=1e-9
+    )
+
+
+def test_drag_and_lift():
+    velocities, spins = launch_state(10, math.radians(45), 0, backspin=200)
+    positions = np.zeros((1, 3))
+
+    def apex(projectile, spin):
+        result = simulate(projectile, positions, velocities, spin, duration=1.5)
+        return result.positions[:, 0, 2].max()
+
+    drag = Projectile()
+    lift = Projectile(lift_coefficient=0.5)
+
+    assert apex(drag, None) < apex(vacuum, None)
+    assert apex(lift, spins) > apex(drag, None)
+
+
+def test_hits():
+    # in a vacuum, a shot at 45 degrees lands at v**2 / g
+    v = math.sqrt(5 * GRAVITY)
+    velocities, _ = launch_state([v, v, v], math.radians(45), [0, 0, 0.2])
+    positions = [[0, 0, 0], [1, 0, 0], [0, 0, 0]]
+
+    goal = Goal(5, 0, 0, 0.1)
+    assert hits(vacuum, goal, positions, velocities).tolist() == [True, False, False]
+
+
+def test_flywheel_launch():
+    speed, backspin = flywheel_launch(100, 0.05, 0.2)
+    assert speed == pytest.approx(2.5)
+    assert backspin == pytest.approx(25)
+
+
+def _compute(**kwargs):
+    return ShotMap.compute(
+        vacuum,
+        Goal(3, 1, 2, 0.3),
+        field_length=6,
+        field_width=2,
+        shooter_height=0.5,
+        # exact speed for a 60 degree shot in a vacuum
+        speed=lambda d: np.sqrt(
+            2 * GRAVITY * d * d / np.maximum(d * math.sqrt(3) - 1.5, 1e-6)
+        ),
+        pitch=math.radians(60),
+        speed_stddev=0.3,
+        cell_size=0.5,
+        samples=8,
+        **kwargs,
+    )
+
+
+def test_shot_map():
+    shot_map = _compute()
+    assert shot_map.probabilities.shape == (4, 12)
+
+    # too close to reach the goal while falling
+    assert shot_map.probability(0.25, 1.25) > 0.5
+    assert shot_map.probability(2.25, 1.25) == 0
+    assert shot_map.probability(-1, 1) == 0
+    assert shot_map.probability(1, 10) == 0
+
+    x = np.array([0.25, 2.25, -1, 5.9])
+    y = np.array([1.25, 1.25, 1, 0.1])
+    assert shot_map.probabilities_at(x, y).tolist() == [
+        shot_map.probability(a, b) for a, b in zip(x, y)
+    ]
+
+
+def test_shot_map_cache(tmp_path, monkeypatch):
+    fname = tmp_path / "shotmap.npz"
+    shot_map = _compute(cache=fname)
+    assert fname.exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should use the cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(projectile_mod, "hits", fail)
+        cached = _compute(cache=fname)
+    assert np.array_equal(cached.probabilities, shot_map.probabilities)
+
+    # different parameters are recomputed
+    other = _compute(cache=fname, seed=1)
+    assert not np.array_equal(other.probabilities, shot_map.probabilities)
+
+
+def test_shot_map_save_load(tmp_path):
+    shot_map = ShotMap(np.arange(6).reshape(2, 3) / 10, 1.0, 2.0, 0.5)
+    shot_map.save(tmp_path / "map.npz")
+
+    loaded = ShotMap.load(tmp_path / "map.npz")
+    assert np.array_equal(loaded.probabilities, shot_map.probabilities)
+    assert loaded.probability(1.6, 2.6) == pytest.approx(0.4)
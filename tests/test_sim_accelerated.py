@@ -0,0 +1,92 @@
+import sys
+
+import pytest
+
+import wpilib
+
+from pyfrc.sim.accelerated import AcceleratedSim, DsScheduleStep, load_ds_schedule
+
+
+def test_load_ds_schedule(tmp_path):
+    fname = tmp_path / "schedule.toml"
+    fname.write_text("""
+[[step]]
+mode = "autonomous"
+duration = 15
+
+[[step]]
+mode = "teleop"
+duration = 135
+""")
+
+    assert load_ds_schedule(fname) == [
+        DsScheduleStep("autonomous", 15),
+        DsScheduleStep("teleop", 135),
+    ]
+
+
+def test_ds_schedule_invalid():
+    with pytest.raises(ValueError):
+        DsScheduleStep("auto", 15)
+
+    with pytest.raises(ValueError):
+        DsScheduleStep("teleop", 0)
+
+
+class _ModeRobot(wpilib.TimedRobot):
+    instance = None
+
+    def robotInit(self):
+        self.modes = []
+        _ModeRobot.instance = self
+
+    def robotPeriodic(self):
+        if wpilib.DriverStation.isAutonomousEnabled():
+            mode = "autonomous"
+        elif wpilib.DriverStation.isTeleopEnabled():
+            mode = "teleop"
+        else:
+            mode = "disabled"
+
+        if not self.modes or self.modes[-1] != mode:
+            self.modes.append(mode)
+
+
+def test_accelerated_run(tmp_path, monkeypatch):
+    # the robot starts a NetworkTables server, which saves its state in the
+    # current directory
+    monkeypatch.chdir(tmp_path)
+
+    sim = AcceleratedSim(
+        schedule=[
+            DsScheduleStep("disabled", 0.1),
+            DsScheduleStep("autonomous", 0.5),
+            DsScheduleStep("teleop", 0.4),
+        ]
+    )
+    sim.run(_ModeRobot)
+
+    robot = _ModeRobot.instance
+    assert robot.modes == ["disabled", "autonomous", "teleop"]
+    assert sim.sim_time == pytest.approx(1.0)
+    assert len(sim.step_times) == 50
+
+
+class _BrokenRobot(wpilib.TimedRobot):
+    def robotInit(self):
+        raise ValueError("broken")
+
+
+def test_accelerated_robot_init_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sim = AcceleratedSim(duration=1.0)
+
+    # returns instead of waiting forever for the stepper
+    assert not sim.run(_BrokenRobot)
+    assert sim.sim_time == 0
+
+
+def test_accelerated_no_robot_starter(monkeypatch):
+    monkeypatch.setitem(sys.modules, "wpilib._impl.start", None)
+    with pytest.raises(RuntimeError, match="not supported"):
+        AcceleratedSim()
@@ -0,0 +1,129 @@
+import time
+
+import ntcore
+
+from pyfrc.sim.monitor import LoopMonitor, LoopStats
+
+
+def test_loop_stats():
+    stats = LoopStats("robot", 0.020, window=3, bin_width=0.001, nbins=10)
+
+    for tm in (0.0, 0.020, 0.040, 0.070, 0.090, 0.110):
+        stats.start(tm)
+
+    assert stats.count == 5
+    assert stats.overruns == 1
+    assert abs(stats.period_max - 0.030) < 1e-9
+    assert abs(stats.period_min - 0.020) < 1e-9
+
+    # 4 periods with no jitter, one 10ms late (clamped into the last bin)
+    assert stats.histogram[0] == 4
+    assert stats.histogram[9] == 1
+
+    # rolling window only holds the last 3 periods
+    assert sum(stats.rolling_histogram) == 3
+    assert stats.rolling_histogram[9] == 1
+
+    stats.start(0.130)
+    assert stats.rolling_histogram[9] == 0
+    assert stats.rolling_histogram[0] == 3
+
+    assert stats.jitter_percentile(0.5) == 0.001
+    assert stats.summary()["count"] == 6
+
+
+def test_loop_stats_busy_mean():
+    stats = LoopStats("robot", 0.020)
+
+    # busy is recorded for every loop, including the first one, which
+    # doesn't have a period
+    for tm in (0.0, 0.020, 0.040):
+        stats.start(tm)
+        stats.busy(0.003)
+
+    summary = stats.summary()
+    assert summary["count"] == 2
+    assert abs(summary["busy_mean"] - 0.003) < 1e-12
+
+
+class _StubPhysics:
+    last_tm = 0.0
+
+
+class _StubRobot:
+    def __init__(self, physics):
+        self.physics = physics
+        self.periodic_calls = 0
+
+    def getPeriod(self):
+        return 0.020
+
+    def robotPeriodic(self):
+        self.periodic_calls += 1
+
+    def _simulationPeriodic(self):
+        # update_sim runs every other loop
+        if self.periodic_calls % 2 == 0:
+            self.physics.last_tm += 0.040
+
+
+def test_monitor_attach_publish():
+    physics = _StubPhysics()
+    monitor = LoopMonitor(physics, publish_period=0.0)
+
+    robot = monitor.attach(_StubRobot)(physics)
+    assert type(robot).__name__ == "_StubRobot"
+
+    for _ in range(6):
+        robot.robotPeriodic()
+        robot._simulationPeriodic()
+
+    assert robot.periodic_calls == 6
+
+    robot_stats = monitor.robot_stats
+    assert robot_stats.count == 5
+    assert robot_stats.busy_count == 6
+    assert monitor.physics_stats.count == 2
+
+    table = ntcore.NetworkTableInstance.getDefault().getTable("pyfrc/monitor")
+    robot_table = table.getSubTable("robot")
+    assert robot_table.getEntry("overruns").getInteger(-1) == robot_stats.overruns
+    assert robot_table.getEntry("period_max").getDouble(-1) == robot_stats.period_max
+    assert robot_table.getEntry("period_mean").getDouble(-1) == (
+        robot_stats.period_sum / robot_stats.count
+    )
+    assert list(robot_table.getEntry("jitter_histogram").getDoubleArray([])) == [
+        float(n) for n in robot_stats.rolling_histogram
+    ]
+    assert (
+        sum(
+            table.getSubTable("physics").getEntry("jitter_histogram").getDoubleArray([])
+        )
+        == 2
+    )
+
+    summary = monitor.summary()
+    assert set(summary) == {"robot", "physics"}
+
+
+class _SlowTeleopRobot(_StubRobot):
+    def teleopPeriodic(self):
+        time.sleep(0.005)
+
+
+def test_monitor_busy_includes_mode_periodic():
+    physics = _StubPhysics()
+    monitor = LoopMonitor(physics, publish_period=0.0)
+    robot = monitor.attach(_SlowTeleopRobot)(physics)
+
+    # same order as IterativeRobotBase: the mode periodic function is
+    # called before robotPeriodic
+    for _ in range(3):
+        robot.teleopPeriodic()
+        robot.robotPeriodic()
+        robot._simulationPeriodic()
+
+    robot_stats = monitor.robot_stats
+    assert robot_stats.busy_count == 3
+    assert robot_stats.busy_max >= 0.005
+    assert robot_stats.busy_sum >= 0.015
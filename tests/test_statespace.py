@@ -0,0 +1,82 @@
+import math
+
+import numpy as np
+import pytest
+
+from pyfrc.physics import motor_cfgs, statespace, tankmodel
+from pyfrc.physics.units import units
+
+
+def _params():
+    return dict(
+        motor_config=motor_cfgs.MOTOR_CFG_CIM,
+        robot_mass=90 * units.lbs,
+        gearing=10.71,
+        nmotors=2,
+        x_wheelbase=2.0 * units.feet,
+        wheel_diameter=6 * units.inch,
+    )
+
+
+def test_expm():
+    # rotation generator
+    m = np.array([[0.0, -1.0], [1.0, 0.0]]) * 3.0
+    expected = np.array([[math.cos(3), -math.sin(3)], [math.sin(3), math.cos(3)]])
+    assert np.allclose(statespace.expm(m), expected, rtol=1e-12, atol=1e-12)
+
+    # nilpotent (not diagonalizable)
+    m = np.array([[0.0, 2.0], [0.0, 0.0]])
+    assert np.allclose(statespace.expm(m), [[1.0, 2.0], [0.0, 1.0]])
+
+
+def test_statespace_straight_matches_tankmodel():
+    # driving straight, the sides don't interact and should match the
+    # closed form solution of each motor
+    ss = statespace.StateSpaceTankModel.theory(**_params())
+    tm = tankmodel.TankModel.theory(exact=True, **_params())
+
+    for _ in range(100):
+        t1 = ss.calculate(0.8, -0.8, 0.02)
+        t2 = tm.calculate(0.8, -0.8, 0.02)
+
+    assert math.isclose(ss.l_velocity, tm.l_velocity, rel_tol=1e-9)
+    assert math.isclose(ss.r_position, tm.r_position, rel_tol=1e-9)
+    assert math.isclose(t1.X(), t2.X(), rel_tol=1e-9)
+    assert abs(t1.Y()) < 1e-12
+    assert abs(t1.rotation().radians()) < 1e-12
+
+
+def test_statespace_turn_and_cache():
+    ss = statespace.StateSpaceTankModel.theory(**_params())
+
+    # rotate in place to the left
+    total = 0.0
+    for _ in range(50):
+        transform = ss.calculate(-0.5, -0.5, 0.02)
+        total += transform.rotation().radians()
+
+    assert total > 0
+    assert math.isclose(ss.l_velocity, -ss.r_velocity, rel_tol=1e-9)
+    assert math.isclose(total, (ss.r_position - ss.l_position) / 2.0, rel_tol=1e-9)
+
+    info = ss.cache_info()
+    assert info.misses == 1
+    assert info.hits == 49
+
+    # floating point error in the timestep still hits the cache
+    ss.calculate(-0.5, -0.5, 0.06 - 0.04)
+    assert ss.cache_info().misses == 1
+
+    # cache_size can't be mistaken for TankModel's timestep
+    with pytest.raises(TypeError):
+        statespace.StateSpaceTankModel(*([None] * 12))
+
+    # one large step is the same as many small ones
+    a = statespace.StateSpaceTankModel.theory(**_params())
+    b = statespace.StateSpaceTankModel.theory(**_params())
+    a.calculate(1.0, 0.5, 1.0)
+    for _ in range(100):
+        b.calculate(1.0, 0.5, 0.01)
+
+    assert math.isclose(a.l_position, b.l_position, rel_tol=1e-9)
+    assert math.isclose(a.r_velocity, b.r_velocity, rel_tol=1e-9)
@@ -1,4 +1,5 @@
-# import pytest
+import pytest
+import numpy as np
 from pyfrc.physics import tankmodel, motor_cfgs
 from pyfrc.physics.units import units
 import math
@@ -48,3 +49,123 @@ def test_tankdrive_get_distance():
         result.translation().x, result.translation().y, rel_tol=0.01
     ), "For 90deg turn, x and y should be the same"
     return
+
+
+def _make_tank(**kwargs):
+    return tankmodel.TankModel.theory(
+        motor_cfgs.MOTOR_CFG_CIM,
+        robot_mass=90 * units.lbs,
+        gearing=10.71,
+        nmotors=2,
+        x_wheelbase=2.0 * units.feet,
+        wheel_diameter=6 * units.inch,
+        **kwargs,
+    )
+
+
+def test_tankdrive_exact_matches_integration():
+    """Exact discretization should agree with a finely integrated model"""
+    integrated = _make_tank(timestep=0.01 * units.ms)
+    exact = _make_tank(exact=True)
+
+    for _ in range(50):
+        t1 = integrated.calculate(1.0, -0.9, 0.02)
+        t2 = exact.calculate(1.0, -0.9, 0.02)
+
+    assert math.isclose(integrated.l_velocity, exact.l_velocity, rel_tol=1e-4)
+    assert math.isclose(integrated.r_velocity, exact.r_velocity, rel_tol=1e-4)
+    assert math.isclose(integrated.l_position, exact.l_position, rel_tol=1e-4)
+    assert math.isclose(integrated.r_position, exact.r_position, rel_tol=1e-4)
+
+    assert math.isclose(t1.X(), t2.X(), rel_tol=1e-4)
+    assert math.isclose(t1.Y(), t2.Y(), rel_tol=1e-3)
+    assert math.isclose(t1.rotation().radians(), t2.rotation().radians(), rel_tol=1e-3)
+
+
+def test_tankdrive_exact_step_size():
+    """With exact discretization, one large step is the same as many small steps"""
+    one = _make_tank(exact=True)
+    many = _make_tank(exact=True)
+
+    one.calculate(1.0, -0.5, 1.0)
+    for _ in range(100):
+        many.calculate(1.0, -0.5, 0.01)
+
+    assert math.isclose(one.l_velocity, many.l_velocity, rel_tol=1e-9)
+    assert math.isclose(one.r_velocity, many.r_velocity, rel_tol=1e-9)
+    assert math.isclose(one.l_position, many.l_position, rel_tol=1e-9)
+    assert math.isclose(one.r_position, many.r_position, rel_tol=1e-9)
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_tankdrive_batch(exact):
+    params = [
+        dict(
+            motor_config=motor_cfgs.MOTOR_CFG_CIM,
+            robot_mass=mass * units.lbs,
+            gearing=gearing,
+            nmotors=2,
+            timestep=timestep * units.ms,
+            exact=exact,
+        )
+        for mass in (90, 120)
+        for gearing in (8.45, 10.71)
+        for timestep in (5, 3)
+    ]
+
+    models = [tankmodel.TankModel.theory(**p) for p in params]
+    batch = tankmodel.TankModelBatch.theory(params)
+    assert len(batch) == len(models)
+
+    commands = [(1.0, -1.0, 0.02), (0.5, 0.3, 0.0213), (-0.8, 0.1, 0.1)]
+    l_cmds = [0.2, 0.4, 0.6, 0.8, 1.0, -0.2, -0.4, -0.6]
+
+    for l_motor, r_motor, tm_diff in commands:
+        x, y, angle = batch.calculate(l_motor, r_motor, tm_diff)
+        for i, model in enumerate(models):
+            transform = model.calculate(l_motor, r_motor, tm_diff)
+            assert math.isclose(x[i], transform.X() / 0.3048, rel_tol=1e-9)
+            assert math.isclose(
+                y[i], transform.Y() / 0.3048, rel_tol=1e-9, abs_tol=1e-12
+            )
+            assert math.isclose(
+                angle[i], transform.rotation().radians(), rel_tol=1e-9, abs_tol=1e-12
+            )
+
+    # per-instance motor values
+    batch.calculate(np.array(l_cmds), -1.0, 0.02)
+    for model, l_motor in zip(models, l_cmds):
+        model.calculate(l_motor, -1.0, 0.02)
+
+    for i, model in enumerate(models):
+        assert math.isclose(batch.l_velocity[i], model.l_velocity, rel_tol=1e-9)
+        assert math.isclose(batch.r_velocity[i], model.r_velocity, rel_tol=1e-9)
+        assert math.isclose(batch.l_position[i], model.l_position, rel_tol=1e-9)
+        assert math.isclose(batch.r_position[i], model.r_position, rel_tol=1e-9)
+
+
+def test_tankdrive_rollout():
+    from wpimath.geometry import Pose2d
+
+    rolled = _make_tank()
+    stepped = _make_tank()
+
+    l_cmds = [1.0] * 50 + [0.5] * 50 + [-0.3] * 25
+    r_cmds = [-1.0] * 50 + [0.2] * 50 + [0.3] * 25
+
+    result = rolled.rollout(l_cmds, r_cmds, 0.02)
+    assert len(result.x) == len(l_cmds)
+
+    pose = Pose2d()
+    for i, (l_motor, r_motor) in enumerate(zip(l_cmds, r_cmds)):
+        pose = pose + stepped.calculate(l_motor, r_motor, 0.02)
+
+        assert math.isclose(result.x[i], pose.X() / 0.3048, abs_tol=1e-9)
+        assert math.isclose(result.y[i], pose.Y() / 0.3048, abs_tol=1e-9)
+        assert math.isclose(
+            math.remainder(result.heading[i] - pose.rotation().radians(), math.tau),
+            0,
+            abs_tol=1e-9,
+        )
+        assert result.l_position[i] == stepped.l_position
+        assert result.r_velocity[i] == stepped.r_velocity
@@ -1,6 +1,18 @@
+import json
 from math import radians as rad, pi
 
-from pyfrc.physics.visionsim import VisionSimTarget
+import numpy as np
+import pytest
+
+from wpimath.geometry import Pose2d, Pose3d, Rotation3d, Transform2d
+
+from pyfrc.physics.visionsim import (
+    MultiCameraVisionSim,
+    VisionCamera,
+    VisionSim,
+    VisionSimTarget,
+    apriltag_targets,
+)
 
 
 def test_visionsim_target1():
@@ -88,3 +100,246 @@ def test_visionsim_target2():
     assert target.compute(0, 20.22, 17.56, _norm(-506.52)) is not None
 
     assert target.compute(0, 12.48, 13.79, _norm(24.61)) is None
+
+
+def _reference_compute(vision_sim, now, x, y, angle):
+    # the original per-target implementation of VisionSim.compute
+    angle = ((angle + pi) % (pi * 2)) - pi
+    output = []
+    for target in vision_sim.targets:
+        proposed = target.compute(now, x, y, angle)
+        if proposed:
+            output.append(proposed)
+    output.sort(key=lambda i: abs(i[2]))
+    return output
+
+
+def _make_vision_sim(**kwargs):
+    rng = np.random.default_rng(3)
+    targets = [
+        VisionSimTarget(x, y, start, end)
+        for x, y, start, end in zip(
+            rng.uniform(0, 54, 30),
+            rng.uniform(0, 27, 30),
+            rng.uniform(0, 360, 30),
+            rng.uniform(0, 360, 30),
+        )
+    ]
+    return VisionSim(targets, 60, 1, 15, data_lag=0.002, **kwargs)
+
+
+def test_visionsim_vectorized():
+    vision_sim = _make_vision_sim()
+
+    rng = np.random.default_rng(4)
+    visible = 0
+    for x, y, angle in zip(
+        rng.uniform(-5, 60, 500), rng.uniform(-5, 30, 500), rng.uniform(-7, 7, 500)
+    ):
+        expected = _reference_compute(vision_sim, 0, x, y, angle)
+        result = vision_sim._compute_targets(0, x, y, ((angle + pi) % (pi * 2)) - pi)
+        assert len(result) == len(expected)
+        for r, e in zip(result, expected):
+            assert r == pytest.approx(e)
+        visible += len(result)
+
+    assert visible > 50
+
+
+def test_visionsim_max_targets():
+    vision_sim = _make_vision_sim(max_targets=2)
+    full = _make_vision_sim()
+
+    rng = np.random.default_rng(5)
+    for x, y, angle in zip(
+        rng.uniform(0, 54, 300), rng.uniform(0, 27, 300), rng.uniform(-pi, pi, 300)
+    ):
+        result = vision_sim._compute_targets(0, x, y, angle)
+        expected = full._compute_targets(0, x, y, angle)
+        assert [abs(r[2]) for r in result] == [abs(e[2]) for e in expected[:2]]
+
+
+def test_visionsim_targets_changed():
+    target = VisionSimTarget(5, 0, 90, 270)
+    vision_sim = VisionSim([target], 60, 1, 15)
+
+    assert len(vision_sim._compute_targets(0, 0, 0, 0)) == 1
+
+    # moving a target is noticed
+    target.x = 8
+    result = vision_sim._compute_targets(0, 0, 0, 0)
+    assert len(result) == 1
+    assert result[0][3] == pytest.approx(8)
+
+    target.x = 20
+    assert vision_sim._compute_targets(0, 0, 0, 0) == []
+
+    # so are targets appended to the list
+    vision_sim.targets.append(VisionSimTarget(10, 0, 90, 270))
+    result = vision_sim._compute_targets(0, 0, 0, 0)
+    assert len(result) == 1
+    assert result[0][3] == pytest.approx(10)
+
+
+class _OffsetTarget(VisionSimTarget):
+    def compute(self, now, x, y, angle):
+        result = super().compute(now, x, y, angle)
+        if result is not None:
+            return (1, now, result[2] + 1, result[3])
+
+
+def test_visionsim_target_subclass():
+    vision_sim = VisionSim(
+        [VisionSimTarget(5, 1, 90, 270), _OffsetTarget(5, 0, 90, 270)],
+        60,
+        1,
+        15,
+        max_targets=1,
+    )
+
+    result = vision_sim._compute_targets(0, 0, 0, 0)
+    assert len(result) == 1
+    assert result[0][2] == pytest.approx(1)
+    assert result[0][3] == pytest.approx(5)
+
+
+def test_visionsim_compute_latency():
+    vision_sim = VisionSim(
+        [VisionSimTarget(10, 0, 90, 270)], 60, 1, 15, data_frequency=10, data_lag=0.05
+    )
+
+    assert vision_sim.compute(0.0, 0, 0, 0) is None
+    result = vision_sim.compute(0.06, 0, 0, 0)
+    assert result == [(1, 0.0, 0.0, 10.0)]
+    assert vision_sim.get_immediate_distance() == 10.0
+
+    # nothing visible when facing away
+    assert vision_sim.compute(0.2, 0, 0, pi) is None
+    assert vision_sim.compute(0.3, 0, 0, pi) == [(0, 0.2, float("inf"), 0)]
+
+
+_layout_json = {
+    "tags": [
+        {
+            "ID": 1,
+            "pose": {
+                "translation": {"x": 1.0, "y": 4.0, "z": 1.0},
+                "rotation": {"quaternion": {"W": 1.0, "X": 0.0, "Y": 0.0, "Z": 0.0}},
+            },
+        },
+        {
+            "ID": 2,
+            "pose": {
+                "translation": {"x": 15.0, "y": 4.0, "z": 1.0},
+                # facing -x
+                "rotation": {"quaternion": {"W": 0.0, "X": 0.0, "Y": 0.0, "Z": 1.0}},
+            },
+        },
+    ],
+    "field": {"length": 16.0, "width": 8.0},
+}
+
+
+def test_apriltag_targets(tmp_path):
+    fname = tmp_path / "layout.json"
+    fname.write_text(json.dumps(_layout_json))
+
+    targets = apriltag_targets(fname, view_angle=90)
+    assert [t.tag_id for t in targets] == [1, 2]
+    assert targets[1].x == pytest.approx(15)
+    assert targets[1].view_angle_start == pytest.approx(rad(135))
+    assert targets[1].view_angle_end == pytest.approx(rad(225))
+
+    vision_sim = VisionSim.from_apriltag_layout(
+        str(fname), 60, 0.5, 10, view_angle=90, data_lag=0.002
+    )
+
+    # facing tag 2 from in front of it
+    result = vision_sim._compute_targets(0, 10, 4, 0)
+    assert result == [(1, 0, 0.0, 5.0)]
+
+    # tag 1 is behind its own plane from here
+    assert vision_sim._compute_targets(0, 0.5, 4, pi) == []
+    assert vision_sim._compute_targets(0, 5, 4, pi) == [(1, 0, 0.0, 4.0)]
+
+
+def test_apriltag_layout_object():
+    class Tag:
+        def __init__(self, ID, pose):
+            self.ID = ID
+            self.pose = pose
+
+    class Layout:
+        def getTags(self):
+            return [
+                Tag(7, Pose3d(3, 2, 0, Rotation3d(0, 0, pi / 2))),
+            ]
+
+    vision_sim = _make_vision_sim()
+    vision_sim.load_apriltag_layout(Layout())
+
+    (target,) = vision_sim.targets
+    assert target.tag_id == 7
+    assert vision_sim._compute_targets(0, 3, 6, -pi / 2) == [(1, 0, 0.0, 4.0)]
+
+
+def test_multi_camera_vision_sim():
+    targets = [
+        VisionSimTarget(5, 0, 90, 270),  # faces -x
+        VisionSimTarget(-5, 0, -90, 90),  # faces +x
+    ]
+    # times are powers of two so that they are exact
+    cameras = [
+        VisionCamera(
+            "front", Transform2d(0.5, 0, 0), 60, 0.1, 10, fps=8, latency=0.0625
+        ),
+        VisionCamera(
+            "back", Transform2d(-0.5, 0, pi), 60, 0.1, 10, fps=4, latency=0.125
+        ),
+    ]
+    vision = MultiCameraVisionSim(targets, cameras)
+    pose = Pose2d()
+
+    frames = []
+    for i in range(64):
+        now = i / 64
+        for frame in vision.compute(now, pose):
+            assert frame.release_time == now
+            frames.append(frame)
+
+    front = [f for f in frames if f.camera == "front"]
+    back = [f for f in frames if f.camera == "back"]
+
+    assert [f.capture_time for f in front] == [i / 8 for i in range(8)]
+    assert [f.capture_time for f in back] == [0, 0.25, 0.5, 0.75]
+
+    assert front[0].targets == [(1, 0, 0.0, 4.5)]
+    assert back[0].targets == [(1, 0, pytest.approx(0.0), pytest.approx(4.5))]
+
+    # frames are released in time order
+    release = [f.release_time for f in frames]
+    assert release == sorted(release)
+
+    # pending frames are discarded
+    vision.reset()
+    assert vision.compute(1.0, pose) == []
+
+
+def test_multi_camera_latency_jitter():
+    camera = VisionCamera(
+        "cam", Transform2d(), 60, 0.1, 10, fps=50, latency=0.03, latency_stddev=0.01
+    )
+
+    def run(seed):
+        vision = MultiCameraVisionSim([VisionSimTarget(5, 0, 90, 270)], [camera], seed)
+        return [
+            f.release_time - f.capture_time
+            for i in range(200)
+            for f in vision.compute(i * 0.005, Pose2d())
+        ]
+
+    latencies = run(1)
+    assert latencies == run(1)
+    assert min(latencies) >= 0
+    assert len(set(latencies)) > 10
+    assert np.mean(latencies) == pytest.approx(0.03, abs=0.005)